@@ -0,0 +1,18 @@
+# No shebang line. This file is run with: python -m curve_filterer
+"""
+Entry point of the Curve Filterer command-line interface.
+"""
+
+# standard imports
+import os
+import sys
+
+# The tool modules import each other by name, like when ui.py is run from this directory.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# internal imports
+import cli
+
+
+if __name__ == "__main__":
+    sys.exit(cli.main())
@@ -0,0 +1,189 @@
+# No shebang line. This file is meant to be run with: python benchmarks/bench_curve_reader.py
+"""
+Measure the time and peak memory of reading a large JSON curve file with core.read_curve_file()
+and with core.iter_curve_chunks(), and check they read the same values. Each reader runs in its
+own process so the peak resident memory of one doesn't hide the other.
+"""
+
+# standard imports
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import resource
+import tempfile
+import subprocess
+
+# third-party imports
+import numpy
+
+# internal imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import core
+
+# constants
+_SEED = 0
+
+# Memory allowed on top of the chunk and text block for the streaming reader: the block tokens,
+# the parsed block values and allocator slack.
+_STREAMING_RSS_SLACK = 64 * 1024 * 1024
+
+
+def peak_rss():
+    """Return the peak resident memory of the current process in bytes."""
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def write_random_curve(filepath, samples, block_size=100000):
+    """Write a JSON curve file of random values a block at a time.
+
+    The values are never all held in memory at once: on Linux the peak resident memory of this
+    process would otherwise be inherited by the reader processes it starts.
+    """
+
+    random_state = numpy.random.RandomState(_SEED)
+    with open(filepath, "w") as f:
+        f.write("[")
+        for start in range(0, samples, block_size):
+            block = random_state.uniform(0.5, 45.3, min(block_size, samples - start))
+            if start:
+                f.write(", ")
+            f.write(", ".join(map(repr, block.tolist())))
+        f.write("]")
+
+
+def run_reader(reader, filepath, chunk_size):
+    """Run one of the readers in the current process and print its results as JSON."""
+
+    # Digest of the values, to check the readers agree down to the last bit. Its time is not
+    # counted in the reader one.
+    digest = hashlib.blake2b()
+    digest_seconds = 0.0
+
+    start = time.perf_counter()
+
+    if reader == "json":
+        values = core.read_curve_file(filepath)
+        count = len(values)
+        digest_start = time.perf_counter()
+        digest.update(values.tobytes())
+        digest_seconds += time.perf_counter() - digest_start
+    elif reader == "streaming":
+        count = 0
+        for chunk in core.iter_curve_chunks(filepath, chunk_size):
+            count += len(chunk)
+            digest_start = time.perf_counter()
+            digest.update(chunk.tobytes())
+            digest_seconds += time.perf_counter() - digest_start
+    else:
+        count = 0
+
+    seconds = time.perf_counter() - start - digest_seconds
+
+    print(
+        json.dumps(
+            {
+                "count": count,
+                "seconds": seconds,
+                "peak": peak_rss(),
+                "digest": digest.hexdigest(),
+            }
+        )
+    )
+
+
+def measure(reader, filepath, chunk_size):
+    """Run a reader in a child process and return its results."""
+
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--child",
+            reader,
+            "--chunk-size",
+            str(chunk_size),
+            filepath,
+        ]
+    )
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "filepath",
+        nargs="?",
+        help="JSON curve file to read, a random one is generated when not given.",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=5000000,
+        help="Number of samples of the generated curve file, defaults to 5000000",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=65536,
+        help="Number of values per chunk for the streaming reader, defaults to 65536",
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_reader(args.child, args.filepath, args.chunk_size)
+        return 0
+
+    filepath = args.filepath
+    if filepath is None:
+        fd, filepath = tempfile.mkstemp(suffix=".crv")
+        os.close(fd)
+        write_random_curve(filepath, args.samples)
+
+    try:
+        file_size = os.path.getsize(filepath)
+        print(f"{filepath}: {file_size / 1024 ** 2:.1f} MB")
+
+        results = {
+            reader: measure(reader, filepath, args.chunk_size)
+            for reader in ("idle", "json", "streaming")
+        }
+    finally:
+        if args.filepath is None:
+            os.remove(filepath)
+
+    idle_peak = results["idle"]["peak"]
+    print(f"{'reader':>10} {'values':>10} {'time (s)':>10} {'peak RSS above idle (MB)':>26}")
+    for reader in ("json", "streaming"):
+        result = results[reader]
+        print(
+            f"{reader:>10} {result['count']:>10} {result['seconds']:>10.3f} "
+            f"{(result['peak'] - idle_peak) / 1024 ** 2:>26.1f}"
+        )
+
+    if results["json"]["digest"] != results["streaming"]["digest"]:
+        print("read_curve_file() and iter_curve_chunks() read different values")
+        return 1
+
+    # The streaming reader holds a chunk, its copy and a block of text with its tokens at most.
+    streaming_budget = 16 * args.chunk_size + core._READ_BLOCK_SIZE * 4 + _STREAMING_RSS_SLACK
+    streaming_rss = results["streaming"]["peak"] - idle_peak
+    if streaming_rss > streaming_budget:
+        print(
+            f"Streaming reader peak RSS {streaming_rss / 1024 ** 2:.1f} MB is above its "
+            f"{streaming_budget / 1024 ** 2:.1f} MB budget"
+        )
+        return 1
+
+    print(f"Streaming reader within its {streaming_budget / 1024 ** 2:.1f} MB budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+# No shebang line. This file is meant to be run with: python benchmarks/bench_mean_average.py
+"""
+Benchmark of core.mean_average() against the original per-sample loop implementation.
+"""
+
+# standard imports
+import os
+import sys
+import time
+import argparse
+
+# third-party imports
+import numpy
+
+# internal imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import core
+
+# constants
+_SIZES = (1000, 100000, 10000000)
+_STRENGTH = 0.5
+_SEED = 0
+
+
+def mean_average_reference(values, strength):
+    """Original implementation of core.mean_average(), kept as a reference for timing and
+    to validate that the vectorized version returns the same values.
+    """
+
+    frames = (int(strength * 10)) + 1
+    filtered_values = [0] * len(values)
+
+    for itr, value in enumerate(values):
+        side_values = [value]
+
+        for frame in range(1, frames):
+            t = itr - frame
+            if t > 0:
+                side_values.append(values[t])
+
+            t = itr + frame
+            if t < (len(values)):
+                side_values.append(values[t])
+
+        filtered_values[itr] = numpy.mean(side_values)
+
+    return filtered_values
+
+
+def time_call(func, *args):
+    """Return the result of the given function and the time it took to run in seconds."""
+
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--reference-limit",
+        type=int,
+        default=100000,
+        help="Largest size the reference loop is run on. Above it the reference time is "
+        "extrapolated linearly from the largest measured size, defaults to 100000",
+    )
+    parser.add_argument(
+        "--strength", type=float, default=_STRENGTH, help="Smoothing strength"
+    )
+    args = parser.parse_args(argv)
+
+    random_state = numpy.random.RandomState(_SEED)
+    per_sample_time = None
+
+    print(f"{'samples':>10} {'reference (s)':>16} {'vectorized (s)':>16} {'speedup':>10}")
+    for size in _SIZES:
+        values = random_state.uniform(low=1.2, high=65.7, size=size)
+
+        filtered_values, vectorized_time = time_call(
+            core.mean_average, values, args.strength
+        )
+
+        if size <= args.reference_limit:
+            reference_values, reference_time = time_call(
+                mean_average_reference, values, args.strength
+            )
+            if not numpy.array_equal(reference_values, filtered_values):
+                raise RuntimeError(f"Results differ from the reference for {size} samples")
+            per_sample_time = reference_time / size
+            reference_label = f"{reference_time:.4f}"
+        elif per_sample_time is not None:
+            reference_time = per_sample_time * size
+            reference_label = f"~{reference_time:.4f}"
+        else:
+            print(f"{size:>10} {'-':>16} {vectorized_time:>16.4f} {'-':>10}")
+            continue
+
+        print(
+            f"{size:>10} {reference_label:>16} {vectorized_time:>16.4f} "
+            f"{reference_time / vectorized_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# No shebang line. This file is meant to be run with: python benchmarks/bench_smooth_values.py
+"""
+Benchmark of core.smooth_values() for every registered filter across curve lengths, strengths and
+with preserve_edges on and off. The results are saved to a JSON file and can be compared against
+a baseline run to flag regressions.
+"""
+
+# standard imports
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import datetime
+import tracemalloc
+
+# third-party imports
+import numpy
+
+# internal imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import core
+
+# constants
+_SEED = 0
+_SIZES = (25, 1000, 100000, 10000000)
+_STRENGTHS = (0.0, 0.25, 0.5, 0.75, 1.0)
+# Relative to the current directory, so running the benchmark doesn't write into the sources.
+_DEFAULT_OUTPUT = "bench_smooth_values_results.json"
+_DEFAULT_BASELINE = "bench_smooth_values_baseline.json"
+
+# Minimum total time spent timing each case, small curves are run as many times as needed.
+_MIN_CASE_TIME = 0.2
+
+
+def case_key(smooth_type, strength, preserve_edges, size):
+    """Return the key identifying a benchmark case in the results."""
+
+    return f"{smooth_type}|{strength:.2f}|{int(preserve_edges)}|{size}"
+
+
+def time_case(values, smooth_type, strength, preserve_edges, repeat):
+    """Time smooth_values() on the given values.
+
+    :return: Best wall time of a single call in seconds.
+    :rtype: float
+    """
+
+    # Warm-up call, it also fills the kernel caches.
+    core.smooth_values(values, strength, smooth_type, preserve_edges)
+
+    best_time = float("inf")
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            core.smooth_values(values, strength, smooth_type, preserve_edges)
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= _MIN_CASE_TIME / repeat:
+                break
+        best_time = min(best_time, elapsed / calls)
+
+    return best_time
+
+
+def peak_memory_case(values, smooth_type, strength, preserve_edges):
+    """Return the peak memory allocated by a single smooth_values() call in bytes."""
+
+    tracemalloc.start()
+    try:
+        core.smooth_values(values, strength, smooth_type, preserve_edges)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes, strengths, smooth_types, repeat):
+    """Run every benchmark case and return the results."""
+
+    cases = {}
+    for size in sizes:
+        values = numpy.random.RandomState(_SEED).uniform(low=0.5, high=45.3, size=size)
+
+        for smooth_type in smooth_types:
+            for strength in strengths:
+                for preserve_edges in (False, True):
+                    seconds = time_case(
+                        values, smooth_type, strength, preserve_edges, repeat
+                    )
+                    peak_memory = peak_memory_case(
+                        values, smooth_type, strength, preserve_edges
+                    )
+                    key = case_key(smooth_type, strength, preserve_edges, size)
+                    cases[key] = {
+                        "smooth_type": smooth_type,
+                        "strength": strength,
+                        "preserve_edges": preserve_edges,
+                        "size": size,
+                        "seconds": seconds,
+                        "peak_memory": peak_memory,
+                        "samples_per_second": size / seconds,
+                    }
+                    print(
+                        f"{key:<40} {seconds * 1000:>12.3f} ms "
+                        f"{peak_memory / 1024 ** 2:>10.2f} MB "
+                        f"{size / seconds:>16,.0f} samples/s"
+                    )
+
+    return {
+        "date": datetime.datetime.now().isoformat(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "seed": _SEED,
+        "cases": cases,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Compare the results against a baseline run.
+
+    :param threshold: Relative increase of the time or peak memory above which a case is flagged.
+    :type threshold: float
+    :return: Descriptions of the regressions.
+    :rtype: list
+    """
+
+    regressions = []
+    for key, case in results["cases"].items():
+        baseline_case = baseline["cases"].get(key)
+        if baseline_case is None:
+            continue
+
+        for metric in ("seconds", "peak_memory"):
+            if not baseline_case[metric]:
+                continue
+            ratio = case[metric] / baseline_case[metric]
+            if ratio > 1.0 + threshold:
+                regressions.append(
+                    f"{key}: {metric} {baseline_case[metric]:.6g} -> {case[metric]:.6g} "
+                    f"({(ratio - 1.0) * 100:+.1f}%)"
+                )
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=_SIZES,
+        help=f"Curve lengths, defaults to {' '.join(map(str, _SIZES))}",
+    )
+    parser.add_argument(
+        "--strengths",
+        type=float,
+        nargs="+",
+        default=_STRENGTHS,
+        help=f"Smoothing strengths, defaults to {' '.join(map(str, _STRENGTHS))}",
+    )
+    parser.add_argument(
+        "--types",
+        nargs="+",
+        choices=core.filter_names(),
+        default=core.filter_names(),
+        help="Filters to benchmark, defaults to all of them.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of timing rounds per case, the best one is kept, defaults to 3",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=_DEFAULT_OUTPUT,
+        help=f"JSON file to save the results to, defaults to {_DEFAULT_OUTPUT} in the current "
+        "directory",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        default=_DEFAULT_BASELINE,
+        help=f"JSON results to compare against, defaults to {_DEFAULT_BASELINE} in the current "
+        "directory",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Save the results as the new baseline instead of comparing against it.",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown or memory increase flagged as a regression, defaults to 0.1",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.strengths, args.types, max(args.repeat, 1))
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=4)
+    print(f"Results saved to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=4)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline to compare against: {args.baseline}")
+        return 0
+
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print(
+        f"{len(regressions)} regression(s) above {args.threshold * 100:.0f}% "
+        f"against {args.baseline}"
+    )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+# No shebang line. This file is meant to be run with: python benchmarks/bench_startup.py
+"""
+Measure the time it takes to import the core and ui modules in a fresh interpreter and check it
+against a budget. Also check that importing them doesn't pull scipy in, the filters don't need it,
+and compare loading the icons and splash-screen image from their files and from the icons_rc
+resource module, see build_resources.py.
+"""
+
+# standard imports
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+# third-party imports
+
+# internal imports
+
+# constants
+_TOOL_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import time allowed for each module in seconds, numpy alone takes about 0.1s.
+_IMPORT_BUDGETS = {"core": 0.3, "ui": 0.6}
+
+# Run in the child interpreter, prints the import time and the modules it pulled in as JSON.
+_CHILD_SCRIPT = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "scipy": "scipy" in sys.modules}}))
+"""
+
+# Run in the child interpreter, prints the time to load the images as JSON. Importing the
+# resource module is part of loading them from the resources.
+_ICONS_CHILD_SCRIPT = """
+import os, sys, time, json
+from PySide2 import QtWidgets, QtGui
+app = QtWidgets.QApplication(sys.argv[:1])
+start = time.perf_counter()
+if {from_resources}:
+    import icons_rc
+    paths = [":/icons/" + name for name in {names}]
+else:
+    paths = [os.path.join("icons", name) for name in {names}]
+sizes = [QtGui.QPixmap(path).width() for path in paths]
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "loaded": all(sizes)}}))
+"""
+_ICON_NAMES = ["open.png", "save.png", "close.png", "splash.png"]
+
+
+def measure_import(module, repeat):
+    """Import a module in fresh interpreters and return the best time and whether scipy got
+    imported along.
+
+    :rtype: tuple(float, bool)
+    """
+
+    environment = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+
+    best_seconds = float("inf")
+    scipy_imported = False
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _CHILD_SCRIPT.format(module=module)],
+            cwd=_TOOL_PATH,
+            env=environment,
+            stderr=subprocess.DEVNULL,
+        )
+        result = json.loads(output.decode().strip().splitlines()[-1])
+        best_seconds = min(best_seconds, result["seconds"])
+        scipy_imported = scipy_imported or result["scipy"]
+
+    return best_seconds, scipy_imported
+
+
+def measure_icons(from_resources, repeat):
+    """Load the icons and splash-screen image in fresh interpreters and return the best time.
+
+    :param from_resources: If True, load them from the icons_rc resource module, otherwise from
+                           their files.
+    :type from_resources: bool
+    :raises RuntimeError: Some images couldn't be loaded
+    :rtype: float
+    """
+
+    environment = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    script = _ICONS_CHILD_SCRIPT.format(
+        from_resources=from_resources, names=_ICON_NAMES
+    )
+
+    best_seconds = float("inf")
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", script],
+            cwd=_TOOL_PATH,
+            env=environment,
+            stderr=subprocess.DEVNULL,
+        )
+        result = json.loads(output.decode().strip().splitlines()[-1])
+        if not result["loaded"]:
+            raise RuntimeError(
+                f"Failed to load the images from the {'resources' if from_resources else 'files'}"
+            )
+        best_seconds = min(best_seconds, result["seconds"])
+
+    return best_seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of fresh interpreters per module, the best time is kept, defaults to 5",
+    )
+    parser.add_argument(
+        "--core-budget",
+        type=float,
+        default=_IMPORT_BUDGETS["core"],
+        help=f"Import time allowed for core in seconds, defaults to {_IMPORT_BUDGETS['core']}",
+    )
+    parser.add_argument(
+        "--ui-budget",
+        type=float,
+        default=_IMPORT_BUDGETS["ui"],
+        help=f"Import time allowed for ui in seconds, defaults to {_IMPORT_BUDGETS['ui']}",
+    )
+    args = parser.parse_args(argv)
+
+    budgets = {"core": args.core_budget, "ui": args.ui_budget}
+    failures = 0
+
+    print(f"{'module':>8} {'import (ms)':>12} {'budget (ms)':>12} {'scipy':>6}")
+    for module, budget in budgets.items():
+        seconds, scipy_imported = measure_import(module, max(args.repeat, 1))
+        print(
+            f"{module:>8} {seconds * 1000:>12.1f} {budget * 1000:>12.1f} "
+            f"{'yes' if scipy_imported else 'no':>6}"
+        )
+
+        if seconds > budget:
+            print(f"Importing {module} is over its budget")
+            failures += 1
+        if scipy_imported:
+            print(f"Importing {module} imports scipy, which none of the filters need")
+            failures += 1
+
+    print(f"{'images':>10} {'load (ms)':>12}")
+    sources = [("files", False)]
+    if os.path.exists(os.path.join(_TOOL_PATH, "icons_rc.py")):
+        sources.append(("resources", True))
+    else:
+        print("No icons_rc.py resource module, run build_resources.py to compare with it")
+    for name, from_resources in sources:
+        seconds = measure_icons(from_resources, max(args.repeat, 1))
+        print(f"{name:>10} {seconds * 1000:>12.2f}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
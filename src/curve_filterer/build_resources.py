@@ -0,0 +1,97 @@
+# No shebang line. This file is meant to be run with: python build_resources.py
+"""
+Compile the icons and the splash-screen image listed in icons/icons.qrc into the icons_rc.py Qt
+resource module. Run it again after changing any of the images, ui.py loads them from the
+resource module when it exists and from the icons directory otherwise.
+"""
+
+# standard imports
+import os
+import sys
+import shutil
+import logging
+import argparse
+import subprocess
+
+# third-party imports
+
+# internal imports
+
+# logger
+_log = logging.getLogger(__name__)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log.addHandler(_log_handler)
+_log.setLevel("INFO")
+
+# constants
+_TOOL_PATH = os.path.dirname(os.path.abspath(__file__))
+_QRC_PATH = os.path.join(_TOOL_PATH, "icons", "icons.qrc")
+_RESOURCE_MODULE_PATH = os.path.join(_TOOL_PATH, "icons_rc.py")
+
+
+def resource_compiler_command(qrc_path, out_path):
+    """Return the command compiling a .qrc file into a Python module, using pyside2-rcc or the Qt
+    rcc tool, whichever is found first.
+
+    :raises RuntimeError: No resource compiler was found
+    :rtype: list of str
+    """
+
+    pyside_rcc = shutil.which("pyside2-rcc")
+    if pyside_rcc:
+        return [pyside_rcc, qrc_path, "-o", out_path]
+
+    # Qt 5.14 and later can generate Python code directly.
+    rcc = shutil.which("rcc")
+    if rcc:
+        return [rcc, "-g", "python", qrc_path, "-o", out_path]
+
+    raise RuntimeError("Neither pyside2-rcc nor rcc was found in the PATH")
+
+
+def build_resources(qrc_path=_QRC_PATH, out_path=_RESOURCE_MODULE_PATH):
+    """Compile the resource file into a Python module.
+
+    :param qrc_path: Path to the .qrc file listing the resources, defaults to icons/icons.qrc
+    :type qrc_path: str, optional
+    :param out_path: Path to the module to generate, defaults to icons_rc.py
+    :type out_path: str, optional
+    :raises RuntimeError: No resource compiler was found
+    :raises subprocess.CalledProcessError: The resource compiler failed
+    """
+
+    command = resource_compiler_command(qrc_path, out_path)
+    _log.info(f"Running: {' '.join(command)}")
+    subprocess.run(command, check=True)
+    _log.info(f"Generated {out_path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--qrc",
+        default=_QRC_PATH,
+        help="Resource file to compile, defaults to icons/icons.qrc",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=_RESOURCE_MODULE_PATH,
+        help="Python module to generate, defaults to icons_rc.py",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        build_resources(args.qrc, args.output)
+    except (RuntimeError, subprocess.CalledProcessError) as e:
+        _log.error(f"Failed to build the resources: {e}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
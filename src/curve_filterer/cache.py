@@ -0,0 +1,330 @@
+# No shebang line. This file is meant to be imported
+"""
+Cache of smoothed curves, so going back to parameters already used doesn't smooth the curve again.
+
+The results are keyed on a hash of the raw values and on the parameters the filter actually
+uses, so strengths that end up with the same filter window share the same entry.
+"""
+
+# standard imports
+import hashlib
+import logging
+import threading
+import collections
+
+# third-party imports
+import numpy
+
+# internal imports
+import core
+
+# logger
+_log = logging.getLogger(__name__)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log.addHandler(_log_handler)
+_log.setLevel("INFO")
+
+# constants
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_HASH_DIGEST_SIZE = 16
+
+SmoothCacheInfo = collections.namedtuple(
+    "SmoothCacheInfo", ("hits", "misses", "evictions", "entries", "nbytes", "max_bytes")
+)
+
+
+def hash_values(values):
+    """Return a hash of the content of the given values, to use as a cache key.
+
+    :param values: Curve values.
+    :type values: list or numpy.ndarray
+    :rtype: str
+    """
+
+    values_array = numpy.ascontiguousarray(values, dtype=float)
+    digest = hashlib.blake2b(digest_size=_HASH_DIGEST_SIZE)
+    digest.update(str(values_array.shape).encode())
+    digest.update(memoryview(values_array).cast("B"))
+    return digest.hexdigest()
+
+
+class SmoothCache(object):
+    """
+    Least recently used cache of core.smooth_values() results, bounded by the memory they use.
+    It can be shared between threads.
+
+    :example:
+        >>> # Smooth a curve at strengths sharing the same filter window
+        ... import cache
+        ...
+        ... smooth_cache = cache.SmoothCache()
+        ... values_hash = cache.hash_values(values)
+        ... filtered_values = smooth_cache.smooth(values, 0.31, "Gaussian", values_hash=values_hash)
+        ... filtered_values = smooth_cache.smooth(values, 0.35, "Gaussian", values_hash=values_hash)
+        ... smooth_cache.info()
+        SmoothCacheInfo(hits=1, misses=1, evictions=0, entries=1, nbytes=..., max_bytes=268435456)
+
+    :param max_bytes: Memory the cached results can use, the least recently used ones are evicted
+                      past it, defaults to 256 MB
+    :type max_bytes: int, optional
+    """
+
+    def __init__(self, max_bytes=_DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+
+        self._entries = collections.OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def key(
+        self,
+        values_hash,
+        values_count,
+        strength=0.2,
+        smooth_type="Savitzky-Golay",
+        preserve_edges=False,
+        method="auto",
+    ):
+        """Return the cache key of a smoothing operation.
+
+        :param values_hash: Hash of the values to smooth, see hash_values().
+        :type values_hash: str
+        :param values_count: Number of values to smooth.
+        :type values_count: int
+        :raises ValueError: The algorithm is not registered
+        :rtype: tuple
+        """
+
+        parameters = core.get_filter(smooth_type).parameters(strength, values_count)
+        return (
+            values_hash,
+            smooth_type,
+            tuple(sorted(parameters.items())),
+            bool(preserve_edges),
+            method,
+        )
+
+    def smooth(
+        self,
+        values,
+        strength=0.2,
+        smooth_type="Savitzky-Golay",
+        preserve_edges=False,
+        method="auto",
+        values_hash=None,
+    ):
+        """Return the smoothed values from the cache, smoothing them with core.smooth_values()
+        if they aren't in it yet.
+
+        :param values: Values to smooth.
+        :type values: list or numpy.ndarray
+        :param values_hash: Hash of the values, see hash_values(). Pass it when smoothing the same
+                            values many times to avoid hashing them on every call, defaults to None
+        :type values_hash: str, optional
+        :raises ValueError: The algorithm is not registered
+        :return: Smoothed values. They are shared with the cache and read-only.
+        :rtype: numpy.ndarray
+        """
+
+        values_array = numpy.asarray(values, dtype=float)
+        if values_hash is None:
+            values_hash = hash_values(values_array)
+
+        key = self.key(
+            values_hash,
+            values_array.shape[-1],
+            strength,
+            smooth_type,
+            preserve_edges,
+            method,
+        )
+        filtered_values = self.get(key)
+        if filtered_values is not None:
+            return filtered_values
+
+        filtered_values = core.smooth_values(
+            values_array, strength, smooth_type, preserve_edges, method
+        )
+        self.put(key, filtered_values)
+        return filtered_values
+
+    def precompute(
+        self,
+        values,
+        strengths,
+        smooth_type="Savitzky-Golay",
+        preserve_edges=False,
+        method="auto",
+        values_hash=None,
+        progress=None,
+        is_cancelled=None,
+    ):
+        """Smooth the values at each of the given strengths and cache the results, so smooth()
+        only has to look them up afterwards. Strengths giving the same filter parameters are only
+        smoothed once, in the order of their first appearance.
+
+        It stops before the results of the sweep would take more than the memory budget, so it
+        never evicts the results it cached itself, the first strengths being the ones kept.
+
+        :param values: Values to smooth.
+        :type values: list or numpy.ndarray
+        :param strengths: Strengths to smooth the values at.
+        :type strengths: list of float
+        :param values_hash: Hash of the values, see hash_values(), defaults to None
+        :type values_hash: str, optional
+        :param progress: Function called with the number of results done and the total number of
+                         distinct results after each of them, defaults to None
+        :type progress: callable, optional
+        :param is_cancelled: Function returning True to stop before the next result, defaults to None
+        :type is_cancelled: callable, optional
+        :raises ValueError: The algorithm is not registered
+        :return: True if every result is cached, False if it was cancelled or the memory budget
+                 can't hold them all.
+        :rtype: bool
+        """
+
+        values_array = numpy.asarray(values, dtype=float)
+        if values_hash is None:
+            values_hash = hash_values(values_array)
+
+        sweep = collections.OrderedDict()
+        for strength in strengths:
+            key = self.key(
+                values_hash,
+                values_array.shape[-1],
+                strength,
+                smooth_type,
+                preserve_edges,
+                method,
+            )
+            sweep.setdefault(key, strength)
+
+        sweep_nbytes = 0
+        for done, (key, strength) in enumerate(sweep.items(), 1):
+            if is_cancelled is not None and is_cancelled():
+                return False
+
+            # Results already cached count as used, so the ones we add evict the others first.
+            with self._lock:
+                filtered_values = self._entries.get(key)
+                if filtered_values is not None:
+                    self._entries.move_to_end(key)
+
+            if filtered_values is not None:
+                sweep_nbytes += filtered_values.nbytes
+            else:
+                if sweep_nbytes + values_array.nbytes > self.max_bytes:
+                    _log.info(
+                        f"Stopped precomputing after {done - 1} of {len(sweep)} results, "
+                        f"the cache can't hold more than {self.max_bytes} bytes"
+                    )
+                    return False
+
+                filtered_values = core.smooth_values(
+                    values_array, strength, smooth_type, preserve_edges, method
+                )
+                # Don't fill the cache with results nobody wants anymore.
+                if is_cancelled is not None and is_cancelled():
+                    return False
+                self.put(key, filtered_values)
+                sweep_nbytes += filtered_values.nbytes
+
+            if progress is not None:
+                progress(done, len(sweep))
+
+        return True
+
+    def get(self, key):
+        """Return the cached result for the given key, None if there is none.
+
+        :param key: Cache key, see key().
+        :type key: tuple
+        :rtype: numpy.ndarray
+        """
+
+        with self._lock:
+            filtered_values = self._entries.get(key)
+            if filtered_values is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return filtered_values
+
+    def put(self, key, filtered_values):
+        """Add a result to the cache and evict the least recently used ones past the memory budget.
+        Results larger than the whole budget are not cached.
+
+        :param key: Cache key, see key().
+        :type key: tuple
+        :param filtered_values: Smoothed values, they are made read-only.
+        :type filtered_values: numpy.ndarray
+        """
+
+        if filtered_values.nbytes > self.max_bytes:
+            return
+
+        filtered_values.flags.writeable = False
+
+        with self._lock:
+            previous_values = self._entries.pop(key, None)
+            if previous_values is not None:
+                self._nbytes -= previous_values.nbytes
+
+            self._entries[key] = filtered_values
+            self._nbytes += filtered_values.nbytes
+
+            while self._nbytes > self.max_bytes:
+                _, evicted_values = self._entries.popitem(last=False)
+                self._nbytes -= evicted_values.nbytes
+                self._evictions += 1
+
+    def invalidate(self, values_hash=None):
+        """Remove the cached results of a curve, or all of them.
+
+        :param values_hash: Hash of the curve values, see hash_values(). Every result is removed
+                            when not given, defaults to None
+        :type values_hash: str, optional
+        :return: Number of results removed.
+        :rtype: int
+        """
+
+        with self._lock:
+            if values_hash is None:
+                keys = list(self._entries)
+            else:
+                keys = [key for key in self._entries if key[0] == values_hash]
+
+            for key in keys:
+                self._nbytes -= self._entries.pop(key).nbytes
+
+        return len(keys)
+
+    def info(self):
+        """Return the cache statistics.
+
+        :rtype: SmoothCacheInfo
+        """
+
+        with self._lock:
+            return SmoothCacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._nbytes,
+                self.max_bytes,
+            )
@@ -0,0 +1,330 @@
+# No shebang line. This file is meant to be imported, run it with: python -m curve_filterer
+"""
+Command-line interface to smooth curve files without the Qt interface.
+"""
+
+# standard imports
+import os
+import glob
+import time
+import logging
+import argparse
+import concurrent.futures
+import concurrent.futures.process
+
+# third-party imports
+
+# internal imports
+import core
+
+# logger
+_log = logging.getLogger(__name__)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log.addHandler(_log_handler)
+_log.setLevel("INFO")
+
+# constants
+_CURVE_EXTENSION = ".crv"
+
+
+def collect_curve_files(paths, suffix=None):
+    """Expand the given files, directories and glob patterns into a list of curve files.
+
+    Directories are searched (non-recursively) for files with the .crv extension. Glob
+    patterns are expanded, "**" matches nested directories.
+
+    :param paths: Files, directories or glob patterns.
+    :type paths: list of str
+    :param suffix: Suffix of the smoothed curve files, the files of directories and glob patterns
+                   whose name already ends with it are skipped so smoothing a directory again
+                   doesn't smooth its previous results, defaults to None
+    :type suffix: str, optional
+    :return: Sorted list of unique curve file paths and list of paths that matched nothing.
+    :rtype: tuple(list, list)
+    """
+
+    curve_files = set()
+    unmatched_paths = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            matches = glob.glob(os.path.join(path, "*" + _CURVE_EXTENSION))
+        elif os.path.isfile(path):
+            matches = [path]
+        else:
+            matches = [
+                match for match in glob.glob(path, recursive=True) if os.path.isfile(match)
+            ]
+
+        if suffix and not os.path.isfile(path):
+            matches = [
+                match
+                for match in matches
+                if not os.path.splitext(os.path.basename(match))[0].endswith(suffix)
+            ]
+
+        if not matches:
+            unmatched_paths.append(path)
+        curve_files.update(os.path.normpath(match) for match in matches)
+
+    return sorted(curve_files), unmatched_paths
+
+
+def output_path(filepath, output_dir=None, suffix="_smoothed"):
+    """Build the path to save the smoothed version of a curve file to.
+
+    :param filepath: Path to the source curve file.
+    :type filepath: str
+    :param output_dir: Directory to save to, defaults to the source file directory.
+    :type output_dir: str, optional
+    :param suffix: Suffix added to the file name before its extension, defaults to "_smoothed"
+    :type suffix: str, optional
+    :return: Path to the smoothed curve file.
+    :rtype: str
+    """
+
+    directory, filename = os.path.split(filepath)
+    name, extension = os.path.splitext(filename)
+    return os.path.join(output_dir or directory, name + suffix + extension)
+
+
+def smooth_file(
+    filepath,
+    out_filepath,
+    strength,
+    smooth_type,
+    preserve_edges,
+    file_format=None,
+    chunk_size=None,
+):
+    """Read, smooth and save a single curve file. Meant to run in a worker process so it never
+    raises, errors are returned instead.
+
+    When a chunk size is given the curve is streamed through core.smooth_curve_file_chunked()
+    so its memory usage doesn't depend on the size of the file. The smoothed curve is saved in the
+    format of the source file unless a file format is given.
+
+    :return: The source path, the output path, the number of samples, the time it took in seconds
+             and the error message if it failed (None otherwise).
+    :rtype: tuple(str, str, int, float, str)
+    """
+
+    start = time.perf_counter()
+    samples = 0
+    try:
+        if chunk_size:
+            samples = core.smooth_curve_file_chunked(
+                filepath,
+                out_filepath,
+                strength=strength,
+                smooth_type=smooth_type,
+                preserve_edges=preserve_edges,
+                chunk_size=chunk_size,
+                file_format=file_format,
+            )
+            return filepath, out_filepath, samples, time.perf_counter() - start, None
+
+        if file_format is None:
+            file_format = core.curve_file_format(filepath)
+        values = core.read_curve_file(filepath)
+        samples = len(values)
+        filtered_values = core.smooth_values(
+            values,
+            strength=strength,
+            smooth_type=smooth_type,
+            preserve_edges=preserve_edges,
+        )
+        core.save_curve_file(out_filepath, filtered_values, file_format=file_format)
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return filepath, out_filepath, samples, time.perf_counter() - start, error
+
+
+def smooth_files(
+    filepaths,
+    strength=0.2,
+    smooth_type="Savitzky-Golay",
+    preserve_edges=False,
+    output_dir=None,
+    suffix="_smoothed",
+    workers=None,
+    file_format=None,
+    chunk_size=None,
+):
+    """Smooth the given curve files in parallel across a pool of processes.
+
+    :param filepaths: Curve files to smooth.
+    :type filepaths: list of str
+    :param workers: Number of worker processes, defaults to the number of CPUs.
+    :type workers: int, optional
+    :param file_format: Format of the smoothed curve files ("json" or "binary"), defaults to the
+                        format of each source file.
+    :type file_format: str, optional
+    :param chunk_size: Smooth the curves a chunk of this many values at a time, defaults to reading whole curves.
+    :type chunk_size: int, optional
+    :return: Results of smooth_file() for each file, in completion order.
+    :rtype: generator
+    """
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                smooth_file,
+                filepath,
+                output_path(filepath, output_dir, suffix),
+                strength,
+                smooth_type,
+                preserve_edges,
+                file_format,
+                chunk_size,
+            ): filepath
+            for filepath in filepaths
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield future.result()
+            except concurrent.futures.process.BrokenProcessPool as e:
+                # A worker died, e.g. killed when running out of memory, the files it and the
+                # pending workers had are reported as failures.
+                filepath = futures[future]
+                error = f"{type(e).__name__}: {e}"
+                yield filepath, output_path(filepath, output_dir, suffix), 0, 0.0, error
+
+
+def parse_args(argv=None):
+    """Parse the command-line arguments."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m curve_filterer",
+        description="Smooth curve files in parallel without opening the interface.",
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="Curve files, directories or glob patterns."
+    )
+    parser.add_argument(
+        "-s",
+        "--strength",
+        type=float,
+        default=0.2,
+        help="Intensity of the smoothing between 0.0 and 1.0, defaults to 0.2",
+    )
+    parser.add_argument(
+        "-t",
+        "--type",
+        dest="smooth_type",
+        choices=core.filter_names(),
+        default="Savitzky-Golay",
+        help="Smoothing algorithm, defaults to Savitzky-Golay",
+    )
+    parser.add_argument(
+        "-e",
+        "--preserve-edges",
+        action="store_true",
+        help="Keep the first and last values of each curve as is.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        help="Directory to save the smoothed curves to, defaults to next to each source file.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="file_format",
+        choices=("json", "binary"),
+        default=None,
+        help="Format of the smoothed curve files, defaults to the format of each source file.",
+    )
+    parser.add_argument(
+        "--suffix",
+        default="_smoothed",
+        help="Suffix added to the smoothed file names, defaults to _smoothed",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Smooth the curves this many values at a time to keep the memory usage constant "
+        "on very large files, defaults to reading whole curves.",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes, defaults to the number of CPUs.",
+    )
+
+    args = parser.parse_args(argv)
+    if not args.suffix and not args.output_dir:
+        parser.error("An empty --suffix requires an --output-dir")
+    if args.chunk_size is not None and args.chunk_size < 1:
+        parser.error("--chunk-size needs to be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers needs to be at least 1")
+
+    return args
+
+
+def main(argv=None):
+    """Smooth the curve files given on the command-line and print a report.
+
+    :return: Exit code, 0 if every file was smoothed, 1 otherwise.
+    :rtype: int
+    """
+
+    args = parse_args(argv)
+
+    filepaths, unmatched_paths = collect_curve_files(args.paths, args.suffix)
+    for path in unmatched_paths:
+        _log.warning(f"No curve file found for: {path}")
+
+    if not filepaths:
+        _log.error("Nothing to smooth.")
+        return 1
+
+    start = time.perf_counter()
+    total_samples = 0
+    failures = []
+
+    for filepath, out_filepath, samples, seconds, error in smooth_files(
+        filepaths,
+        strength=args.strength,
+        smooth_type=args.smooth_type,
+        preserve_edges=args.preserve_edges,
+        output_dir=args.output_dir,
+        suffix=args.suffix,
+        workers=args.workers,
+        file_format=args.file_format,
+        chunk_size=args.chunk_size,
+    ):
+        if error:
+            failures.append(filepath)
+            _log.error(f"Failed to smooth {filepath}: {error}")
+            continue
+
+        total_samples += samples
+        throughput = samples / seconds if seconds else 0.0
+        print(
+            f"{filepath} -> {out_filepath}: {samples} samples in {seconds:.3f}s "
+            f"({throughput:,.0f} samples/s)"
+        )
+
+    elapsed = time.perf_counter() - start
+    throughput = total_samples / elapsed if elapsed else 0.0
+    print(
+        f"Smoothed {len(filepaths) - len(failures)}/{len(filepaths)} file(s), "
+        f"{total_samples} samples in {elapsed:.3f}s ({throughput:,.0f} samples/s), "
+        f"{len(failures)} failure(s)"
+    )
+
+    return 1 if failures else 0
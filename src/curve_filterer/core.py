@@ -4,15 +4,18 @@ Core functions for the Curve Filterer tool.
 """
 
 # standard imports
-import math
+import itertools
+import functools
+import contextlib
 import logging
 import json
 import os
+import struct
+import time
+import uuid
 
 # third-party imports
 import numpy
-import scipy
-import scipy.ndimage
 
 # internal imports
 
@@ -28,15 +31,145 @@ _log.setLevel("INFO")
 
 # constants
 
+# Binary curve file format. See read_curve_header() for the layout.
+_BINARY_MAGIC = b"CRVB"
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sBcHQI")
+_BINARY_ALIGNMENT = 16
+_BINARY_DTYPE_CODES = {"float64": b"d", "float32": b"f"}
+_BINARY_DTYPES = {b"d": "<f8", b"f": "<f4"}
+
+# Number of characters read at a time when streaming JSON curve files.
+_READ_BLOCK_SIZE = 1 << 20
+
+# Extra samples added to the reach of the filters to cover their edge handling when a curve is
+# smoothed a chunk at a time. See filter_halo().
+_HALO_EDGE_SAMPLES = 4
+
+# Smoothing algorithms by name, in the order they are presented to the user. See register_filter().
+_FILTERS = {}
+
+# Maximum number of kernels kept in memory for each filter registered with a kernel.
+_KERNEL_CACHE_SIZE = 64
+
+# Largest difference between the FFT and direct convolutions, relative to the largest absolute
+# value times the sum of the absolute kernel coefficients. See convolve().
+FFT_TOLERANCE = 1e-9
+
+# Kernels smaller than this always use the direct convolution with the "auto" method. This
+# covers every kernel smooth_values() uses at strengths up to 1.0, so chunked smoothing stays
+# bit-identical to it.
+_FFT_MIN_KERNEL_SIZE = 64
+# Convolution methods accepted by convolve() and everything built on it.
+_CONVOLUTION_METHODS = ("direct", "fft", "auto")
+_FFT_MIN_BLOCK_SIZE = 1024
+
+# Kernel size from which the FFT convolution is faster, measured on first use on random data of
+# the given size for the given kernel sizes. See convolution_crossover().
+_CONVOLUTION_CROSSOVER = None
+_CROSSOVER_SIGNAL_SIZE = 1 << 16
+_CROSSOVER_KERNEL_SIZES = (64, 96, 128, 192, 256, 384, 512, 768, 1024)
+
+# Maximum number of Savitzky-Golay coefficient sets kept in memory. smooth_values() only ever
+# uses about ten of them.
+_SAVITZKY_GOLAY_CACHE_SIZE = 64
+
+# Offset of the first sample of a moving average window relative to the sample being filtered,
+# based on the window size, for each alignment supported by moving_average().
+_MOVING_AVERAGE_OFFSETS = {
+    "trailing": lambda win_size: 1 - win_size,
+    "centered": lambda win_size: -((win_size - 1) // 2),
+    "leading": lambda win_size: 0,
+    "legacy": lambda win_size: -1,
+}
+
 
 def read_curve_file(filepath):
-    """Read a JSON file containing curve Y values.
+    """Read a curve file containing curve Y values. Both the JSON and the binary formats are
+    supported, the format is detected from the file content.
+
+    :param filepath: Path to the curve file.
+    :type filepath: str
+    :raises IOError: The following path doesn't exists or doesn't have read permission
+    :raises ValueError: The binary file header is invalid or the JSON file is not a flat array of numbers
+    :return: Float64 array for JSON files, read-only memory-mapped array for binary files.
+    :rtype: numpy.ndarray or numpy.memmap
+    """
+
+    if not os.path.exists(filepath) or not os.access(filepath, os.R_OK):
+        raise IOError(
+            f"The following path doesn't exists or doesn't have read permission: {filepath}"
+        )
+
+    if curve_file_format(filepath) == "binary":
+        header = read_curve_header(filepath)
+        if header["length"] == 0:
+            return numpy.empty(0, dtype=header["dtype"])
+        return numpy.memmap(
+            filepath,
+            dtype=header["dtype"],
+            mode="r",
+            offset=header["offset"],
+            shape=(header["length"],),
+        )
+
+    with open(filepath, "rb") as f:
+        data = f.read()
+
+    try:
+        return _parse_json_values(data)
+    except ValueError as e:
+        raise ValueError(f"Invalid curve file {filepath}: {e}")
+
 
-    :param filepath: Path to the JSON file.
+def _parse_json_values(text):
+    """Parse a flat JSON array of numbers into a float64 array. Both read_curve_file() and
+    iter_curve_chunks() parse their values with it so they accept the same files and read the
+    same values. Integers are parsed as floats, so "-0" is read as -0.0 like "-0.0".
+
+    :param text: JSON array.
+    :type text: str or bytes
+    :raises ValueError: The text is not a flat JSON array of numbers
+    :rtype: numpy.ndarray
+    """
+
+    values = json.loads(text, parse_int=float)
+    if not isinstance(values, list) or not all(type(value) is float for value in values):
+        raise ValueError("Not a flat JSON array of numbers")
+    return numpy.array(values, dtype=float)
+
+
+def iter_curve_chunks(filepath, chunk_size=65536, block_size=None, progress=None):
+    """Read a curve file chunk by chunk without loading the whole file in memory.
+
+    JSON files are parsed incrementally, a block of text at a time, the same way as
+    read_curve_file() does. Binary files are read through a memory map. Either way the memory used is bounded
+    by roughly 8 * chunk_size bytes for the chunk, plus the text block and its tokens for JSON
+    files, whatever the size of the file.
+
+    :example:
+        >>> # Compute the average of a very large curve file
+        ... import core
+        ...
+        ... total = 0.0
+        ... count = 0
+        ... for chunk in core.iter_curve_chunks("huge_curve.crv", 1000000):
+        ...     total += chunk.sum()
+        ...     count += len(chunk)
+
+    :param filepath: Path to the curve file.
     :type filepath: str
+    :param chunk_size: Number of values in each chunk, only the last one can be smaller, defaults to 65536
+    :type chunk_size: int, optional
+    :param block_size: Number of characters read from JSON files at a time, defaults to 1MB
+    :type block_size: int, optional
+    :param progress: Function called with the number of bytes read so far and the size of the file,
+                     after each block of JSON files and each chunk of binary files, defaults to None
+    :type progress: callable, optional
     :raises IOError: The following path doesn't exists or doesn't have read permission
-    :return: List of floats
-    :rtype:list
+    :raises ValueError: The file is not a flat JSON array of numbers
+    :return: Generator of float64 arrays.
+    :rtype: generator
     """
 
     if not os.path.exists(filepath) or not os.access(filepath, os.R_OK):
@@ -44,73 +177,666 @@ def read_curve_file(filepath):
             f"The following path doesn't exists or doesn't have read permission: {filepath}"
         )
 
+    chunk_size = max(int(chunk_size), 1)
+    file_size = os.path.getsize(filepath)
+
+    if curve_file_format(filepath) == "binary":
+        header = read_curve_header(filepath)
+        values = read_curve_file(filepath)
+        for start in range(0, len(values), chunk_size):
+            yield numpy.array(values[start : start + chunk_size], dtype=float)
+            if progress is not None:
+                stop = min(start + chunk_size, len(values))
+                progress(header["offset"] + stop * values.itemsize, file_size)
+        if progress is not None:
+            progress(file_size, file_size)
+        return
+
+    chunk = numpy.empty(chunk_size)
+    chunk_count = 0
+
     with open(filepath, "r") as f:
-        return json.load(f)
+        started = False
+        finished = False
+        has_separator = False
+        pending = ""
+        bytes_read = 0
+
+        for block in iter(lambda: f.read(block_size or _READ_BLOCK_SIZE), ""):
+            # Curve files are plain ASCII, one character per byte.
+            bytes_read += len(block)
+            if progress is not None:
+                progress(min(bytes_read, file_size), file_size)
+
+            if finished:
+                if block.strip():
+                    raise ValueError(f"Unexpected data after the curve values: {filepath}")
+                continue
+
+            if not started:
+                start = block.find("[")
+                if start < 0:
+                    if block.strip():
+                        raise ValueError(f"Curve file is not a JSON array: {filepath}")
+                    continue
+                if block[:start].strip():
+                    raise ValueError(f"Curve file is not a JSON array: {filepath}")
+                block = block[start + 1 :]
+                started = True
+
+            end = block.find("]")
+            if end >= 0:
+                if block[end + 1 :].strip():
+                    raise ValueError(f"Unexpected data after the curve values: {filepath}")
+                block = block[:end]
+                finished = True
+
+            # The last value of a block can be cut in half, keep it for the next block.
+            text = pending + block
+            if finished:
+                pending = ""
+            else:
+                separator = text.rfind(",")
+                pending = text[separator + 1 :]
+                text = text[: max(separator, 0)]
+                if separator < 0:
+                    continue
+                # Something must come before each separator.
+                if not text.strip():
+                    raise ValueError(f"Invalid curve value in {filepath}: empty value")
+                has_separator = True
+            has_separator = has_separator or "," in text
+
+            # Nothing but whitespace before the closing bracket is only valid for an empty array.
+            if not text.strip():
+                if finished and has_separator:
+                    raise ValueError(f"Trailing separator in curve file: {filepath}")
+                continue
+
+            try:
+                block_values = _parse_json_values(f"[{text}]")
+            except ValueError as e:
+                raise ValueError(f"Invalid curve value in {filepath}: {e}")
+
+            # Fill the current chunk and hand it out every time it is full.
+            while len(block_values):
+                count = min(chunk_size - chunk_count, len(block_values))
+                chunk[chunk_count : chunk_count + count] = block_values[:count]
+                chunk_count += count
+                block_values = block_values[count:]
+
+                if chunk_count == chunk_size:
+                    yield chunk.copy()
+                    chunk_count = 0
+
+        if not finished:
+            raise ValueError(f"Truncated curve file: {filepath}")
 
+    if chunk_count:
+        yield chunk[:chunk_count].copy()
 
-def save_curve_file(filepath, y_values):
-    """Save the given curve Y values to a JSON file.
+
+def save_curve_file(
+    filepath, y_values, file_format=None, dtype="float64", metadata=None, atomic=False
+):
+    """Save the given curve Y values to a curve file.
 
     :param filepath: Path to save the file to.
     :type filepath: str
     :param y_values: List of floats that correspond to the curve Y values.
-    :type y_values: list
+    :type y_values: list or numpy.ndarray
+    :param file_format: Format to save in ("json" or "binary"), defaults to the format of the file
+                        being overwritten, or JSON for new files.
+    :type file_format: str, optional
+    :param dtype: Type of the values in the binary format ("float64" or "float32"), defaults to "float64"
+    :type dtype: str, optional
+    :param metadata: JSON serializable data stored in the binary format header, defaults to None
+    :type metadata: dict, optional
+    :param atomic: If True, write to a temporary file next to the target first and only replace the
+                   target once the data is on disk, so the file is never left half written, defaults to False
+    :type atomic: bool, optional
+    :raises ValueError: The file format or dtype is not supported
 
     :note: We do not perform any sort of check for an existing file. For a real use case you
            will want the end-user to confirm if they want to remove existing data.
     """
 
-    with open(filepath, "w") as f:
-        json.dump(y_values, f)
+    if file_format is None:
+        file_format = (
+            curve_file_format(filepath) if os.path.isfile(filepath) else "json"
+        )
+
+    write_file = _atomic_open if atomic else open
+
+    if file_format == "json":
+        with write_file(filepath, "w") as f:
+            json.dump(numpy.asarray(y_values, dtype=float).tolist(), f)
+    elif file_format == "binary":
+        if dtype not in _BINARY_DTYPE_CODES:
+            raise ValueError(
+                f"Unsupported binary curve dtype: {dtype}. "
+                f"Expected one of {list(_BINARY_DTYPE_CODES)}"
+            )
+        # Read everything before opening the file for writing, the values could be memory-mapped
+        # from the very file we are about to overwrite.
+        values_array = numpy.array(
+            y_values, dtype=_BINARY_DTYPES[_BINARY_DTYPE_CODES[dtype]]
+        )
+        with write_file(filepath, "wb") as f:
+            f.write(_binary_curve_header(len(values_array), dtype, metadata))
+            values_array.tofile(f)
+    else:
+        raise ValueError(
+            f"Unsupported curve file format: {file_format}. Expected 'json' or 'binary'"
+        )
+
+
+@contextlib.contextmanager
+def _atomic_open(filepath, mode="w"):
+    """Open a temporary file next to the given path for writing, and move it over that path once
+    written and flushed to disk. The temporary file is removed if anything fails.
+
+    :param filepath: Path to the file to write.
+    :type filepath: str
+    :param mode: Mode to open the file with, "w" or "wb", defaults to "w"
+    :type mode: str, optional
+    :return: File object of the temporary file.
+    :rtype: generator
+    """
+
+    directory, filename = os.path.split(os.path.abspath(filepath))
+    temp_filepath = os.path.join(directory, f".{filename}.{uuid.uuid4().hex}.tmp")
+
+    # Created with the default permissions of new files, like open() would.
+    fd = os.open(temp_filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        if os.path.exists(filepath):
+            os.chmod(temp_filepath, os.stat(filepath).st_mode & 0o7777)
+
+        with os.fdopen(fd, mode) as f:
+            fd = None
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temp_filepath, filepath)
+    except BaseException:
+        if fd is not None:
+            os.close(fd)
+        if os.path.exists(temp_filepath):
+            os.remove(temp_filepath)
+        raise
+
+    # Make the rename itself durable, not every platform can open a directory.
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def convert_curve_file(filepath, out_filepath, file_format, dtype="float64"):
+    """Convert a curve file between the JSON and binary formats.
+
+    :param filepath: Path to the curve file to convert, in any format.
+    :type filepath: str
+    :param out_filepath: Path to save the converted file to.
+    :type out_filepath: str
+    :param file_format: Format to convert to ("json" or "binary").
+    :type file_format: str
+    :param dtype: Type of the values in the binary format, defaults to "float64"
+    :type dtype: str, optional
+    """
+
+    metadata = None
+    if curve_file_format(filepath) == "binary":
+        metadata = read_curve_header(filepath)["metadata"]
+
+    save_curve_file(
+        out_filepath,
+        read_curve_file(filepath),
+        file_format=file_format,
+        dtype=dtype,
+        metadata=metadata,
+    )
+
+
+def curve_file_format(filepath):
+    """Detect the format of a curve file from its first bytes.
+
+    :param filepath: Path to the curve file.
+    :type filepath: str
+    :return: "binary" or "json"
+    :rtype: str
+    """
+
+    with open(filepath, "rb") as f:
+        magic = f.read(len(_BINARY_MAGIC))
+
+    return "binary" if magic == _BINARY_MAGIC else "json"
+
+
+def read_curve_header(filepath):
+    """Read the header of a binary curve file.
+
+    The binary format is made of a fixed-size little-endian header (magic, version, dtype code,
+    number of values, size of the metadata), followed by the metadata as UTF-8 JSON, padding up
+    to a multiple of 16 bytes and the contiguous values.
+
+    :param filepath: Path to the binary curve file.
+    :type filepath: str
+    :raises ValueError: The file is not a binary curve file or its version or dtype is unsupported
+    :return: Dictionary with the version, dtype, length, metadata and offset of the values.
+    :rtype: dict
+    """
+
+    with open(filepath, "rb") as f:
+        header_bytes = f.read(_BINARY_HEADER.size)
+        if len(header_bytes) < _BINARY_HEADER.size:
+            raise ValueError(f"Truncated binary curve header: {filepath}")
+
+        magic, version, dtype_code, _, length, metadata_size = _BINARY_HEADER.unpack(
+            header_bytes
+        )
+        if magic != _BINARY_MAGIC:
+            raise ValueError(f"Not a binary curve file: {filepath}")
+        if version != _BINARY_VERSION:
+            raise ValueError(f"Unsupported binary curve version {version}: {filepath}")
+
+        if dtype_code not in _BINARY_DTYPES:
+            raise ValueError(f"Unsupported binary curve dtype {dtype_code}: {filepath}")
+
+        metadata = None
+        if metadata_size:
+            metadata = json.loads(f.read(metadata_size).decode("utf-8"))
+
+    return {
+        "version": version,
+        "dtype": numpy.dtype(_BINARY_DTYPES[dtype_code]),
+        "length": length,
+        "metadata": metadata,
+        "offset": _binary_payload_offset(metadata_size),
+    }
+
+
+def _binary_curve_header(length, dtype, metadata=None):
+    """Build the header of a binary curve file, padded so the values start aligned.
+
+    :param length: Number of values.
+    :type length: int
+    :param dtype: Type of the values ("float64" or "float32").
+    :type dtype: str
+    :param metadata: JSON serializable data to store in the header, defaults to None
+    :type metadata: dict, optional
+    :return: Header bytes.
+    :rtype: bytes
+    """
+
+    metadata_bytes = b"" if metadata is None else json.dumps(metadata).encode("utf-8")
+    header_bytes = _BINARY_HEADER.pack(
+        _BINARY_MAGIC,
+        _BINARY_VERSION,
+        _BINARY_DTYPE_CODES[dtype],
+        0,
+        length,
+        len(metadata_bytes),
+    )
+    header_bytes += metadata_bytes
+    return header_bytes.ljust(_binary_payload_offset(len(metadata_bytes)), b"\0")
+
+
+def _binary_payload_offset(metadata_size):
+    """Offset of the values in a binary curve file with the given metadata size."""
+
+    size = _BINARY_HEADER.size + metadata_size
+    return -(-size // _BINARY_ALIGNMENT) * _BINARY_ALIGNMENT
 
 
 def smooth_values(
-    values, strength=0.2, smooth_type="Savitzky-Golay", preserve_edges=False
+    values,
+    strength=0.2,
+    smooth_type="Savitzky-Golay",
+    preserve_edges=False,
+    method="auto",
 ):
     """Smooth the given values with the select algorithm.
 
     :param values: List of float values to smooth.
-    :type values: list
+    :type values: list or numpy.ndarray
     :param strength: Intensity of the smoothing, defaults to 0.2
     :type strength: float, optional
-    :param smooth_type: Type of algorithm to use ("Savitzky-Golay", "Gaussian", "Moving Average", "Mean Average"), defaults to "Savitzky-Golay"
+    :param smooth_type: Name of the algorithm to use, see filter_names() ("Savitzky-Golay", "Gaussian", "Moving Average", "Mean Average"), defaults to "Savitzky-Golay"
     :type smooth_type: str, optional
     :param preserve_edges: If True, keep teh first and alst values as is and blend the second and second to last smoothed value, defaults to False
     :type preserve_edges: bool, optional
+    :param method: Convolution method ("direct", "fft" or "auto"), see convolve(), defaults to "auto"
+    :type method: str, optional
+    :raises ValueError: The algorithm is not registered or the convolution method is not supported
     :return: Smooth values.
-    :rtype: list
+    :rtype: numpy.ndarray
     """
 
-    if smooth_type == "Savitzky-Golay":
-        if strength < 0.1:
-            strength = 0.1
-        win_size = int(strength * 10) * 2
-        filtered_values = savitzky_golay(
-            values, win_size=win_size, order=2, derivative=0
+    return _smooth_array(
+        numpy.asarray(values, dtype=float),
+        strength,
+        smooth_type,
+        preserve_edges,
+        method,
+    )
+
+
+def smooth_batch(
+    array_2d,
+    strength=0.2,
+    smooth_type="Savitzky-Golay",
+    preserve_edges=False,
+    axis=-1,
+    lengths=None,
+    method="auto",
+):
+    """Smooth many curves at once. Each filter runs as a single vectorized operation over all
+    the curves and the result of each curve is bit-identical to calling smooth_values() on it.
+
+    :example:
+        >>> # Smooth 1000 curves of 250 values and 3 curves of different lengths
+        ... import numpy
+        ... import core
+        ...
+        ... curves = numpy.random.uniform(low=0.5, high=45.3, size=(1000, 250))
+        ... filtered_curves = core.smooth_batch(curves, 0.4, "Gaussian")
+        ...
+        ... ragged_curves = numpy.zeros((3, 100))
+        ... ragged_curves[0, :40] = numpy.random.uniform(size=40)
+        ... ragged_curves[1, :100] = numpy.random.uniform(size=100)
+        ... ragged_curves[2, :75] = numpy.random.uniform(size=75)
+        ... filtered_curves = core.smooth_batch(ragged_curves, lengths=[40, 100, 75])
+
+    :param array_2d: Array of curves, one curve per row by default.
+    :type array_2d: numpy.ndarray
+    :param strength: Intensity of the smoothing, defaults to 0.2
+    :type strength: float, optional
+    :param smooth_type: Type of algorithm to use, see smooth_values(), defaults to "Savitzky-Golay"
+    :type smooth_type: str, optional
+    :param preserve_edges: If True, keep the first and last values of each curve as is, see smooth_values(), defaults to False
+    :type preserve_edges: bool, optional
+    :param axis: Axis along which the curves values are laid out, defaults to -1
+    :type axis: int, optional
+    :param lengths: Number of values of each curve for batches of curves of different lengths padded
+                    to the same size. The padding values are returned untouched, defaults to None
+    :type lengths: list of int, optional
+    :param method: Convolution method ("direct", "fft" or "auto"), see convolve(), defaults to "auto"
+    :type method: str, optional
+    :raises ValueError: The array is not 2-D or the lengths don't match the array
+    :return: Smoothed curves with the same shape as the input array.
+    :rtype: numpy.ndarray
+    """
+
+    values_array = numpy.asarray(array_2d, dtype=float)
+    if values_array.ndim != 2:
+        raise ValueError(
+            f"Expected a 2-D array of curves, got {values_array.ndim} dimension(s)"
         )
-    elif smooth_type == "Gaussian":
-        if strength < 0.1:
-            strength = 0.1
-        win_size = int(strength * 5)
-        filtered_values = gaussian(values, win_size)
-    elif smooth_type == "Moving Average":
-        if strength < 0.1:
-            strength = 0.1
-        win_size = int(strength * 10) * 2
-        filtered_values = moving_average(values, win_size)
-    else:
-        filtered_values = mean_average(values, strength)
+
+    # Work with one curve per row and put the axes back in place at the end.
+    values_array = numpy.moveaxis(values_array, axis, -1)
+
+    if lengths is None:
+        filtered_values = _smooth_array(
+            values_array, strength, smooth_type, preserve_edges, method
+        )
+        return numpy.moveaxis(filtered_values, -1, axis)
+
+    lengths = numpy.asarray(lengths, dtype=int)
+    if lengths.shape != values_array.shape[:1] or numpy.any(
+        (lengths < 0) | (lengths > values_array.shape[-1])
+    ):
+        raise ValueError(
+            f"Expected {values_array.shape[0]} lengths between 0 and {values_array.shape[-1]}"
+        )
+
+    # Curves of the same length are smoothed together, the edge handling of every filter
+    # depends on where each curve ends.
+    filtered_values = values_array.copy()
+    for length in numpy.unique(lengths):
+        if length == 0:
+            continue
+        rows = numpy.flatnonzero(lengths == length)
+        filtered_values[rows, :length] = _smooth_array(
+            values_array[rows, :length], strength, smooth_type, preserve_edges, method
+        )
+
+    return numpy.moveaxis(filtered_values, -1, axis)
+
+
+def _smooth_array(values_array, strength, smooth_type, preserve_edges, method="auto"):
+    """Smooth the curves laid out along the last axis of the given array, see smooth_values().
+
+    :param values_array: One curve or an array with one curve per row.
+    :type values_array: numpy.ndarray
+    :param strength: Intensity of the smoothing.
+    :type strength: float
+    :param smooth_type: Name of a registered filter.
+    :type smooth_type: str
+    :param preserve_edges: If True, keep the first and last values as is.
+    :type preserve_edges: bool
+    :param method: Convolution method, see convolve(), defaults to "auto"
+    :type method: str, optional
+    :raises ValueError: The filter is not registered or the convolution method is not supported
+    :return: Smoothed values with the same shape as the input array.
+    :rtype: numpy.ndarray
+    """
+
+    filtered_values = get_filter(smooth_type).smooth(values_array, strength, method)
 
     if preserve_edges:
-        filtered_values[0] = values[0]
-        filtered_values[-1] = values[-1]
-        if len(filtered_values) > 4:
-            filtered_values[1] = (filtered_values[0] + filtered_values[1]) / 2.0
-            filtered_values[-2] = (filtered_values[-1] + filtered_values[-2]) / 2.0
+        filtered_values[..., 0] = values_array[..., 0]
+        filtered_values[..., -1] = values_array[..., -1]
+        if filtered_values.shape[-1] > 4:
+            filtered_values[..., 1] = (
+                filtered_values[..., 0] + filtered_values[..., 1]
+            ) / 2.0
+            filtered_values[..., -2] = (
+                filtered_values[..., -1] + filtered_values[..., -2]
+            ) / 2.0
 
     return filtered_values
 
 
+def filter_halo(strength=0.2, smooth_type="Savitzky-Golay"):
+    """Number of neighbouring samples on each side that can influence a smoothed value.
+
+    Smoothing a piece of curve that carries that many extra samples on both sides gives the
+    exact same values as smoothing the whole curve, once the extra samples are dropped. A few
+    samples are added for the edge handling of the filters and of preserve_edges.
+
+    :param strength: Intensity of the smoothing, defaults to 0.2
+    :type strength: float, optional
+    :param smooth_type: Type of algorithm to use, see smooth_values(), defaults to "Savitzky-Golay"
+    :type smooth_type: str, optional
+    :raises ValueError: The filter is not registered
+    :return: Number of samples.
+    :rtype: int
+    """
+
+    return max(get_filter(smooth_type).reach_for(strength)) + _HALO_EDGE_SAMPLES
+
+
+def iter_smoothed_chunks(
+    chunks, strength=0.2, smooth_type="Savitzky-Golay", preserve_edges=False
+):
+    """Smooth a curve given as a sequence of chunks, a chunk at a time.
+
+    Each chunk is smoothed together with a halo of samples taken from the previous and next
+    chunks (see filter_halo()) so the concatenated result is identical to calling smooth_values()
+    on the whole curve, while only a chunk and its halo are held in memory.
+
+    :example:
+        >>> # Smooth a curve file bigger than the available memory
+        ... import core
+        ...
+        ... chunks = core.iter_curve_chunks("huge_curve.crv", 1000000)
+        ... for smoothed_chunk in core.iter_smoothed_chunks(chunks, 0.5, "Gaussian"):
+        ...     print(smoothed_chunk.mean())
+
+    :param chunks: Consecutive pieces of the curve values.
+    :type chunks: iterable of numpy.ndarray
+    :param strength: Intensity of the smoothing, defaults to 0.2
+    :type strength: float, optional
+    :param smooth_type: Type of algorithm to use, see smooth_values(), defaults to "Savitzky-Golay"
+    :type smooth_type: str, optional
+    :param preserve_edges: If True, keep the first and last values as is, see smooth_values(), defaults to False
+    :type preserve_edges: bool, optional
+    :return: Generator of smoothed values, the chunks don't have the same sizes as the input ones.
+    :rtype: generator
+    """
+
+    halo = filter_halo(strength, smooth_type)
+
+    # Values not smoothed yet, preceded by the halo of values already smoothed. The first
+    # values of the curve have no halo before them.
+    buffer = numpy.empty(0)
+    buffer_halo = 0
+
+    for chunk in chunks:
+        buffer = numpy.concatenate((buffer, numpy.asarray(chunk, dtype=float)))
+
+        # Smooth everything that already has its full halo after it.
+        ready = len(buffer) - buffer_halo - halo
+        if ready <= 0:
+            continue
+
+        filtered_values = _smooth_array(buffer, strength, smooth_type, preserve_edges)
+        yield filtered_values[buffer_halo : buffer_halo + ready]
+
+        # Keep the halo needed by the next values, less if we are still at the curve start.
+        keep_from = max(buffer_halo + ready - halo, 0)
+        buffer = buffer[keep_from:]
+        buffer_halo = buffer_halo + ready - keep_from
+
+    # What is left contains the end of the curve.
+    if len(buffer) > buffer_halo:
+        filtered_values = _smooth_array(buffer, strength, smooth_type, preserve_edges)
+        yield filtered_values[buffer_halo:]
+
+
+def smooth_values_chunked(
+    values,
+    strength=0.2,
+    smooth_type="Savitzky-Golay",
+    preserve_edges=False,
+    chunk_size=1 << 20,
+    out=None,
+):
+    """Smooth the given values a chunk at a time, see iter_smoothed_chunks(). This is meant for
+    memory-mapped curves that don't fit in memory, the result is identical to smooth_values().
+
+    :example:
+        >>> # Smooth a binary curve file into another one with a constant memory usage
+        ... import numpy
+        ... import core
+        ...
+        ... values = core.read_curve_file("huge_curve.crv")
+        ... out = numpy.memmap("smoothed.raw", dtype="float64", mode="w+", shape=values.shape)
+        ... core.smooth_values_chunked(values, 0.5, "Gaussian", out=out)
+
+    :param values: Values to smooth, typically a numpy.memmap.
+    :type values: numpy.ndarray
+    :param chunk_size: Number of values read at a time, defaults to 1048576
+    :type chunk_size: int, optional
+    :param out: Array to write the smoothed values to, typically a numpy.memmap, defaults to a new array.
+    :type out: numpy.ndarray, optional
+    :raises ValueError: The output array doesn't have the same length as the values
+    :return: The smoothed values.
+    :rtype: numpy.ndarray
+    """
+
+    if out is None:
+        out = numpy.empty(len(values))
+    elif len(out) != len(values):
+        raise ValueError(
+            f"Output array of length {len(out)} doesn't match the {len(values)} values"
+        )
+
+    chunk_size = max(int(chunk_size), 1)
+    chunks = (
+        values[start : start + chunk_size] for start in range(0, len(values), chunk_size)
+    )
+
+    start = 0
+    for filtered_values in iter_smoothed_chunks(
+        chunks, strength, smooth_type, preserve_edges
+    ):
+        out[start : start + len(filtered_values)] = filtered_values
+        start += len(filtered_values)
+
+    return out
+
+
+def smooth_curve_file_chunked(
+    filepath,
+    out_filepath,
+    strength=0.2,
+    smooth_type="Savitzky-Golay",
+    preserve_edges=False,
+    chunk_size=1 << 20,
+    file_format=None,
+):
+    """Smooth a curve file into another one with a constant memory usage, whatever the size of
+    the curve. The result is identical to smoothing the whole curve with smooth_values().
+
+    :param filepath: Path to the curve file to smooth, in any format.
+    :type filepath: str
+    :param out_filepath: Path to save the smoothed curve to. It is written to a temporary file that
+                         replaces it once complete, so it can be the source file.
+    :type out_filepath: str
+    :param chunk_size: Number of values read at a time, defaults to 1048576
+    :type chunk_size: int, optional
+    :param file_format: Format to save in ("json" or "binary"), defaults to the format of the source file.
+    :type file_format: str, optional
+    :raises ValueError: The file format is not supported
+    :return: Number of values smoothed.
+    :rtype: int
+    """
+
+    if file_format is None:
+        file_format = curve_file_format(filepath)
+    if file_format not in ("json", "binary"):
+        raise ValueError(
+            f"Unsupported curve file format: {file_format}. Expected 'json' or 'binary'"
+        )
+
+    smoothed_chunks = iter_smoothed_chunks(
+        iter_curve_chunks(filepath, chunk_size), strength, smooth_type, preserve_edges
+    )
+
+    count = 0
+    if file_format == "binary":
+        with _atomic_open(out_filepath, "wb") as f:
+            # The number of values is only known at the end, the header is written again then.
+            f.write(_binary_curve_header(0, "float64"))
+            for filtered_values in smoothed_chunks:
+                filtered_values.astype(_BINARY_DTYPES[b"d"]).tofile(f)
+                count += len(filtered_values)
+            f.seek(0)
+            f.write(_binary_curve_header(count, "float64"))
+    else:
+        with _atomic_open(out_filepath, "w") as f:
+            f.write("[")
+            for filtered_values in smoothed_chunks:
+                if count:
+                    f.write(", ")
+                f.write(", ".join(map(repr, filtered_values.tolist())))
+                count += len(filtered_values)
+            f.write("]")
+
+    return count
+
+
 def mean_average(values, strength):
     """Compute the arithmetic mean, the sum of the elements along the axis
     divided by the number of elements.
@@ -124,38 +850,102 @@ def mean_average(values, strength):
         ... filtered_values = core.mean_average(values, 0.2)
 
 
-    :param values: List of float values to smooth.
-    :type values: list
+    :param values: List of float values to smooth, or array with one curve per row.
+    :type values: list or numpy.ndarray
     :param strength: Determine the smooth intensity.
     :type strength: float
     :return: Smoothed values
-    :rtype: list
+    :rtype: numpy.ndarray
     """
 
-    frames = (int(strength * 10)) + 1
-    filtered_values = [0] * len(values)
+    return _mean_average(numpy.asarray(values, dtype=float), int(strength * 10))
+
+
+def _mean_average(values_array, side_frames):
+    """Mean of each value and the side_frames values on each side of it, see mean_average()."""
+
+    values_count = values_array.shape[-1]
+    filtered_values = numpy.empty(values_array.shape)
+
+    # Interior samples all average the same 2 * side_frames + 1 values so we can sum them with
+    # shifted views of the array instead of building a list per sample. The terms are laid
+    # out in the order they used to be appended (value, previous, next, second previous, ...).
+    # Index 0 is never used as a neighbour so the interior starts at side_frames + 1.
+    start = side_frames + 1
+    stop = values_count - side_frames
+    if start < stop:
+        terms = [values_array[..., start:stop]]
+        for frame in range(1, side_frames + 1):
+            terms.append(values_array[..., start - frame : stop - frame])
+            terms.append(values_array[..., start + frame : stop + frame])
+
+        filtered_values[..., start:stop] = _pairwise_sum(terms) / len(terms)
+    else:
+        start = stop = values_count
 
-    for itr, value in enumerate(values):
-        side_values = [value]
+    # The few samples near the edges have a truncated neighbourhood, average them one by one.
+    for itr in itertools.chain(range(0, start), range(stop, values_count)):
+        side_values = [values_array[..., itr]]
 
-        for frame in range(1, frames):
+        for frame in range(1, side_frames + 1):
             t = itr - frame
             if t > 0:
-                side_values.append(values[t])
+                side_values.append(values_array[..., t])
 
             t = itr + frame
-            if t < (len(values)):
-                side_values.append(values[t])
+            if t < values_count:
+                side_values.append(values_array[..., t])
 
-        filtered_values[itr] = numpy.mean(side_values)
+        filtered_values[..., itr] = _pairwise_sum(side_values) / len(side_values)
 
     return filtered_values
 
 
-def gaussian(values, sigma):
+def _pairwise_sum(terms):
+    """Element-wise sum of a list of arrays using the same order of operations as numpy's own
+    reduction, so the result is bit-identical to calling numpy.sum() on each column.
+
+    :param terms: Arrays of the same shape to sum together.
+    :type terms: list of numpy.ndarray
+    :return: Sum of the arrays.
+    :rtype: numpy.ndarray
+    """
+
+    # Below 8 values numpy sums sequentially.
+    if len(terms) < 8:
+        total = terms[0].copy()
+        for term in terms[1:]:
+            total += term
+        return total
+
+    # Large blocks are split in two halves that are summed recursively.
+    if len(terms) > 128:
+        half = len(terms) // 2
+        half -= half % 8
+        return _pairwise_sum(terms[:half]) + _pairwise_sum(terms[half:])
+
+    # Otherwise it uses 8 accumulators that are combined pairwise and then adds the remainder.
+    accumulators = [term.copy() for term in terms[:8]]
+    blocks_end = len(terms) - len(terms) % 8
+    for itr in range(8, blocks_end, 8):
+        for acc_itr, accumulator in enumerate(accumulators):
+            accumulator += terms[itr + acc_itr]
+
+    total = (
+        (accumulators[0] + accumulators[1]) + (accumulators[2] + accumulators[3])
+    ) + ((accumulators[4] + accumulators[5]) + (accumulators[6] + accumulators[7]))
+    for term in terms[blocks_end:]:
+        total += term
+
+    return total
+
+
+def gaussian(values, sigma, method="auto"):
     """One-dimensional Gaussian filter.
 
-    Use scipy.gaussian_filter1d()
+    The values are convolved with a Gaussian kernel truncated at 4 standard deviations, their
+    edges reflected the way scipy.ndimage.gaussian_filter1d() does by default. The results match
+    scipy's to rounding.
 
     :example:
         >>> # Run a gaussian filter on a randomly generated list of 50 values
@@ -165,52 +955,158 @@ def gaussian(values, sigma):
         ... test_values = numpy.random.uniform(low=0.5, high=45.3, size=(50,))
         ... filtered_values = smooth_tool.gaussian(test_values, 1)
 
-    :param values: List of float values to smooth.
-    :type values: list
+    :param values: List of float values to smooth, or array with one curve per row.
+    :type values: list or numpy.ndarray
     :param sigma: Standard deviation for Gaussian kernel.
     :type sigma: int
+    :param method: Convolution method, see convolve(), defaults to "auto"
+    :type method: str, optional
     :return: Smoothed values
-    :rtype: list
+    :rtype: numpy.ndarray
     """
     if sigma == 0:
-        return values
-    return list(scipy.ndimage.filters.gaussian_filter1d(values, sigma))
+        return numpy.array(values, dtype=float)
 
+    values_array = numpy.asarray(values, dtype=float)
+    return convolve(
+        _gaussian_pad(values_array, sigma), _gaussian_kernel(sigma), method
+    )
+
+
+def _gaussian_radius(sigma):
+    """Number of samples on each side of the Gaussian kernel, 4 standard deviations like scipy."""
+
+    return int(4.0 * sigma + 0.5)
+
+
+def _gaussian_kernel(sigma):
+    """Normalized Gaussian kernel, a single coefficient of 1.0 for a zero sigma.
+
+    :param sigma: Standard deviation of the kernel.
+    :type sigma: int
+    :rtype: numpy.ndarray
+    """
+
+    if sigma == 0:
+        return numpy.ones(1)
+
+    radius = _gaussian_radius(sigma)
+    offsets = numpy.arange(-radius, radius + 1)
+    kernel = numpy.exp(-0.5 / (sigma * sigma) * offsets ** 2)
+    return kernel / kernel.sum()
 
-def moving_average(values, win_size=10):
+
+def _gaussian_pad(values_array, sigma):
+    """Extend the curves on both sides by reflecting them about their extremities, including
+    the first and last values (scipy's "reflect" mode), by the radius of the Gaussian kernel.
+
+    :param values_array: One curve or an array with one curve per row.
+    :type values_array: numpy.ndarray
+    :param sigma: Standard deviation of the kernel.
+    :type sigma: int
+    :return: Padded curves.
+    :rtype: numpy.ndarray
+    """
+
+    radius = _gaussian_radius(sigma)
+    pad_width = [(0, 0)] * (values_array.ndim - 1) + [(radius, radius)]
+    # Empty curves have nothing to reflect, their padding only needs the right length.
+    mode = "symmetric" if values_array.shape[-1] else "constant"
+    return numpy.pad(values_array, pad_width, mode=mode)
+
+
+def moving_average(values, win_size=10, alignment="legacy", compensated=True):
     """Given a sequence {a_i}_(i=1)^N, an n-moving average is a new sequence
     {s_i}_(i=1)^(N-n+1) defined from the a_i by taking the arithmetic mean
     of subsequences of n terms, s_i=1/nsum_(j=i)^(i+n-1)a_j.
 
+    The window is truncated at the curve extremities and the mean is taken over the values
+    that remain in it. Its position relative to each sample is set by the alignment:
+
+        * "trailing": the window ends on the sample.
+        * "centered": the window is centered on the sample (one more sample after it for even windows).
+        * "leading": the window starts on the sample.
+        * "legacy": the window starts one sample before the current one and the first and last
+          values are kept as is. This is how the filter always behaved and what smooth_values() uses.
+
     :example:
         >>> # Run a moving average filter on a randomly generated list of 50 values
         ... import numpy
         ... import core
         ...
         ... test_values = numpy.random.uniform(low=0.5, high=45.3, size=(50,))
-        ... filtered_values = core.moving_average(test_values, 10)
+        ... filtered_values = core.moving_average(test_values, 10, alignment="centered")
 
-    :param values: List of float values to smooth.
-    :type values: list
+    :param values: List of float values to smooth, or array with one curve per row.
+    :type values: list or numpy.ndarray
     :param win_size: Sample window, defaults to 10
     :type win_size: int, optional
+    :param alignment: Position of the window ("trailing", "centered", "leading", "legacy"), defaults to "legacy"
+    :type alignment: str, optional
+    :param compensated: If True, sum each window with a compensated summation which gives the same precision
+                        as math.fsum(). Otherwise use prefix sums which is faster for large windows but loses
+                        precision on long curves, defaults to True
+    :type compensated: bool, optional
+    :raises ValueError: The alignment is not one of the supported ones
     :return: Smoothed values
-    :rtype: list
+    :rtype: numpy.ndarray
     """
 
-    filtered_values = [values[0]]
-    for i, v in enumerate(values[1 : len(values) - 1]):
-        current_range = values[i : i + win_size]
-        sum = math.fsum(current_range)
-        new_value = sum / len(current_range)
-        filtered_values.append(new_value)
+    if alignment not in _MOVING_AVERAGE_OFFSETS:
+        raise ValueError(
+            f"Unknown moving average alignment: {alignment}. "
+            f"Expected one of {list(_MOVING_AVERAGE_OFFSETS)}"
+        )
+
+    values_array = numpy.asarray(values, dtype=float)
+    values_count = values_array.shape[-1]
+    win_size = max(int(win_size), 1)
+
+    if alignment == "legacy" and values_count <= 2:
+        return values_array.copy()
+
+    # Position of the first sample of each window, then clamp the windows to the curve.
+    offset = _MOVING_AVERAGE_OFFSETS[alignment](win_size)
+    starts = numpy.arange(offset, values_count + offset)
+    lows = numpy.clip(starts, 0, values_count)
+    highs = numpy.clip(starts + win_size, 0, values_count)
+
+    if compensated:
+        # Neumaier summation of the window terms, computed for all the samples at once by
+        # walking through shifted views of a zero-padded copy of the values.
+        padded_values = numpy.zeros(values_array.shape[:-1] + (values_count + 2 * win_size,))
+        padded_values[..., win_size : win_size + values_count] = values_array
+
+        sums = numpy.zeros(values_array.shape)
+        compensation = numpy.zeros(values_array.shape)
+        for frame in range(win_size):
+            first = win_size + offset + frame
+            term = padded_values[..., first : first + values_count]
+            total = sums + term
+            compensation += numpy.where(
+                numpy.abs(sums) >= numpy.abs(term),
+                (sums - total) + term,
+                (term - total) + sums,
+            )
+            sums = total
+        sums += compensation
+    else:
+        prefix_sums = numpy.zeros(values_array.shape[:-1] + (values_count + 1,))
+        numpy.cumsum(values_array, axis=-1, out=prefix_sums[..., 1:])
+        sums = prefix_sums[..., highs] - prefix_sums[..., lows]
+
+    # Only the first legacy window can be empty when the window holds a single sample, and that
+    # value gets replaced below.
+    filtered_values = sums / numpy.maximum(highs - lows, 1)
 
-    filtered_values.append(values[-1])
+    if alignment == "legacy":
+        filtered_values[..., 0] = values_array[..., 0]
+        filtered_values[..., -1] = values_array[..., -1]
 
     return filtered_values
 
 
-def savitzky_golay(values, win_size=10, order=2, derivative=0):
+def savitzky_golay(values, win_size=10, order=2, derivative=0, method="auto"):
     """The Savitzky-Golay filter removes high frequency noise from data.
     The Savitzky-Golay is a type of low-pass filter, particularly suited for
     smoothing noisy data. The main idea behind this approach is to make for
@@ -226,37 +1122,500 @@ def savitzky_golay(values, win_size=10, order=2, derivative=0):
         ... test_values = numpy.random.uniform(low=0.5, high=45.3, size=(50,))
         ... filtered_values = core.savitzky_golay(test_values, 10)
 
-    :param values: List of float values to smooth.
-    :type values: list
+    :param values: List of float values to smooth, or array with one curve per row.
+    :type values: list or numpy.ndarray
     :param win_size: Sample window, defaults to 10
     :type win_size: int, optional
     :param order: Order of the polynomial used in the filtering (Needs to be less then win_size-1), defaults to 2
     :type order: int, optional
     :param derivative: Order of the derivative to compute (0 means only smoothing), defaults to 0
     :type derivative: int, optional
+    :param method: Convolution method, see convolve(), defaults to "auto"
+    :type method: str, optional
     :return: Smoothed values
-    :rtype: list
+    :rtype: numpy.ndarray
+    """
+
+    values_array = numpy.asarray(values, dtype=float)
+    values_count = values_array.shape[-1]
+
+    # The window can't be wider than the curve, the mirrored padding below would run out of
+    # values and the result would not have the same length as the input.
+    half_win_size = min((abs(int(win_size)) - 1) // 2, max(values_count - 1, 0))
+
+    coeff = _savitzky_golay_coefficients(half_win_size, abs(int(order)), derivative)
+
+    return convolve(_savitzky_golay_pad(values_array, half_win_size), coeff, method)
+
+
+def _savitzky_golay_pad(values_array, half_win_size):
+    """Extend the curves on both sides by mirroring their first and last values around the
+    extremities so a Savitzky-Golay window can be centered on every value.
+
+    :param values_array: One curve or an array with one curve per row.
+    :type values_array: numpy.ndarray
+    :param half_win_size: Number of samples to add on each side.
+    :type half_win_size: int
+    :return: Padded curves.
+    :rtype: numpy.ndarray
     """
 
-    values_array = numpy.array(values[0:])
-    order_range = range(numpy.abs(numpy.int(order)) + 1)
-    half_win_size = ((numpy.abs(numpy.int(win_size))) - 1) // 2
+    values_count = values_array.shape[-1]
 
-    matrix = numpy.mat(
-        [
-            [j ** i for i in order_range]
-            for j in range(-half_win_size, half_win_size + 1)
-        ]
+    first_value = values_array[..., :1] - numpy.abs(
+        values_array[..., 1 : half_win_size + 1][..., ::-1] - values_array[..., :1]
     )
-    coeff = numpy.linalg.pinv(matrix).A[derivative]
+    last_value = values_array[..., -1:] + numpy.abs(
+        values_array[..., values_count - half_win_size - 1 : -1][..., ::-1]
+        - values_array[..., -1:]
+    )
+
+    return numpy.concatenate((first_value, values_array, last_value), axis=-1)
+
+
+def convolve(padded_values, kernel, method="auto"):
+    """Convolve the curves laid out along the last axis of the array with the given kernel,
+    keeping only the values computed with the full kernel (numpy.convolve() "valid" mode).
+
+    This is the path shared by all the filters registered with a kernel. The direct method runs
+    one multiply-add per kernel coefficient over shifted views of the values, which works the
+    same way for a single curve or a whole batch. The FFT method uses overlap-save over blocks
+    of the curves, its cost barely depends on the kernel size. Its results differ from the direct
+    method by less than 1e-9 times the largest absolute value times the sum of the absolute
+    kernel coefficients (see FFT_TOLERANCE), typically around 1e-14.
+
+    :param padded_values: One curve or an array with one curve per row, already padded.
+    :type padded_values: numpy.ndarray
+    :param kernel: Convolution kernel.
+    :type kernel: numpy.ndarray
+    :param method: "direct", "fft" or "auto" to pick the fastest one for the kernel size on this
+                   machine, see convolution_crossover(), defaults to "auto"
+    :type method: str, optional
+    :raises ValueError: The method is not supported
+    :return: Convolved values, shorter than the padded ones by the kernel size minus one.
+    :rtype: numpy.ndarray
+    """
+
+    if _convolution_method(method, len(kernel)) == "fft":
+        return _fft_convolve(padded_values, kernel)
+
+    last_coeff = len(kernel) - 1
+    values_count = padded_values.shape[-1] - last_coeff
+
+    filtered_values = numpy.zeros(padded_values.shape[:-1] + (values_count,))
+    for itr, value in enumerate(kernel):
+        first = last_coeff - itr
+        filtered_values += value * padded_values[..., first : first + values_count]
+
+    return filtered_values
+
+
+def _fft_convolve(padded_values, kernel):
+    """FFT version of convolve(), using overlap-save over blocks of the curves. All the blocks of
+    all the curves are transformed at once.
+
+    :param padded_values: One curve or an array with one curve per row, already padded.
+    :type padded_values: numpy.ndarray
+    :param kernel: Convolution kernel.
+    :type kernel: numpy.ndarray
+    :return: Convolved values, shorter than the padded ones by the kernel size minus one.
+    :rtype: numpy.ndarray
+    """
+
+    kernel_size = len(kernel)
+    values_count = padded_values.shape[-1] - kernel_size + 1
+    if values_count <= 0:
+        return numpy.zeros(padded_values.shape[:-1] + (0,))
+
+    # Each block of fft_size values gives fft_size - kernel_size + 1 convolved values.
+    fft_size = max(_FFT_MIN_BLOCK_SIZE, 1 << (4 * kernel_size - 1).bit_length())
+    fft_size = min(fft_size, 1 << (padded_values.shape[-1] - 1).bit_length())
+    step = fft_size - kernel_size + 1
+    block_count = -(-values_count // step)
+
+    # Zero-pad the end so the last block is complete, then view the overlapping blocks.
+    total_size = (block_count - 1) * step + fft_size
+    extended_values = numpy.zeros(padded_values.shape[:-1] + (total_size,))
+    extended_values[..., : padded_values.shape[-1]] = padded_values
+    blocks = numpy.lib.stride_tricks.sliding_window_view(
+        extended_values, fft_size, axis=-1
+    )[..., ::step, :]
+
+    spectrum = numpy.fft.rfft(blocks, axis=-1) * numpy.fft.rfft(kernel, fft_size)
+    convolved_blocks = numpy.fft.irfft(spectrum, fft_size, axis=-1)[..., kernel_size - 1 :]
+
+    filtered_values = convolved_blocks.reshape(padded_values.shape[:-1] + (-1,))
+    return filtered_values[..., :values_count]
+
+
+def _convolution_method(method, kernel_size):
+    """Resolve the convolution method to use for a kernel of the given size.
+
+    :param method: "direct", "fft" or "auto".
+    :type method: str
+    :param kernel_size: Number of coefficients of the kernel.
+    :type kernel_size: int
+    :raises ValueError: The method is not supported
+    :return: "direct" or "fft"
+    :rtype: str
+    """
+
+    _check_convolution_method(method)
+
+    if method == "auto":
+        # Don't bother measuring anything for the small kernels smooth_values() uses.
+        if kernel_size < _FFT_MIN_KERNEL_SIZE:
+            return "direct"
+        return "fft" if kernel_size >= convolution_crossover() else "direct"
+
+    return method
+
 
-    first_value = values_array[0] - numpy.abs(
-        values_array[1 : half_win_size + 1][::-1] - values_array[0]
+def _check_convolution_method(method):
+    """Raise an error if the convolution method is not supported.
+
+    :param method: "direct", "fft" or "auto".
+    :type method: str
+    :raises ValueError: The method is not supported
+    """
+
+    if method not in _CONVOLUTION_METHODS:
+        raise ValueError(
+            f"Unsupported convolution method: {method}. Expected 'direct', 'fft' or 'auto'"
+        )
+
+
+def convolution_crossover(measure=False):
+    """Kernel size from which the FFT convolution is faster than the direct one on this machine.
+
+    The cost of both methods grows linearly with the number of values, so the crossover only
+    depends on the kernel size. It is measured once, the first time it is needed, by timing both
+    methods on random data. It can be overridden with set_convolution_crossover().
+
+    :param measure: If True, measure it again, defaults to False
+    :type measure: bool, optional
+    :return: Kernel size
+    :rtype: int
+    """
+
+    global _CONVOLUTION_CROSSOVER
+
+    if _CONVOLUTION_CROSSOVER is None or measure:
+        values = numpy.random.RandomState(0).uniform(size=_CROSSOVER_SIGNAL_SIZE)
+        crossover = None
+        for kernel_size in _CROSSOVER_KERNEL_SIZES:
+            kernel = numpy.full(kernel_size, 1.0 / kernel_size)
+            timings = {}
+            for method in ("direct", "fft"):
+                start = time.perf_counter()
+                convolve(values, kernel, method)
+                timings[method] = time.perf_counter() - start
+            if timings["fft"] < timings["direct"]:
+                crossover = kernel_size
+                break
+
+        _CONVOLUTION_CROSSOVER = crossover or _CROSSOVER_KERNEL_SIZES[-1] * 2
+        _log.debug(f"Measured FFT convolution crossover: {_CONVOLUTION_CROSSOVER}")
+
+    return _CONVOLUTION_CROSSOVER
+
+
+def set_convolution_crossover(kernel_size):
+    """Override the kernel size from which "auto" picks the FFT convolution.
+
+    :param kernel_size: Kernel size, None to measure it again the next time it is needed.
+    :type kernel_size: int
+    """
+
+    global _CONVOLUTION_CROSSOVER
+    _CONVOLUTION_CROSSOVER = kernel_size
+
+
+@functools.lru_cache(maxsize=_SAVITZKY_GOLAY_CACHE_SIZE)
+def _savitzky_golay_coefficients(half_win_size, order, derivative):
+    """Compute the Savitzky-Golay convolution coefficients for the given parameters.
+
+    Only a handful of parameter combinations are used in practice so the result is cached,
+    see savitzky_golay_cache_info().
+
+    :param half_win_size: Number of samples on each side of the window center.
+    :type half_win_size: int
+    :param order: Order of the polynomial used in the filtering.
+    :type order: int
+    :param derivative: Order of the derivative to compute.
+    :type derivative: int
+    :return: Read-only array of coefficients.
+    :rtype: numpy.ndarray
+    """
+
+    # Vandermonde matrix of the window sample offsets.
+    offsets = numpy.arange(-half_win_size, half_win_size + 1)
+    matrix = offsets[:, numpy.newaxis] ** numpy.arange(order + 1)
+
+    coeff = numpy.linalg.pinv(matrix)[derivative]
+
+    # The same array is handed out for every cache hit, make sure nobody modifies it.
+    coeff.setflags(write=False)
+    return coeff
+
+
+def savitzky_golay_cache_info():
+    """Return the hit and miss counters of the Savitzky-Golay coefficients cache.
+
+    :return: Named tuple with the hits, misses, maxsize and currsize fields.
+    :rtype: functools._CacheInfo
+    """
+
+    return _savitzky_golay_coefficients.cache_info()
+
+
+def clear_savitzky_golay_cache():
+    """Empty the Savitzky-Golay coefficients cache and reset its counters."""
+
+    _savitzky_golay_coefficients.cache_clear()
+
+
+class SmoothFilter(object):
+    """
+    Smoothing algorithm usable by smooth_values() and everything built on it, see register_filter().
+
+    A filter turns the smoothing strength into its own parameters, and declares how many
+    samples before and after a value it reads to compute it. It then either provides a
+    function that smooths the values, or a convolution kernel and a function to pad the
+    values at their extremities. Filters with a kernel are linear, they all go through convolve()
+    and their kernels are cached.
+
+    :example:
+        >>> # Register a filter that takes the median of 3 values
+        ... import numpy
+        ... import core
+        ...
+        ... def median_3(values):
+        ...     padded_values = numpy.concatenate((values[..., :1], values, values[..., -1:]), axis=-1)
+        ...     windows = [padded_values[..., i : i + values.shape[-1]] for i in range(3)]
+        ...     return numpy.median(windows, axis=0)
+        ...
+        ... core.register_filter(
+        ...     core.SmoothFilter(
+        ...         "Median",
+        ...         parameters=lambda strength, values_count=None: {},
+        ...         reach=lambda: (1, 1),
+        ...         function=median_3,
+        ...         description="Median of each value and its direct neighbours.",
+        ...     )
+        ... )
+
+    :param name: Name of the filter, as given to smooth_values().
+    :type name: str
+    :param parameters: Function returning the filter parameters as a dictionary from the strength and,
+                       when known, the number of values to smooth. Strengths giving the same parameters
+                       must give the same result, the results are cached on them, see cache.SmoothCache.
+    :type parameters: callable
+    :param reach: Function returning the number of samples before and after a value the filter uses,
+                  from the filter parameters.
+    :type reach: callable
+    :param function: Function smoothing the curves along the last axis of an array, from the array and the
+                     filter parameters. Required if there is no kernel.
+    :type function: callable, optional
+    :param kernel: Function returning the convolution kernel from the filter parameters, defaults to None
+    :type kernel: callable, optional
+    :param pad: Function extending the curves along the last axis of an array by half the kernel size on
+                each side, from the array and the filter parameters. Required with a kernel.
+    :type pad: callable, optional
+    :param description: Short description shown to the user, defaults to ""
+    :type description: str, optional
+    :param mean_window: For filters that are the plain mean of a sliding window away from the curve edges,
+                        function returning the offset of the first sample of the window relative to the value
+                        and the number of samples in it, from the filter parameters. It lets the streaming
+                        smoother use running sums, see streaming.StreamingSmoother, defaults to None
+    :type mean_window: callable, optional
+    :raises ValueError: Neither a function nor a kernel and its padding function are given
+    """
+
+    def __init__(
+        self,
+        name,
+        parameters,
+        reach,
+        function=None,
+        kernel=None,
+        pad=None,
+        description="",
+        mean_window=None,
+    ):
+        if function is None and (kernel is None or pad is None):
+            raise ValueError(
+                f"Filter {name} needs either a function or a kernel and a pad function"
+            )
+
+        self.name = name
+        self.parameters = parameters
+        self.reach = reach
+        self.function = function
+        self.kernel = (
+            None if kernel is None else functools.lru_cache(_KERNEL_CACHE_SIZE)(kernel)
+        )
+        self.pad = pad
+        self.description = description
+        self.mean_window = mean_window
+
+    @property
+    def linear(self):
+        """True if the filter is a convolution with a fixed kernel."""
+
+        return self.kernel is not None
+
+    def smooth(self, values_array, strength, method="auto"):
+        """Smooth the curves laid out along the last axis of the given array.
+
+        :param values_array: One curve or an array with one curve per row.
+        :type values_array: numpy.ndarray
+        :param strength: Intensity of the smoothing.
+        :type strength: float
+        :param method: Convolution method, see convolve(). Only used by filters with a kernel but
+                       checked for every filter, defaults to "auto"
+        :type method: str, optional
+        :raises ValueError: The convolution method is not supported
+        :return: Smoothed values with the same shape as the input array.
+        :rtype: numpy.ndarray
+        """
+
+        _check_convolution_method(method)
+        parameters = self.parameters(strength, values_array.shape[-1])
+
+        if self.linear:
+            return convolve(
+                self.pad(values_array, **parameters),
+                self.kernel(**parameters),
+                method,
+            )
+
+        return self.function(values_array, **parameters)
+
+    def reach_for(self, strength):
+        """Return the number of samples before and after a value used to compute it at the
+        given strength, whatever the length of the curve.
+
+        :rtype: tuple(int, int)
+        """
+
+        return self.reach(**self.parameters(strength))
+
+    def kernel_cache_info(self):
+        """Return the hit and miss counters of the kernel cache, None if there is no kernel.
+
+        :rtype: functools._CacheInfo
+        """
+
+        return self.kernel.cache_info() if self.linear else None
+
+
+def register_filter(smooth_filter, replace=False):
+    """Register a smoothing algorithm so it can be used by smooth_values(), the interface and
+    the command-line interface.
+
+    :param smooth_filter: Filter to register.
+    :type smooth_filter: SmoothFilter
+    :param replace: If True, replace a filter already registered with the same name, defaults to False
+    :type replace: bool, optional
+    :raises ValueError: A filter with the same name is already registered
+    """
+
+    if smooth_filter.name in _FILTERS and not replace:
+        raise ValueError(f"A filter named {smooth_filter.name} is already registered")
+
+    _FILTERS[smooth_filter.name] = smooth_filter
+
+
+def get_filter(name):
+    """Return the registered smoothing algorithm with the given name.
+
+    :param name: Name of the filter.
+    :type name: str
+    :raises ValueError: No filter is registered with that name
+    :return: Filter
+    :rtype: SmoothFilter
+    """
+
+    try:
+        return _FILTERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown smooth type: {name}. Expected one of {filter_names()}")
+
+
+def filter_names():
+    """Return the names of the registered smoothing algorithms, in registration order.
+
+    :rtype: list
+    """
+
+    return list(_FILTERS)
+
+
+def _clamp_strength(strength):
+    """Most filters don't go lower than a 0.1 strength."""
+
+    return max(strength, 0.1)
+
+
+def _savitzky_golay_parameters(strength, values_count=None):
+    """Savitzky-Golay parameters, the window can't be wider than the curve."""
+
+    half_win_size = (int(_clamp_strength(strength) * 10) * 2 - 1) // 2
+    if values_count is not None:
+        half_win_size = min(half_win_size, max(values_count - 1, 0))
+    return {"half_win_size": half_win_size}
+
+
+register_filter(
+    SmoothFilter(
+        "Savitzky-Golay",
+        parameters=_savitzky_golay_parameters,
+        reach=lambda half_win_size: (half_win_size, half_win_size),
+        kernel=lambda half_win_size: _savitzky_golay_coefficients(half_win_size, 2, 0),
+        pad=_savitzky_golay_pad,
+        description="The Savitzky-Golay is a type of low-pass filter, particularly suited for smoothing noisy data.",
     )
-    last_value = values_array[-1] + numpy.abs(
-        values_array[-half_win_size - 1 : -1][::-1] - values_array[-1]
+)
+
+register_filter(
+    SmoothFilter(
+        "Mean Average",
+        parameters=lambda strength, values_count=None: {
+            "side_frames": int(strength * 10)
+        },
+        # The first sample is never used as a neighbour, hence the extra one before.
+        reach=lambda side_frames: (side_frames + 1, side_frames),
+        function=_mean_average,
+        mean_window=lambda side_frames: (-side_frames, 2 * side_frames + 1),
+        description="Sum of the key values divided by the number of keys.",
     )
+)
 
-    join_array = numpy.concatenate((first_value, values_array, last_value))
+register_filter(
+    SmoothFilter(
+        "Gaussian",
+        parameters=lambda strength, values_count=None: {
+            "sigma": int(_clamp_strength(strength) * 5)
+        },
+        reach=lambda sigma: (_gaussian_radius(sigma), _gaussian_radius(sigma)),
+        kernel=_gaussian_kernel,
+        pad=_gaussian_pad,
+        description="One-dimensional Gaussian filter. This is a very agressive filter that can remove a lot of noise.",
+    )
+)
 
-    return list(numpy.convolve(coeff, join_array, mode="valid"))
+register_filter(
+    SmoothFilter(
+        "Moving Average",
+        parameters=lambda strength, values_count=None: {
+            "win_size": int(_clamp_strength(strength) * 10) * 2
+        },
+        # The window starts one sample before the value and the last value is kept as is, so
+        # the last value we can trust needs at least one sample after it.
+        reach=lambda win_size: (1, max(win_size - 2, 1)),
+        function=moving_average,
+        mean_window=lambda win_size: (-1, win_size),
+        description="Average each key value based on it's surrounding values.",
+    )
+)
@@ -0,0 +1,795 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created: Sat Oct 17 02:29:04 2026
+#      by: The Resource Compiler for PySide2 (Qt v5.13.2)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PySide2 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x00\xba\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x04\x00\x00\x00\xfd\x0b1\x0c\
+\x00\x00\x00\x81IDATX\xc3\xed\xd6\xbb\x0d\x021\
+\x10EQ\xb7\x81\x5c\xec\xd6B0}\x91\xac\x13\x5c\x01\
+\xbfK\xba\xd2\xaeq0\x1e!\xcc\xbb\x05\xcc\x89,\xbf\
+\x94\x94R\x9b\xc8\x18\x85V\x8b\xf7\xfc\x89+\x9f\xf3\x11\
+\x9c\xe9\xe7!\xb8@(\xc1\x8d1\x15\x8c\x1c\x09\x00\xd4\
+\x03b(\x00\xb6\x07\xeeC\x81\xb5\x09\xb8_\x13\x8d;\
+\x02\xfa\xc0C\xc0\xd7\x81\xa7\x80\xf9\x81\x97\x80\xf9\x01~\
+\x1eX\xa3?}\x8b\x9e-\x99\x1a:\xbc\xba\xf3\xdd;\
+\x1d\x95\xfa\xe3\xde!\x17:\x9f\xf2Zr\x83\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x01\x04\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x04\x00\x00\x00\xfd\x0b1\x0c\
+\x00\x00\x00\xcbIDATX\xc3\xed\xd7A\x0a\x830\
+\x10\x85\xe1\xacr\x09{\x0fO\xa5W\xe8i\xf4*\xba\
+\xf4\x12\xba\xb2P\xf4\x00\x7f\x17E\xac%\x94\xc9\x98)\
+\x08y\xeb0\x1f$\x93!q.''q\xb8\xd12\
+\x11\x9b\xbb\xbc\xfc\x03]d\x04-\xfaH\x08F0%\
+\xb6\x95Q\xa7V\xf2\x14\x13\x1a \x8a\xf8\x04${\x12\
+Mh\x011\xa1\x07\x8e\x84\x09\xe0\x1c\xa51 h\x92\
+\x0cD\x01\xaaY\x9c\x01S\x00OM\xc7\xcaJG\x8d\
+O\x0cP0\x1c\x1ah\xa0H\x08\xe0\xbf\xca\xbf\x09\x9f\
+\x0e\xa8\x82\xd7\xa0J\x07\xf4A\xa0O\x07,A`\xb9\
+\x10`\xbeE\xe6\x87l\xdd\xa6\xe6\x17\xed\x0f\xa3\xe22\
+\xd3\xf4\xdc\xe3w\xcbh\xf3|\xdf\xd3X|@\xf6\xcc\
+\xa1\xfe:\xfb\x85\xda2\xd1\xfc,\x9f\x93\xa3\xca\x0b\xc8\
+\xd4\xe9\x85\xb3\x97V+\x00\x00\x00\x00IEND\xae\
+B`\x82\
+\x00\x00\x00\xd1\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x04\x00\x00\x00\xfd\x0b1\x0c\
+\x00\x00\x00\x98IDATX\xc3\xed\x96K\x0e\x80 \
+\x0c\x05I8#W$\xe1\x8c,\xc6\x85\xae\xc4O\xd1\
+\xbe\x85\xa6\xb3\x86y\x01\xb4mJA\x10\xfc\x162\x95\
+b^]\xa8\xe49}\x03\xba-\x82B\x07\xdaD\x04\
+\x95\x15C\xc4\xa6\x07\xa8i\xe2\xc8\xdd\x16a_\xf9h\
+\xe3c\xbdm\xf3+\xfd\xbd\xe0\xb5\xfeZ\xe2\xa2?\x17\
+\xb9\xe9\x8fe\xae\xfaQ\xe8\xae\x1f\x22\xfc\xf5\xbb\x08\x85\
+~\x88\xf0\xd7\xcb\x03\xc4W$~d\xf1g*\xfe\xd1\
+\xc4\xa5B\x5c\xec\xc4\xe5Z\xdcp\xc4-S\xde\xf4\xf5\
+c\x8bz\xf0\x92\x8f\x8eA\x10|\x8c\x05\x05\x94]\xa7\
+y\x9b\xf8\x01\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00++\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x03 \x00\x00\x02X\x08\x06\x00\x00\x00\x9av\x82p\
+\x00\x00\x01\x84iCCPICC prof\
+ile\x00\x00(\x91}\x91=H\xc3@\x1c\xc5_\
+S\xa5R\xab\x0ef\x10q\xc8P\x9d\xac\x88\x8a8j\
+\x15\x8aP!\xd4\x0a\xad:\x98\x8f~A\x93\x86$\xc5\
+\xc5Qp-8\xf8\xb1Xupq\xd6\xd5\xc1U\x10\
+\x04?@\xdc\xdc\x9c\x14]\xa4\xc4\xff%\x85\x161\x1e\
+\x1c\xf7\xe3\xdd\xbd\xc7\xdd;\x80\xab\x97\x15\xcd\xea\x18\x07\
+4\xdd6S\x89\xb8\x90\xc9\xae\x0a\xa1W\x84\xd1\x8d^\
+\x8c\x81\x97\x14\xcb\x98\x13\xc5$|\xc7\xd7=\x02l\xbd\
+\x8b\xb1,\xffs\x7f\x8e\x1e5g)@@ \x9eU\
+\x0c\xd3&\xde \x9e\xde\xb4\x0d\xc6\xfb\xc4\xbcR\x94T\
+\xe2s\xe2Q\x93.H\xfc\xc8t\xd9\xe37\xc6\x05\x97\
+9\x96\xc9\x9b\xe9\xd4<1O,\x14\xdaXnc\xa5\
+hj\xc4S\xc4QU\xd3)\x9f\xcbx\xac2\xdeb\
+\xac\x95\xabJ\xf3\x9e\xec\x85\x91\x9c\xbe\xb2\xcct\x9aC\
+H`\x11K\x10!@F\x15%\x94a#F\xabN\
+\x8a\x85\x14\xed\xc7}\xfc\x83\xae_$\x97L\xae\x12\x14\
+r,\xa0\x02\x0d\x92\xeb\x07\xfb\x83\xdf\xddZ\xf9\xc9\x09\
+/)\x12\x07:_\x1c\xe7c\x18\x08\xed\x02\x8d\x9a\xe3\
+|\x1f;N\xe3\x04\x08>\x03Wz\xcb_\xa9\x033\
+\x9f\xa4\xd7ZZ\xf4\x08\xe8\xdb\x06.\xae[\x9a\xbc\x07\
+\x5c\xee\x00\x03O\x86dJ\xae\x14\xa4\xc9\xe5\xf3\xc0\xfb\
+\x19}S\x16\xe8\xbf\x05\xc2k^o\xcd}\x9c>\x00\
+i\xea*y\x03\x1c\x1c\x02#\x05\xca^\xf7ywW\
+{o\xff\x9ei\xf6\xf7\x03i\x1dr\xa3\x89\x5ct\x85\
+\x00\x00\x00\x06bKGD\x007\x002\x002\x05z\
+\xbf\x97\x00\x00\x00\x09pHYs\x00\x00.#\x00\x00\
+.#\x01x\xa5?v\x00\x00\x00\x07tIME\x07\
+\xe5\x0a\x0b\x0e:#\x9a\xbc=0\x00\x00\x00\x19tE\
+XtComment\x00Create\
+d with GIMPW\x81\x0e\x17\x00\
+\x00 \x00IDATx\xda\xed\xddy|U\xe5\x9d\
+\xf8\xf1oV\x08\x81\x10\xc8\x02\x09Q+(\x9b \x18\
+\xa1\xd8\x0a\x8a\xa8\xad\x0a\xb8\x96\xda\xaac\x17\xb5\xedt\
+\xb3\xed\xcc\xfc\xdaZ\x97\xee\x1d\xa7\xdb\xd8m\x1c;S\
+\xad\xb5\x8bUvw\x05\xa5b\x05\x15PQ6\x85\x08\
+\x04\x90\x04\xc2\x22\x10HH\xf2\xfb\xc3\xda\x97u\xac\xd5\
+{\x92\x9b\x84\xbc\xdf\x7f\xb5\xc2s\xee\xb9\xcfs.\xb9\
+\x9f\xdcs\xcf\xc9\x88V4\xae\xb2\xb2WDL\x8d\x88\
+3\x22\xe2\x94\x88\xa8\x08\x00\x00\xa03\xa8\x8e\x88\x87#\
+\xe2\xbe\x88\x98\xbbx\xe9\xd2W\xda\xe2A2Z)<\
+&F\xc4E\x111-\x22\x0a\xad\x1d\x00\x00tj;\
+#\xe2\x8e\x88\xf8\xdd\xe2\xa5K\x1f\xe90\x012\xae\xb2\
+\xf2\x9c\x88\xb8\x22\x22&[#\x00\x008$\xdd\x1d\x11\
+\xbf\x5c\xbct\xe9\xecv\x0b\x90q\x95\x95\x13\x22\xe2\xca\
+\x88\xb8\xc0z\x00\x00@\x970=\x22nX\xbct\xe9\
+\xa3i\x0b\x90q\x95\x95\xbd#\xe2\xdf\x22\xe2_#\xa2\
+\x9b5\x00\x00\x80.\xe5@D\xfc \x22\xbe\xbfx\xe9\
+\xd2]\xa9l \xeb\x1d\xc4\xc7\xa4\x88\xf8iD|4\
+\x22\xb2\xcd=\x00\x00t9\xd9\x11qRD\x8c\xa9(\
++\xdb\xb4i\xcb\x96\xaa6\x09\x90q\x95\x95\x9f\x8c\x88\
+\x1fG\xc4hs\x0e\x00\x00]\xde\xc0\x888\xb5\xa2\xac\
+l\xdf\xa6-[\x96\xb4j\x80\x8c\xab\xac\xbc6\x22\xbe\
+\x1f\x11\xbd\xcd3\x00\x00\xf0\x17\x05\x11qVEYY\
+l\xda\xb2e\xc1\xdb\x1d\x94\xf1\x16\xe1\x91\x1f\x11\xd7F\
+\xc4\xff3\xb7\x00\x00\xc0[\xf8\x8f\x88\xf8\xe6\xe2\xa5K\
+\xf7\xfe\xa3\xbf\xf8V\xdf\xe5\x10\x1f\x00\x00\xc0\xdb\xf1Z\
+7|\xf9\x1f\xfd\xc57=\x05\xeb/\xa7]]m\x1e\
+\x01\x00\x80\xb7\xe9\xc4\x8a\xb2\xb2\x96\x7ft:V\xd6\x9b\
+\xc4\xc7'\xe3\xd5\xef|d\x98C\x00\x00\xe0\x1d8\xb9\
+\xa2\xacl\xeb[}1=\xeb\x0d\xf11)^\xbd\xda\
+\x95/\x9c\x03\x00\x00\xefTFD\x8c\xae(+{\xe6\
+\xef]\xa27\xebu\xf1\xd1;^\xbd\xcf\x87K\xed\x02\
+\x00\x00\xa9*\x88\x88\x01\x15ees6m\xd9r\xe0\
+\x8d\x7f\x98\xf9\xba\xff\xfdo\x11q\x9a\xf9\x02\x00\x00\x12\
+:\xed/}\xf1\x7fdDD\x8c\xab\xac\x9c\x10\x11\x0f\
+FD7s\x05\x00\x00\xb4\x82\x03\x11q\xfa\xe2\xa5K\
+\x1f}\xfd\x7f|\xed\x13\x90+\xc5\x07\x00\x00\xd0\x8a\xba\
+\xfd\xa53\xfeF\xc6\xb8\xca\xcas\x22b\x96\xf9\x01\x00\
+\x00\xda\xc0\xb9\x8b\x97.\x9d\xfd\xda\xff\xc9\x8c\x88+\xcc\
+\x09\x00\x00\xd0F\xfe\xa672#b\xb29\x01\x00\x00\
+\xda\xc8\xe4q\x95\x95\x13_\x1f \x00\x00\x00m\xe9\x22\
+\x01\x02\x00\x00\xa4\xcb\xb4q\x95\x95\xbd\x04\x08\x00\x00\x90\
+\x0e\x85\x111U\x80\x00\x00\x00\xe9r\x86\x00\x01\x00\x00\
+\xd2\xe5\x94\x88W\xef\x03\xd2b.\x00\x00\x8048\xd6\
+' \x00\x00@\xba\x1c/@\x00\x00\x80t\x19!@\
+\x00\x00\x80t\x19,@\x00\x00\x80t9\x5c\x80\x00\x00\
+\x00\xe9\xd2O\x80\x00\x00\x00\xe9\xd2[\x80\x00\x00\x00\xe9\
+\xd2]\x80\x00\x00\x00\xe9\x92!@\x00\x00\x80\xb4\x11 \
+\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\
+\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00 @\x00\
+\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\x00 \
+@\x00\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\
+\x00 @\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\
+\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00\
+@\x80\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x08\x10\
+\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\x00\x00\
+\x02\x04\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\
+\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x00\x02\x04\x00\x00\x10\
+ \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x80\x00\x01\x00\
+\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\x00\
+\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00\
+\x80\x00\x01\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\x04\x08\
+\x00\x00 @\x00\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\
+\x01\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\x00 @\x00\
+\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\x00\x08\
+\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\x00\
+\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x08\x10\x00\x00@\x80\
+\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00\
+@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\x04\
+\x00\x00\x10 \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x00\
+\x02\x04\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10 \x00\
+\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10\
+ \x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\
+\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00 @\
+\x00\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\x00\
+ @\x00\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\x02\
+\x00\x00 @\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00\x00\
+\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\
+\x00@\x80\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x08\
+\x10\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\x00\
+\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\
+\x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x00\x02\x04\x00\x00\
+\x10 \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x80\x00\x01\
+\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\
+\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\
+\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\x04\
+\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\x00 @\x00\x00\
+\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\x00 @\
+\x00\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\x00\
+\x08\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\
+\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x08\x10\x00\x00@\
+\x80\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x02\x04\x00\
+\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\
+\x04\x00\x00\x10 \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\
+\x00\x02\x04\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10 \
+\x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\
+\x10 \x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\
+\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00 \
+@\x00\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\
+\x00 @\x00\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\
+\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00\
+\x00\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\
+\x00\x00@\x80\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\
+\x08\x10\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\
+\x00\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\
+\x80\x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x00\x02\x04\x00\
+\x00\x10 \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x80\x00\
+\x01\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\
+\x80\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\
+\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\
+\xdaN\xf6\xa1\xf0$\xb2\xb2\xb2b\xcc\x09'\xc4\x88\x11\
+#\xa2b@E\x14\x16\x16FAA\xef\xe8\xd5\xb3W\
+\xe4\xe4\xe6Dvvvd\xe7dGfFf4\xb7\
+4G\xd3\xc1\xa6hhh\x88}\xfb\xf6\xc5\xde\xbd{\
+\xa2\xae\xae.j\xb6\xd6D\xd5\xba\xaax\xec\xb1?E\
+mM\x8d#\x03\x00\x00\xda@\xc6\xb8\xca\xca\x96\xce\xb8\
+\xe3\x95c\xc7\xc6\xc9'M\x8ca\xc7\x0c\x8f\xf2\xb2\xf2\
+\xc8\xcd\xcdm\x95\xed\xb6\xb4\xb4D\xdd\xf6\xbaXW\xb5\
+.\x9e]\xfeL\xdcw\xf7\xdd\xb1k\xe7\xceV\xd9\xf6\
+\x87.\xba$>~\xd9e)\x8f_\xb8\xf0\xd1\xf8\xe6\
+u\xd7\xb6\xea<^r\xe9G\xe3\xd2\x8f|\xa4]\xf6\
+)\xe9|\xbc\x1d\xcd\xcd\xcd\xd1\xd4\xdc\x14-\xcd\xcd\xd1\
+\xd0\xd0\x18\xfb\xf7\xef\x8f\xfa\xfa\xfa\xd8\xb9kG\xd4m\
+\xdf\x11\x9b\xb7l\x8a\xe7\x9f{.\x96<\xf1D45\
+5\xb5\xc9>\x5c\xf9\xa5\x7f\x89\xc9\x93\xa7\xa4<~\xfe\
+\xfcy\xf1\xef\xdf\xf9v\xbb\xbd\xd6\xbe\xfc\xd5\xaf\xc5\xa9\
+\xa7\x9d\x96\xf2\xf8\xbb\xee\x9e\x1b?\xf9\xd1\x8f\xda\xf58\
+h-\xbf\xff\xc3\xef\xe2\xe6_\xfe\xf2\x1d\x8f+\xe9W\
+\x12G\x1e5\xa8S<\xc7\xf5U/\xc5\xd6\xcd/\xa7\
+\xfd9\xd6n\xad\x89\xaa\x17\xd7\xa54\xb6=\x1f\xfb5\
+G\x0f\x1b\x12}\xfa\xf69d\xdf,444\xc4\xd3\
+O.u\x8c\xb7\xf1sliy\xf5-YKsK\
+457G\xd3\xc1\x83\xd1\xd4\xdc\x14\x8d\x0d\x0dq\xe0\
+@c\xec\xaf\xdf\x17{v\xef\x89\xbd{\xf6\xb4\xcb\xdc\
+Y\xe7\xae\xb1\xce\xe9\xd0\xa9>\x01)\xed\xdf?>t\
+\xd1E1\xee\xdd'DIII\xdb\x14YFF\x14\
+\x15\x17EQqQ\x8c\x1d;6\xfe\xe9\x92Kc\xed\
+\xda\x17c\xe1\xc2Gc\xc6\x1dw\xb4\xd9\x9bT\xdaF\
+fffdf\xbez\xa6ann\xb7\xe8\xd9\xb3g\
+DD\x1cv\xd8a\x7f\xf3\xf7\x0e\x1c8\x10\xeb\xd7\xaf\
+\x8f\x95+V\xc4\xec\xd93\xa3z\xc3\x86V\xdb\x87Y\
+\xb3f\xc6\x19g\x9c\x19YYY)\x8d?v\xd4\xa8\
+v\x9d\xc3Q\xa3G\xa7<\xb6\xa9\xa9)f\xcd\x98\xe1\
+@\x04x\x9b\xefA\x22\x222\xb22\x223+3r\
+r\xfe\xf26-?\xff\x0d\xff\xb66\xc7\xbe\xbd{c\
+\xe7\x8e\x9dQ\xbb\xb5&\x0e66\x9a<\xeb,@Z\
+\xdbQC\x86\xc4\xc7?~Y\x8c\x1a5:rrr\
+\xd2\xfa\xd8\xb9\xb9\xb91l\xd8\xf0\x186lx\x5cx\
+\xe1\x87\xe3\x89\xc5\x8b\xe3\x96[~\x155/\xbf\xec\x15\
+t\x08\xe9\xd6\xad[\x0c\x1e<8\x06\x0f\x1e\x1cS\xce\
+\x9e\x1a\xabW\xad\x8eY\xd3g\xc4#\x8f\xccK\xbc\xed\
+\xf5\xeb\xd6\xc5\xda\xb5kc\xf0\xe0\xc1)\x8d/.*\
+\x8e\x89\xa7\x9d\x16\x8f<\xf4P\xda\xe7\xe5\xe4\x93'E\
+qqq\xca\xe3\xd7\xbe\xf8blx\xe9%\x07\x18@\
++\xca\xca\xca\x8c^\x05\xbd\xa2WA\xaf\xa88\xbc\x22\
+v\xef\xda\x15\x9b6n\x8e=\xbbw\x9b\x1c\xeb\xdc)\
+t\xe8/\xa1\x97\xf4\xed\x17\xd7|\xfd\x1bq\xc3\x0d?\
+\x8d1c\xc6\xa6=>\xde\xa8\xa0\xa0 N;\xfd\xf4\
+\xf8\xd5\xcd\xb7\xc4i\xef\x7f\xbfW\xc6\xa1\xfa\x82\xcf\xcc\
+\x8a\xe1\xc3\x87\xc7U\xd7\x5c\x1d?\xbc\xe1\x868rP\
+\xf2\x8fb\x1f\xff\xf3\x9f\x13\x8d?u\xd2i\xed2\x17\
+\xa7\xbe\xef\xf4D\xe3\xff\x9c\xf0y\x03\xf0\xd6222\
+\xa2waa\x0c\x1f9<\x06\x0f\x1f\x12\xb9\xddrL\
+\x8au\x16 \xa9\x9a<\xf5\x9c\xf8\xf9/o\x8c\x09\x13\
+Nj\xf7\xf0x\xa3\xdc\xdcnQ\x5cT\xe2\xd5\xd0\x05\
+\x8c\x1cql\xfc\xe8\xc77\xc4\x19S\xa6$\xda\xce\xf4\
+;\xff\x18\xfb\xea\xf7\xa5<\xfe\x98\x11\xc7DN+}\
+\xcf\xe9m\x87XVV\x8c\x181\x22\xe5\xf1\xfb\xea\xf7\
+\xc5\x8c\xe9w8\x88\x00\xd2\xa4\xb0O\x9f\x181zT\
+\x14\xf6-4\x19\xd6Y\x80\xbc\xd37=\xd7~\xe3[\
+\xf1\xf9+\xaf\x8c\xc2B/ \xda_~~~\x5cy\
+\xe5\x17\xe2\xbci\xd3R\xde\xc6\xfe\xfa\xfax\xee\xb9\xe5\
+)\x8f\xef\x99\xdf3\xce9\xff\xfc\xb4>\xefs\xce\xbb\
+\xe0\xaf\xdf\x99I\xc5s\xcf-\x8f\xfd\xf5\xf5\x0e \x80\
+4\xca\xce\xce\x8e\xa3\x87\x0e\x89\xbe\x09N\x9f\xc5:w\
+\xa9\x00)*.\x8e\x9f\xfd\xe2\xc6\x18?~\xfc_\xbf\
+\xa0\x03\x1d\x22\x8c3\xb3\xe2\xf2\xcb\xae\x88\xf1\x13NN\
+y\x1b\xf3\x1fL\xf6}\x92\x13\xdf;>\xad\xcf\xf9\xbd\
+\xe3\xdf\x9bh|\xd2\xe7\x0b@j222b\xe0\xd1\
+\x03\xa3g\xaf^&\xc3:\x0b\x90\xb7r\xc4\xc0\x81q\
+\xc3O\x7f\x1e\x83\x8e:\xca\x11E\x87\x94\x93\x93\x13\x9f\
+\xfa\xf4\xa7\xa3{^^jo\xc8\xe7=\x18\xb5\xb5\xb5\
+)?\xfe\xe0\xc1\x83\xa3\xa4o\xbf\xb4<\xd7>}\xfb\
+\xc6\xd0!CS\x1e_[[\x1b\xf3\xe7=\xe8\xa0\x01\
+h\xaf7x\x99\x991\xf0\xe8A\x11~\xa1k\x9d\x05\
+\xc8\x9b+\xed\xdf?\xbe\xfd\xed\xefFii\xa9#\x89\
+\x0e\xad\xb4\xb44.\xff\xc4\xa7R\x1e\xbft\xe9\xd2D\
+\x01t\xee\xb4\xf4\x9c\x86u\xce\xf9\xe7Gnn\xb7\x04\
+\xcfs\x89\x83\x05\xa0\x9du\xcf\xeb\x1e\xe5\x15\x03L\x84\
+u\x16 o\xd4\xbb\xb00\xae\xbf\xfe\x07\xd1\xaf_?\
+G\x10\x9d\xc2\xc4\x89\x13S\xbe\xa7\xc7\xdc9\xb3\xa2\xb9\
+\xb99\xe5\xc7\x1e;nlZ\x9e\xe3\xb8w\x9f\x90\xf2\
+\xd8\xe6\xe6\xe6\x98;g\xb6\x03\x05\xa0\x03(\xf5\xfe\xca\
+:w@\xed~\x1f\x90\xab\xae\xbe&\x06\xb4A\xb5\xed\
+\xd9\xb3'\xaa^Z\x17Uk\xabb\xc3\x86\x0d\xb1~\
+]Ul\xa9\xd9\x12;\xea\xea\xa2\xb0g\x9f((*\
+\x88\xb2\xfe\xe51\xe0\xf0\x8a(\xef_\x1e\x87\x1fqx\
+\x94\x0f\x18\x10}\x0a\xfb8\x8ayK\x05\x05\x05q\xf6\
+\xb9\xe7\xc7\xcc\x14\xae\xf0\xb4f\xd5\xaa\xa8\xaa\xaa\x8aA\
+)^\xda\xf7\xf0\xc3\x8e\x88!\xc3\x87\xc7\xea\x15+\xda\
+\xec\xf9\x1d9hP\x1cy\xe4\x91)\x8f\xaf\xaa\xaa\x8a\
+5\xabV9P\x00:\x80\xdcn9QTR\x14\xdb\
+k\xb7\x9b\x0c\xeb,@\x22\x22>v\xc5\x15q\xdcq\
+\x95\xad\xb6\xbd\x96\x96\x96X\xb3zM<\xf8\xe0\x03q\
+\xf7\xdc\xd9\x7f\xf7\xae\xe5\xb5u[\xa3\xb6nk\xac}\
+\xe1\x85\xff\xf3g\x95c\xc7\xc6\xc4\x93O\x89\xca\xe3+\
+\xa3\xb4\xd4o\x0d:\xb2\x85\x0b\x1f\x8do^w\xed\x9b\
+\xfeY\xaf\x82\x82(.)\x89\x92\xd2\xd2\x18r\xf4\xd0\
+\x18x\xd4\xc0\x181bD\xf4\xee\xdd:WV\xab<\
+\xbe2\xa5\x00\x89\x88X\xbchQ\xca\x01\x92\x99\x99\x19\
+S\xa6Lm\xd3\x00\x99z\xf6\xb9\x7f\xbd{|\xaa\xcf\
+\x0f\x807\xbc\xf7\xd8Z\x13U/\xae{\xd3?\xcb\xc8\
+\xcc\x8c\x9c\x9c\xac\xc8\xc9\xe9\x16=z\xe6G\xcf^\xf9\
+\xd1\xbb\xb00r[\xe9\xf2\xeb\xbd\xfb\x14\x0a\x10\xeb,\
+@\x22\x22\x06\x0f\x1d\x1a\x17\x9c\x7fA\xabmo\xf3\xe6\
+\xcdq\xf3\xff\xfco,X0?\xd1v\x96>\xf9d\
+,}\xf2\xc9\x88\x88\x98t\xea\xe9q\xf6\xb9\xe7\xc4\xd0\
+\xa1\xc3\x12\xbd!#\xfd^\xd9\xbd;^\xd9\xbd;\xaa\
+\xd6\xae\x8d'\x1e\x7f\xfc\xaf\xff\xfd\x13\x9f\xfatL\x99\
+:5\xbaw\xef\x9eh\xfbG\xbc\xeb])\x8f\x9d~\
+\xe7\x1f\xe3\xfc\x0b.Hy\x1f\x8e;\xee\xb86\x9d\xbb\
+\xe3\x8f?>\xe5\xb1\xfb\xf7\xef\x8f\x993\xee\xec0!\
+\xda\x15~\xa0\xd11\xbc\xb0ru\xabn\xafoqq\
+\x1c5$\xf5\x8b\xb2l\xaf\xdd\x16k\xd7\xbc\xe8\x18\xef\
+$Z\x9a\x9b\xa3\xe1@s4\x1ch\x8c\xbd{\xf6D\
+\xed\xcb\xaf\xfe\xf7\xfe\x03\xcab\xc0a\x15)\x9f\xf6\xfb\
+\x9a\xfc\x04\x97T\xb7\xce\xd6\xb9-\xb4\xdb\xbb\xeaO\xfe\
+\xf3\xa7\x13}\xc9\xf5\xaf\x8b\xd9\xd2\x12\x0b\x16,\x88\xcb\
+>zi\xe2\xf8x\xa3\xf9\xf3\x1e\x8c/|\xee\xb3q\
+\xd5U_\x89\x95+W\xfa\x09{\x08\xb8\xe9\xc6_\xc4\
+\xcf~\xf6\x938x\xf0`\xa2\xed\x14\xf5-J\x14G\
++\x12|\x82QZ\xda/N<\xe9\xa46\x99\x9f\xca\
+\xb1c\xa3\xac\xac,\xe5\xf1+V\xac\x88];w:\
+\xd0\x00Z\xc1\xcb\x9b\xb6\xc4\x8b\xab_H\xf4\xdd\xc1\x88\
+\x88n\xdd\xba\x99L\xeb,@\xce\x982%F\x8e\x18\
+\x99x;\xcd\xcd\xcdq\xfb\x1f\xff\x10\xdf\xf9\xe6\xd7\xff\
+\xee\xe9V\xada\xe9\x93O\xc6\x95\x9f\xfdt\xfc\xe7\x0d\
+?Nt\x19U:\x86\x07\xee\xbd7\x16%<M(\
+'''\x06\x1d}t\xca\xe3\x1f~8\xd9=2N\
+;\xed}m27g\x9e99Y\xb4\xcf\x7f\xc8\x01\
+\x06\xd0\x8av\xed\xd8\x19\xdb\x12\x9eV\x93\x99\x99\x19\xb9\
+\x22\xc4:w\xf5\x009\xe7\xecs[e;3fL\
+\x8f_\xddtS\xda\xf6\xfb\x9e9s\xe2\x8a\xcb>\x16\
+\x0b\x16,\x88\x86\xc6\x03^-\x9d\xd8\xef~w[\xe2\
+m\x14'\xb8l\xf4\xfd\xf7\xdc\x13uuu)\x8f\x1f\
+9rd\xe2\x8fj\xdf\xcc\xb1\xa3\x8eMyl]]\
+]<p\xef\xbd\x0e.\x80V\xb6\xa5zc\xe2md\
+\xe7\xe4\x98H\xeb\xdcu\x03\xe4\x84\xf1\xe3c\xe0\xc0\x81\
+\x89\xb7\xb3h\xd1\xa2\xb8\xe9\xbf~\x91\xf6\x09\xdb\xb7w\
+o|\xe7\x9b_\x8f\x19w\xdc\xe1\x95\xd2\x89\xbd\xb8z\
+ul\xaf\xdb\x96h\x1b\xf9=z$\x1a\xff\xf4\xd3\xcb\
+R\x1e[PP\x10SZ)\xe4_\xf3\xfe\xb3\xceJ\
+t\x15\xb8$\xcf\x07\x80\xbf\xef\xc0\xfe\x868p \xd9\
+/>\xb3\xb3\xb3M\xa4u\xee\xba\x01r\xee9\xe7F\
+F\xc2\xbb5n\xdb\xbe-\xbe\x7f\xfd\xf7\x1c\xa9$R\
+W\xb7#\xd1\xf8\xc6\x03\xc9\xbeGr\xd7\xac\xb9\xd1\xd2\
+\xd2\x92\xf2\xf8\x09\xe3'\xb4\xea|L\x9cxJ\xcac\
+[ZZ\xe2\xaeYs\x1dT\x00m\xf8\xe64\x89\x96\
+\x96&\x93h\x9d\xbbf\x80\xe4\xe4\xe6\xc6\xb0a\xc3\x13\
+o\xe7\x0f\xbf\xfb}\xbc\xb2{\xb7\xa3\x94D\xea\xeb\xeb\
+\x13\x8d\xdf\xbe-\xd9'(\xcf=\xffLl\xd8\xb8>\
+\xe5\xf1C\x86\x0d\x8d\xde\x85\xadsY\xe1\xeeyy1\
+|\xf81)\x8f\xdf\xb0q}<\xf7\xfc3\x0e*\x80\
+6\xd2\xdc\x9c\xec\x97^\x0d\x07\x1aM\xa2u\xee\x9a\x01\
+2\xf5\xecs#///\xd166\xac_\x1fsf\
+\xcdp\x84\x92X\xd2O\xe2\xb6\xbc\xbc)\xf1>$\xf9\
+2|\xb7n\xdd\xe2\xbc\xf3?\xd0*sq\xde\xf9\x1f\
+H\xf4\xda\x5c\xfc\xf8b\x07\x14@\x07\xfe\x99\xd5\xd8(\
+@\xacs\x17\x0d\x901c\xc7$\xde\xc6\xfd\x0f\xde\xef\
+\xe8\xa4U$y\xc3\xbdk\xd7\xae\xd8\x91\xe0K\xe4\xaf\
+\x99u\xfb\x8chhH\xfd|\xcfq\xe3\xc6\xb5\xca\x5c\
+\xbc\xe7\xc4\xf7\xa4<\xb6\xa1\xa1!f\xfeq\xba\x03\x0a\
+\xa0-\xdf\xb0e\xa6~\xe1\x91\x86\x86\x86hnr\x0a\
+\x96u\xee\xa2\x01r\xf8\xe1\x87'\x1a\xbfw\xcf\xde\x98\
+5\xdd\x1b\x1dZGqQq\xcac\xb7\xbc\xbc\xb9U\
+\xf6a\xfb\xce\xdaX\x95\xe0\x06f\xef:\xf2\xc88\x22\
+\xe1E\x1dJJK\xe3\xa8A\xa9_Rx\xd5\xcaU\
+\xb1}\xa7\xcbS\x03\xb4\xa5n\xddS\xbf\xbc\xea\xfe\xfa\
+\xfd&\xd0:w\xcd\x00)*,\x89\xe2\xe2\x92D\xdb\
+X\xf3\xc2\xeahlhpt\x92\xd8\xc8\x91\xa3\xa30\
+\xc1\xf7'^x\xe1\x85V\xdb\x97\x05\x8f<\x92\xf2\xd8\
+\xac\xac\xac8\xfb\x9cs\x12=\xfe\x05\xd3>\x98\xe8\xaa\
+\x19I\xf6\x1f\x80\x7f\xac{^^\xe4\xe6\xe6\xa6<\xfe\
+\x95W|o\xd6:w,i\xbbV\xd7\x09\x13\xde\x1b\
+\x99\x99\xc9z\xe7\xb9\xe7\x9est\xd2*>\xf8\xe1\x0b\
+S\x1e{\xf0\xe0\xc1\x98\xd9\x8a\x9f\xc4\xcd\x9d33.\
+\xfd\xe8\xa5\xd1\xbbwjAt|e\xb2S\x1b\xc7\x1c\
+\x9f\xfa\xf8]\xbbv\xc5\xdc93\xdbu-\xc7\x8f\x9f\
+\x10\x0f\xcc{\xb8M\x1fc\xe3\xc6\x8dq\xd9G/m\
+\xb7\xe7X\xd2\xaf4J\xfa\x95\xb6\xe9c\xec\xdd\xbb7\
+\x9e\x7fz\xb9\x7f\x1cp\x8cw@\xe5\x87\x95\xa7<\xb6\
+\xb9\xb99\xb6n\xdej\x9d\xads\x87\x92\xb6O@\x0e\
+Kx\xfaUD\xc4\xe2E\x8f\xfbW\x9a\xc4\xa6\x9e}\
+^\x8c\x19;6\xe5\xf1+W\xad\x8c\xea\x0d\x1bZu\
+\x9f\x96-K\xfd\x1e\x1a\xe5\xe5\xe5Q\x99\xe2\xf3\x19>\
+|d\xa2\xd7\xe6\xd3O?\xed\x80\x02hC}\x8a\xfa\
+FQq\xea\xa7\x0c\xbf\xb2{w\x1c\xf4\x05t\xeb\xdc\
+U\x03\xa4\xa4\xa48\xd1\xf8}\xf5\xfbb\xcd\xaaU\x8e\
+P\x12\xf9\xf4g?\x1f\x9f\xfc\xe7OFV\x8a_\xf2\
+jll\x8c[\xff\xf7\xe6V\xdf\xaf{\xee\xbe+\xd1\
+\xf83\xce83\xa5q\x93\xcf\x9e\x92\xe8\x8a\x1b\xf7\xdc\
+s\x97\x83\x0a\xa0\x8d\x94\x1fV\x1e\x83\x8e>*\xe5\x7f\
+\xa7\x9b\x9b\x9bc\xc3K\xebM\xa4u\xeep\xd2v\x0a\
+Va\x9fd\xf7+\xd8\xb9c\xa7#\x94\xb7\xadG~\
+~\x94\xf4\xeb\x17\xfd\xfa\xf5\x8b!C\x86\xc6\xa0\xa3\x8e\
+\x8a\x11\xc7\x8c\x88\x82\x82\x82D\xdb\x9d?\x7f^<\xf3\
+l\xeb\xdf\xf1\xfb\xe9\xa5K\xa3\xba\xba:***R\
+\x1a?j\xf4\xe8\x94\xc6\x8d\x1e}\x5c\xca\xfb\xbc\xa9z\
+S,{\xea)\x07\x1b@B\x99\x99\x99\x91\x95\x9d\x1d\
+\xb9\xb9\xb9\xd1\xa3g\x8f\xc8\xef\xd9+\x0a\x0b\x0b#\xb7\
+[N\xa2\xedn\xdd\xb25\xea\xf7\xd6\x9b`\xeb\xdcu\
+\x03\xa4g~\xcfD\xe3_\xd9\xfd\x8a#\x97\xbf\x91\x8e\
+s\xff_\xef\xd9\xe5\xcf\xc6\x0f\xff\xe3\xfa6\xdb\xfe\x13\
+O<\x91r\x80\xf4)\xec\x13\xef?\xeb\xac\xb8\xff\x9e\
+{\xde\xf6\x98\x09'\x9d\x12%%\xa9_\x18\xe2\xc9'\
+\x9fp\x10\x02\xbcM\xe9\xf8\xfe\xc3\xeb\xed\xdc\xb1#6\
+\xfa\xf4\xc3:w\xd4\x18K\xd7\x03\xe5\xe4\xe4&\x1a\xbf\
+\xaf~\xaf\xa3\x9av\xb3z\xd5\xea\xb8\xfa\xab_i\xd3\
+\xc7\x98~\xc7\xed\x89n 4q\xe2)\xef\xe8\xef\x9f\
+\xfe\xfe\xd3S~\xac\x83\x07\x0f\xc6\x1d\x7f\xfc\x83\x03\x03\
+\xa0\x03\xda\xbdkw\xacY\xb9\xc6DXg\x01\x92\x9d\
+\x93\x95h|\xe3A_\xa0\x22\xfd\x9a\x9b\x9bc\xde\xbc\
+y\xf1\xb9\xcf|*\xf6\xd7\xb7\xed\xc7\x9b\xb555\xb1\
+fM\xea\xf7\x04\x19>\xfc\x98\xe8\xfe6o\xae\x98\x95\
+\x95\x15\xc7\x1c3\x22\xf5 [\xbd:jkj\x1c \
+\x00\x1dHKKK\xbc\xbceK\xacznEDK\
+\x8b\x09\xb1\xce\x02$+3\xd9\xd9^M\x07\x9b\x1dq\
+\xa4\xd5\xa6\xeaM\xf1\xa3\x1f\xfd \xae\xff\xee\xb7\xd3\xf6\
+\x98\x7fz\xf4O)\x8f\xcd\xcb\xcb\x8b\xf3\xce\xff\xc0\xdb\
+\xfa\xbbg\x9f{~\xf4\xea\xd5+\xe5\xc7z\xf4\xd1\x05\
+\x0e\x10\x80\x0ed\xdf\xde\xbd\xb1f\xe5\xea\xd8\xb0\xcei\
+W\xd6\xb9\xe3K\xdbw@\x9a\x9a\x93\xdd\x1a>\xe9=\
+D\xe0\xed\xfeVa\xc3\xfa\x0d1\x7f\xfe\xbc\xf8\xfdo\
+\x7f\x93\xf6\xc7\x9f3cF\x5cr\xf1?\xa5\x1c\x07\xef\
+9\xf1=ok\xbf\xc7\x9f8!\xe5}\xdc\xb3gO\
+\xcc\x9e1\xc3\xc1\x02\xd0\x01\xec\xdd\xb3'\xb6n\xd9\x1a\
+\xdbjjM\x86u\x16 ot\xb0\xf1`\xa2\xf1\xb9\
+\xb99\x8e>\xda\xd4\x9e\xbd{\xe2\xf6\xdb\xff\x10\xb7\xff\
+\xf6\xb7\xed\xb6\x0fMMM\xf1\xec\xb3\xcf\xc4\x89'\x8e\
+Oi\xfcQ\x83\x8e\x8e\xd2\xfe\xfd\xa3\xe6\xe5\x97\xff\xee\
+\xdf\xe9]X\x18\x83\x87\x0eNy\x1f\x9fy\xe6\x99h\
+jjr\xc0\x00\xb4\xa3\xc6\xc6\x83\xb1\xe1\xa5\x0d\xb1\xdd\
+\xe9\xb0\xd6\xb9\x13\xcaL\xdf\x046$\x1a\xdf#/\xdf\
+QH\x9b\xea\x99\xdf3.\xfb\xf8\xe5q\xeb\xef~\x1f\
+\x1f\xbc\xe8\xa2v\xdb\x8f{\xef\xbd'\xe5\xb1\xd9\xd9\xd9\
+q\xfe\x05\xd3\xde\xf2\xef\x9c{\xc1\x05\xd1\xad[\xb7\x94\
+\x1f\xe3\xfe\x07\xees\xb0\x00\xb4\xb3\x9c\x9c\xec\x18t\xf4\
+\xc0\x18Y9*\x8aKKL\x88u\x16 of\xcf\
+\xdedW\xb1\xeaU\xd0\xcbQHZ\xf4\xef\xd7?.\
+\xbf\xec\x8a\xf8\xe1\x0d?\x89\x92\xbe\xfd\xd2\xfe\xf8O<\
+\xfexl\xde\xbc9\xe5\xf1c\xc6\x8cy\xcb?\x7f\xf7\
+\xbb\xc7\xa5\xbc\xed-[\xb6\xc4\xa2\x85\x0b\x1d$\x00\x1d\
+D^^^\x0c<zP\x0c9fhdeg\x9b\
+\x10\xeb\xdc)\xa4\xed\x19$\xbd\x91`aa\xa1\xa3\x8f\
+\xb4\x1a9bd\xfc\xf0g?\x8e\xeb\xae\xb9&\xaa\xd6\
+\xaeM\xebc/Y\xf2T\x94\x97\x9f\x9d\xd2\xd8\xc3\x0e\
+;,F\x8e\x1c\x1d\xcb\x97?\xfd\x7f\xfe\xec\x88\x81\x03\
+c\xe0\x91\x03S\xde\xaf'\x97<\xd9\xe1\xd6i\xe1\xc2\
+G\xe3\x9b\xd7]{H\x1f\x8b\xb5[k\xa2\xea\xc5u\
+^\x948\xc6\xf9\xbbz\x17\x16\xc6\xf0\x91\xc7\xc4\xea\x15\
++\xa2\xe1@\xa3u\xb6\xce\x1dZ\xda>\x01\xd9\xbem\
+[\xa2\xf1=z\xf4\x88\xa3\x86\x0c\xe9\xd4\x07MS\xf3\
+\xc1\x84[\xc8h\xf5}\xca\xc8L\xb6\xcd\xa6\xa6C\xfb\
+\xead\xfd\xfb\x95\xc5\xd7\xbf\xf1\xad(*L\xef\xc7\x9e\
+\xd3\xef\xbc#\xe5KOgdd\xc4YS&\xbf\xe9\
+\x9f\x9ds\xee\xb9\x91\x95\x95\x95\xe2\xf1\xdb\x14\xb3\xa6O\
+\xf7\xaf?@\x07\x95\xd7#/\x86\x0c\x1f\xee\xc2=\xd6\
+Y\x80\xbcf\xe3\x86\x8d\x89\xb7\xf1\x9eq\xef\xed\xd4\x07\
+L\xe3\x81d\x01\x92\x9d\x9d\xd5\xea\xfb\x94\x95p\x9b\x07\
+\x0f\x1e<\xe4_\xe8eeeq\xddw\xbf\x91\xd6\xc7\
+\xdc\x5c]\x1dk\x13|\xea2z\xf4qo\xfa\xdf+\
+\x8f;>\xe5m\xbe\xf8\xe2\x0bQ\xbda\x83\x7f\xf9\x01\
+:\xf8\x9b\xd3\xc1\xc3\x87\x9a\x08\xeb\xdc\xa1\xa5\xed\x14\xac\
+E\x0b\xff\x1c\x9f\xf9\xdcg\x13\xd5\xda1#Gt\xea\
+\x83e\x7f\xe3\xfeD\xe3ss\xbb\xb5\xfa>\xe5'\xfc\
+r\x7f\xc3\x81\x03\xed6\x9fov\xeaMQaI\x94\
+\x0e(\x8d!\x83\x87\xc5\x90aC\xe3\xd8c\x8f\x8d\x92\
+\x92\xe4\x9f^\x0c\x1d2,>\xfd\xd9\xcf\xc7/~\xf6\
+\x93\xb4>\xbf\xa1CR\xfb\xc7\xa5\xa8\xb8(N\x99t\
+Z<<\xff\xa1\xbf\xfe\xb7\xe3\xc6\x8c\x89\xf2\xf2\xf2\x94\
+\xf7\xe7\xb1G\x1f\xf3/>@\x8a\xde\xec\xf4\xa3\xcc\xcc\
+\xcc\xc8\xed\xd6-\xf2\xf2\xf3\xa2WA\xaf(\xec\xd3'\
+\xbaw\xef\x9e\xf8\xb1\x0az\x17D\xf9a\xe5\xb1y\xe3\
+f\x13o\x9d;\xa4\xb4}\x02R[\xb75\xb6%<\
+\x0dk\xf0\xe0\xc1\x91\x93\x9b\xdbi\x0f\xca=\xbb^I\
+4\xbeG~\x8fV\xdf\xa7\x9e={&\x1a_\xbf\x7f\
+\x7f\x87\x9a\xe3\xed;kc\xe5\xf3\xcf\xc7\xac\x99w\xc6\
+\xf5\xdf\xfdv\x5c\xfc\xa1\x0f\xc6o~}k\xec\xdd\xb3\
+7\xf1\xb6\xcf\x9a<9F\x1c3*m\xcfe\xe6\x9d\
+w\xc6\x9e\xbd{R\x1e?\xe9\xd4\xd3\xfe\xe6\xff\x9fy\
+\xe6Y)ok\xdf\xbe}1k\xa6\xd3\xaf\x00ZS\
+sss\xec\xaf\xaf\x8f\x1d\xdb\xeab\xc3\xba\xf5\xf1\xec\
+\x92\xa7\xa3jmU\xe2[\x17DD\x94WTD\xf7\
+\x1e\xddM\xb2u\xee\xda\x01\x12\x11\xb1qc\xb2\xd37\
+z\xf6\xec\x19\xe7\x9e\x7f~\xa7=\x00\xd7U%\xfb\x22\
+s\xef\x82\xde\xad\xbeO}\xfa\xf6I\xf6\x86\x7f{\xc7\
+\xbf!\xceon\xbd9\xae\xbd\xfa\xea\xd8^\x97,\x80\
+sss\xe3\x13\x9f\xf9T\xda\xf6\xbb\xb1\xa1!\x9e_\
+\xfe|\xca\xe3G\x8c\x18\xf17\xc1>j\xf4\xe8\x94\xb7\
+\xb5|\xf9\xb3\xb1\xbf\xbe\xdeO\x11\x806V\xfb\xf2\xd6\
+X\xb1\xfc\xf98\x90\xf0\x0c\x83\xcc\xcc\xcc8\xe2\xc8#\
+M\xa8u\x16 O<\xf9D\xe2m\xbc\xef\xfd\xef\xef\
+\xb4\x07\xdb\xe6\xea\xeahlL\xfd\x8a\x05}\xfa\xf4i\
+\xf5}*\xea[\x9ch|\xcd\x96\xceqc\x9c\xe5\xcb\
+\x9f\x8e\xef}\xf7\xbb\xb1\xaf~_\xa2\xed\x0c\x1d24\
+\xce=\xef\x03i\xdb\xef\x07\xee\xbf?\xe5\xb1\xf9=\xf3\
+c\xea9\xe7\xbc\xfa\xba9\xf3\xcc\xe8S\x98\xfa\xf13\
+\xef\x81\x87\xfc\xb4\x00H\x93\xfd\xf5\xf5\xb1z\xc5\xea\xc4\
+\xdf\xb3\xec]\xd8;\xfa\x14\xf75\xa1\xd6\xb9k\x07\xc8\
+]\xb3gG}\xc2\xdf\xa2\x1eq\xf8\xbbb\xca\xd9\xe7\
+v\xda\x83m\xf7+\xbbR\x1e\xdb\xbd{\xf78\xee\x1f\
+\xdc\xe3\xe1\x9d\xc8\xca\xca\x8a\xd2~\xa5\x89\xb6\xb1r\xf5\
+\x8aN3\xf7\xcf.[\x16\xb7\xdd\xf6\x9b\xc4\xdb9\xef\
+\x82\xf4}\x0a\xf7\xe8\x9f\x1e\x8e\x9a\x9a\xad)\x8f?q\
+\xfc\xabwT\x9f8qR\xea\x91YS\x13\x8f<2\
+\xcfO\x0a\x80t\xbe9\xdd\xb7/\xd6W\xadO\xbc\x9d\
+\x8a\xc3*L\xa6u\xee\xda\x01\xd2\xd8\xd0\x10+W\xae\
+L\xbc\x9d\x8b/\xbe$z\xe4w\xce;\xa3\xd7\xd6&\
+;e\xe9\xc4\xf7\x8eo\xb5}\x99x\xea\xa9\x91\x97\x97\
+\x97\xf2\xf8]\xbbvE\xcd\xcb/w\xaa\xf9\xbf\xf3\x0f\
+\x7f\x88g\x97?\x93h\x1beeeq\xf1?}$\
+m\xfb\xfc\xd4SKR\x1e;d\xf0\xd0(\xed\xdf?\
+\x86\x1f3<\xe5m,]\xb2$\x00H\xbf\xed5\xb5\
+\xb1\xa3\xae.\xd16\xf2z\xf4\x88\x92\x84\xbfl\xc4:\
+w\xea\x00\x89\x88\x983gV\xe2m\x14\x15\x17\xc5W\
+\xae\xfaZ\xa7<\xc86o\xda\x92h\xfcq\x95\xc7\xb5\
+^\x80\x9c<)\xd1\xf8\xda\x9a\x9aN\xb9\x067\xddx\
+c\xa2S\xe1\x22\x22\xce<\xeb\xac\xb4\xed\xef\xecY3\
+\xa2\xb99\xb5\xfb\xad\xe4\xe6\xe6\xc6\x97\xbfzU\xf4\xc8\
+K\xed\x02\x06\xcd\xcd\xcd1{\xf6L?\x1d\x00\xda\xc9\
+\x86\xaa\x0d)\xff\x0cxM\xd9\x80r\x13i\x9d\xbbv\
+\x80\xfc\xf9\xd1Gc\xdd\xba\xe4w\xc1<\xe1\x84\xf7\xc4\
+\xe5\x9f\xf8T\xda'\xacG~~\x5cu\xcd\xb5q\xfe\
+\xb4i)\x8d\x7f~\xf9s\x89\x1e\xff\xb0\xc3\x0e\x8fI\
+\xa7\x9f\x9e\xf8y\x94WT\xc4\xe8\xe3F'\xda\xc6\xda\
+u\x9d\xf3n\xa6kV\xad\x8aE\x8b\x1eO\xb4\x8d\xd2\
+\xd2\xd2\xb8\xe4\xd2\x8f\xa6e\x7f\xab\xd6\xae\x8dukS\
+\x9f\xeb\x91#F&X\xe3\xb5\xb1\xf6\x85\x17\xfcd\x00\
+h'\x07\xf6\xef\x8fm5\xc9\xce\x9e\xe8\x9e\xd7=\x8a\
+\xfb\xf53\x99\xd6\xb9\xeb\x06HD\xc4\x9c\xb9\xb3[e\
+;\x1f\x986->r\xd9ei\xdb\xef3\xa7N\x8d\
+_\xfe\xef\xcd1q\xe2)\x91\x9b\x93\xda=9\x1e|\
+\xf0\xbe\xc4W<\xf8\xc8G>\x96\xf8\x14\xb4/~\xe9\
+_\xa2[\xb7d\xf7\x15Y\xfc\xf8\xe3\x9d\xf6\x85\xfe\xcb\
+\x9b\xfe;\xf1:\x9cq\xe6\x19i\xdb\xdf\xc7\xff\xfc\xe7\
+v\x99\xa7\xc5\x8f/\xf2S\x01\xa0\x9dm\xda\xb81\x9a\
+\x9a\x92\xfdv\xbc|@\x7f\x13i\x9d\xbbv\x80\xdc3\
+gN<\xff\xfc\xf3\xc9w>33.\xfa\xf0\xc5\xf1\
+\x95\xaf]\xd3\xa6\xfb{\xdc\x981\xf1\x9f?\xfdy|\
+\xf1\x0b_J|S\xbb\xfd\xf5\xf5Q\xf5RU\xa2m\
+\x94\x95\x95\xc5\xf7\x7f\xf4\xe3\xe8UP\x90\xd2\xf8k\xbf\
+\xf1\xcd\x185*\xd9\xa7\x1f\xbbw\xef\x8e\x85\x8f.\xe8\
+\xb4/\xf2\x977o\x8e\xc5\x8b\x93\xbd\xb9.-\xed\x17\
+\x17]riZ\xf6w\xfa\xf4?&\xbe\x80\xc3;U\
+__\x1f3g\xdc\xe9'\x02@;kl8\x18\xdb\
+j\x93\xfev</J\xfa\xfb.\x88u\xee\xc2\x01\x12\
+\x11q\xd3\x7f\xffW444$\xdeNFFFL\
+\x9a4)n\xfe\xf5m1~\xc2\xc9\xad\xba\x8f'\x9f\
+<)~x\xc3O\xe2{\xdf\xbb>\x86\x0f\x1f\xdej\
+\xdb}\xec\xb1\x85\x89\xb7q\xf4QG\xc7\xcf~qc\
+\x9c9u\xea\xdb\x1e3f\xdc\xb8\xf8\xe9\xcfo\x8c\xf1\
+\xe3'$~\xfce\xcb\x96u\xfa\x17\xfa-7\xff*\
+\x1a\x1a\x92}\x0a\x92\xae\xef\x82\xec\xdb\xbb7\x9e\x7f\xfe\
+\xb9\xb4\xce\xcf\x8a\x15\xcf\xc7+\xbbw\xfb\x89\x00\xd0\x01\
+l\xdaP\x1d\xcd\x09\x7f;\xde\xbf\xdcwA\xacs\xc7\
+\x90\xdd^\x0f\xfc\xea\xdd\xaag\xc6\x07/\xbc\xb0U\xb6\
+7\xa0b@\x5cs\xddu\xb1z\xcd\xeax\xe0\xbe\xfb\
+\xe3\xae\x14\xbf\xec>r\xf4\xe88\xe5\x94Sc\xcc\xd8\
+\xe3\xa3\x7f\xbf\xb26y\xee3\xee\xb8#>8\xed\xc2\
+\xe8\xd5\xabW\xa2\xed\x94\x95\x95\xc5\x17\xbf\xf0\xa5\x98\xf6\
+\x81\x0f\xc6\x9a5\xab\xe3\xd9\xe5\xcf\xc6\xe6\xea\xea\xd8T\
+]\x1d\x07\x0f\x1e\x8c\xc3+\x8e\x88\xe2\xfe%1b\xc4\
+\xc8\x18<dH\x0c\x1a8(23\x937gKK\
+K\xdc5kv\xa7\x7f\x91Wo\xd8\x10\x8b\x17?\x11\
+\x13&\xa4\x1ed\xfd\xfa\xf5\x8b\x0f]tI\xfc\xe1w\
+\xb7\xb5\xf9\xfe>\xf4\xd0\x831f\xcc\xd8\xb4\xcd\xcf\xbc\
+y\x9d\xe3\xde\x1f\xe3\xc7O\x88\x07\xe6=\x9c\xb6\xc7\xfb\
+\xf9\xcf~\x16\xb3\xdd\x15\xfe\x90R\xd2\xaf4\xadW\x8f\
+yq\xf5\x9a\xa8\xdbVg\xe2\xad\xc1;r\xb0\xb11\
+jk\xb7E\xbf\x04\xbf\xdd\xce\xcb\xeb\x1e%\xfdJ\xa2\
+vk\xadu\xb6\xce]3@\x22\x22\xfe\xe7\xa6\x1bc\
+\xc8\xd0!\x89O\x07zMFFF\x0c\x1d24\x86\
+\x0e\x19\x1a\x1f\xfb\xf8\xc7\xe3\xa5u/\xc5\xda\xaa\xb5\xb1\
+a\xfd\xfaximUl\xad\xdd\x12;w\xee\x8c\x82\
+\x1e\xbd\xa3\xa0\xa8 \xca\xca\xcbc@EE\x94\x97\x95\
+\xc7\xe1G\x1c\x1e\x03\xca+\xa2o\xdf\xb6\xbf\x91Kc\
+CC,X\xb0 \xa6L\x99\xd2*\xdb\xab\xa8\xa8\x88\
+\x8a\x8a\x8a\x984\xe9\xd4\xb4\xac\xdb\xf2\xe7\x96\xc73\xcf\
+v\xfeO@\x22\x22~}\xcb\xafb\xdc\xb8q\x91\xfb\
+\xba;\x86\xbfSgM\x99\x9c\x96\x00\x99\xff\xe0\x83q\
+\xc5\xe5\x9f\x8c\xa2\xe2\xa26\x7f\xacm\xdb\xb7\xc5C\x09\
+n\x82\x08@\xeb\xdb\xb2\xb1:JJ\x8b\x13\xfd2\xb1\
+\xff\x80\xf2\x0e\xfd\xc6\x94\xae\xb1\xce\xd9\xed\xbd\x03\xdf\xfd\
+\xf6\xb7\xe2\xc77\xfc4\xca[\xf9\xe3\xa2^\xbdz\xc5\
+\xc8Q#c\xe4\xa8\x91\x1dr\xe2\xff\xe7\xa6\x1bc\xc2\
+\x84\x09\xd1\xbbw\xefN\xf5\xa2hjj\x8a[\x7f}\
+\xcb!\xf3\x22\xdf\xf0\xd2K\xf1\xe4\x93O\xc4\x89'\xa6\
+~\x7f\x95\xfe\xfd\xfa\xc7\x85\x17_\x1c\xb7\xff\xf6\xb7m\
+\xbe\xbfK\x97-\x89\xd3O\x7f_\x9b?\xce3\xcb\x9e\
+\xf6\x13\x00\xa0\x83ihh\x88\xed\xdb\xb6EIi\x92\
+\xdf\x8e\xe7EQiil\xef\xa4\x97\xd2\xb7\xce\x87\xc6\
+:g\xb6\xf7\x0e\xec\xa8\xab\x8b\xab\xbe\xfa\xe5\xa8\xe9b\
+/\x84}{\xf7\xc6\x1f\xef\xb8\xbd\xd3\xed\xf7\x82\x05\x0b\
+\xe2\xd9e\xcb\x0e\xa9\xb5\xb8\xe5\x96\x9b\x13\xdf\x17d\xf2\
+\xe4\xc9i\xd9\xd79sf'\xbeN\xf8?\xd2\xd2\xd2\
+\x12sg\xcf\xf1\x13\x00\xa0\x03\xaa^_\x9d\xf8\xe7@\
+\xf9\x802\x13i\x9d\xbbv\x80DDl\xae\xae\x8e\xeb\
+\xae\xbd:\xf1]\xc2;\x9b;~\xff\xfbX\xbati\
+\xa7\xd9\xdf-[\xb6\xc4\x0f\xbf\x7f\xfd!\xb7\x0e\xeb\xd7\
+\xad\x8b\xa7\x9ez*\xd16\xfa\xf7+\x8bi\x1f\xfep\
+\x9b\xef\xeb\xea\x15+\xe2\xa5\x97^j\xdb\xf9\xd8\xf0R\
+\xacX\xb1\xdc\xbf\xfe\x00\x1dP\xe3_~;\x9eD^\
+\x8f\xbc(JxUO\xf4\x8dq\x17\x00\x00\x08\xf7I\
+DAT\xacs\xa7\x0f\x90\x88\x88\xb5/\xbc\x10_\xf8\
+\xfcgc\xdd\xba\xb5]\xea\x00\xfb\xdew\xbe\x15\xd5\xd5\
+\xd5\x1d~?w\xef\xde\x1d\xd7\x7f\xf7{\xd1\xd8\x0aW\
+.\xeb\x88n\xfdu\xf2OA\xa6L\x9e\x9a\x96}]\
+\xb4\xb8m\xef\xbf\xb2h\x91{\x7f\x00td\x9b6l\
+J\xfe\xdb\xf1\x0a\x9f\x82Xg\x01\x12\x11\x11\xb555\
+\xf1\xb9\xcf|:\x16-Z\x14---]\xe2\xe0\xda\
+\xb5sg\x5c\xfd\xb5\xafFM\xcd\xd6\x0e\xbb\x8f\xfb\xf6\
+\xed\x8b\x1f\xfc\xf0\xfb\x87\xf4o\xc5\xd7\xbe\xf0B,]\
+\x92\xec\xd3\xa8\xb2\xb2\xb2\x98\xf6\xa1\x0f\xb5\xf9\xbe\xce\xbc\
+\xf3\xce\xc47Q\xfc{\x1a\x1a\x0e\xc4\xcc;\xdd\xfb\x03\
+\xa0#k8p \xea\xb6'\xbb\xbaS^\x8f\x1eQ\
+TZl2\xad\xb3\x00\x89x\xf5#\xa7k\xbf\xf6\xd5\
+\xf8\xc5\xcf\x7f\x1e\xbbv\xed\xea\x12\x07\xd8\xe6\xea\xea\xf8\
+\xe2\x95\x9f\xef\x90\x9f\xfel\xdb\xbe-\xae\xbd\xf6\xeaX\
+\xb4p\xe1!\xbf\x0e\xbf\xf9\xcd-q\xf0\xe0\xc1D\xdb\
+\x98\x9c\x86OAv\xed\xdc\x19+V\xaeh\x93m\xaf\
+\x5c\xb92v\xd4\xb9<(@G\xb7iC\xf2\xef\x08\
+\x94\x0dp_\x10\xeb,@\xfe\xc6\xec\x99\xd3\xe3S\x9f\
+\xb8<\x1e{la\xe2ScZ\xbdH\x1b\x0e\xc4\xb6\
+\xed\xad\xfb}\x95\xd7>\xfd\x99?\x7f~457u\
+\x88\xe7\xf9\xec3\xcf\xc6\x17>\xff\xb9C\xeeK\xe7\x7f\
+\xcf\x9aU\xabb\xc9\x92%\x89\xb6Q^^\x1e\x17\xb4\
+\xd2\xbdm\xde\xca\xc3\x0f\xcfo\x93\xed>\xf2\xf0#\xfe\
+\xb5\x07\xe8\x04\x0e\xec\xdf\x9f\xf8\x1e\x17=z\xf4\x88\xbe\
+%E&\xd3:\x0b\x90\xd7\xdb\xbem[|\xe3\xdak\
+\xe2K_\xfaB,Y\xb2\xa4\xddCd\xf7\xee\xdd1\
+o\xde\xbc\xb8\xfc\xb2\x8f\xb7\xc9=\x12\x1a\x1b\x1a\xe2\xdf\
+\xbf\xf3\xad\xf8\xce7\xbf\x15UUU\xed\xf6<kk\
+k\xe3\xbfo\xba1\xfe\xf5KWF\xcd\xcb/w\xa9\
+\x17\xfam\xb7\xdd\x1a\x8d\x07\x93^\x11kJ\x9b\xef\xe7\
+}w\xdd\x15;v\xeeh\xd5m\xee\xdc\xb93\xee\x9e\
+;;\x00\xe8\x1c\xaa7lL|\xcaz\xd9\x80\x01&\
+\xd2:\xa7]vg\x98\xf8\xd5+V\xc4W\xff\xdf\xbf\
+FyEE|\xf0\xc2\x0f\xc7\xbb\xdf\xfd\xee(.N\
+\xcf\xf9l\x8d\x8d\x8d\xb1v\xdd\x8b\xb1p\xe1\xc2\x98~\
+\xfb\xed\xd1\xd4\xd4\xf6\x9fN,|tA,|tA\
+\x9c9ujL>sr\x0c:\xea\xa8\xc8\xca\xcaj\
+\xf3\xc7\xddT\xbd)\x1e~x~\xdcz\xcb\xaf\xba\xec\
+\x8b|\xf5\x8a\x15\xf1\xcc\xd3O'\xba\xe3x\xc5\x80\x8a\
+8o\xda\xb4\x98y\xc7\x1dm\xba\xaf\xcb\x96-\x8dI\
+\xa7\x9c\xda\x8a\xdb[\x16\x00t\x1e\x0d\x07\x0e\xc4\x8e\xed\
+u\xd17\xc1\x0dj\xf3\xf3{D\xdf\xe2\xe2\xa8Kx\
+\xc5%\xac\xf3!\x17 \xaf\xd9\x5c]\x1d\xff\xf9\xc3\xef\
+GD\xc4\xd8\x13N\x88\x93N:9\x86\x0d\x1d\x16e\
+\xe5\xe5\x91\x93\x93\xd3j\x8fSWW\x17UUU\xf1\
+\xdc\xf2\xe5q\xcf\xdds\xdb\xed\x9c\xf8{\xe7\xce\x8d{\
+\xe7\xce\x8d#\x06\x0e\x8c\xb3\xcf9'\x86\x0d\x1b\x1e\x87\
+\x1fvx\xa2\xbbv\xbf^SSSl\xd9\xb2%\xd6\
+\xbc\xb0:\xee\xbf\xef\xbeX\x96\xf0R\xb4\x87\x8a\xdb~\
+\xfd\x9b\x185zt\xe4d\xa7~LM\x9dzv\x9b\
+\x07\xc8\xbds\xee\x8eS&N\x8a\x8c\x8c\x8c\xc4\xdbj\
+ii\x89\xbb\xef\x9ek\xf1\x01:\x99\x8d\xeb7F\x9f\
+\xa2\xbe\x89~\x16\x94W\x94\x0b\x10\xeb\x9cV\x19\xe3*\
++;\xfd\xe5\xa6\xb2\xb2\xb2\xe2\x84\x13O\x8cc\x86\x8f\
+\x88\xf2\x8a\x01Q\xd8\xbbw\xf4.(\x8c\xfc\x9e\xf9\x91\
+\xdb-7\xb2\xb3\xb2\x22++;\xb2\xb2\xb2\xa2\xb9\xb9\
+9\x9a\x9a\x9a\xa2\xe1@C\xec\xab\xdf\x17{\xf7\xed\x89\
+\xba\xed;\xa2\xb6\xb6&\xaa\xaa\xd6\xc5\xa2\xc7\x1f\x8f\xcd\
+\x1d\xf8\xb2\xb8=\xf2\xf3\xe3\x84\xf7\xbe7\x06\x0f\x1e\x12\
+\x03\x06\x0c\x88\xa2\xbeE\x91\xdf\xb3g\xe4\xe7\xe7Gn\
+nndgg\xff\xf5\xd3\x92\xa6\xa6\xa6hjj\x8a\
+\xc6\xc6\xc6\xd8\xbbwo\xec\xd9\xb3'v\xed\xda\x19\x9b\
+6o\x8a\xaa\xb5U\xb1x\xe1\xe3Q[\xb7\xd5\xab\x1a\
+\x00\x00\x01\x02\x00\x00\x1cz2M\x01\x00\x00 @\x00\
+\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\x00 \
+@\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\x00\
+\x00\x08\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00@\x80\
+\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x08\x10\x00\x00\
+@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\x04\
+\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x00\
+\x02\x04\x00\x00\x10 \x00\x00\x00\x02\x04\x00\x00\x10 \x00\
+\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10\
+ \x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\x00\x01\x00\
+\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\
+\x01\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\x00\
+ @\x00\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\x01\x02\
+\x00\x00 @\x00\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\
+\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\
+\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x08\
+\x10\x00\x00@\x80\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\
+\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\
+\x00\x00\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00\
+\x10 \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x00\x02\x04\
+\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\
+\x00\x01\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\
+\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\
+\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\x00 @\x00\x00\
+\x00\x04\x08\x00\x00 @\x00\x00\x00\x01b\x0a\x00\x00\x00\
+\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\
+\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x08\
+\x10\x00\x00@\x80\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\
+\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\
+\x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x00\x02\x04\x00\x00\
+\x10 \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x80\x00\x01\
+\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\
+\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\
+\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\
+\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\x00 @\x00\x00\
+\x00\x04\x08\x00\x00 @\x00\x00\x00\x01\x02\x00\x00 @\
+\x00\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\x00\
+\x08\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\
+\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x08\x10\x00\x00@\
+\x80\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x02\x04\x00\
+\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\
+\x04\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\
+\x00\x02\x04\x00\x00\x10 \x00\x00\x00\x02\x04\x00\x00\x10 \
+\x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\
+\x10 \x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\
+\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00 \
+@\x00\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\
+\x00 @\x00\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\
+\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\x00\x08\x10S\x00\
+\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x08\x10\x00\x00@\
+\x80\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\x02\x04\x00\
+\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\
+\x04\x00\x00\x10 \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\
+\x00\x02\x04\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10 \
+\x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\
+\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\
+\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\x00 \
+@\x00\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\
+\x00 @\x00\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\
+\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00\
+\x00\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\
+\x00\x00@\x80\x00\x00\x00\x08\x10\x00\x00@\x80\x00\x00\x00\
+\x08\x10\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\
+\x00\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00\x10\
+ \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x00\x02\x04\x00\
+\x00\x10 \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x80\x00\
+\x01\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\
+\x80\x00\x01\x00\x00\x04\x08\x00\x00\x80\x00\x01\x00\x00\x04\x08\
+\x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00 @\x00\x00\x00\
+\x04\x08\x00\x00 @\x00\x00\x00\x04\x08\x00\x00 @\x00\
+\x00\x00\x01\x02\x00\x00 @\x00\x00\x00\x01\x02\x00\x00 \
+@\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00\x00\x01\x02\x00\
+\x00\x08\x10\x00\x00\x00\x01\x02\x00\x00\x08\x10\x00\x00@\x80\
+\x98\x02\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00@\x80\x00\
+\x00\x00\x02\x04\x00\x00@\x80\x00\x00\x00\x02\x04\x00\x00\x10\
+ \x00\x00\x00\x02\x04\x00\x00\x10 \x00\x00\x00\x02\x04\x00\
+\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x10 \x00\x00\x80\x00\
+\x01\x00\x00\x10 \x00\x00\x80\x00\x01\x00\x00\x04\x08\x00\x00\
+\x80\x00\x01\x00\x00\x04\x08\x00\x00\xc0?\xd6\x22@\x00\x00\
+\x80t\xd9\xff\xff\x01\xeb\xfc7p\x08\xd6\xf8\xa1\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x08\
+\x06\xc1Y\x87\
+\x00o\
+\x00p\x00e\x00n\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x08\xc8Xg\
+\x00s\
+\x00a\x00v\x00e\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x06\x98\x83'\
+\x00c\
+\x00l\x00o\x00s\x00e\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x08\x94\x19\x07\
+\x00s\
+\x00p\x00l\x00a\x00s\x00h\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00<\x00\x00\x00\x00\x00\x01\x00\x00\x01\xc6\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00T\x00\x00\x00\x00\x00\x01\x00\x00\x02\x9b\
+\x00\x00\x00&\x00\x00\x00\x00\x00\x01\x00\x00\x00\xbe\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
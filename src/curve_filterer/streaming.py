@@ -0,0 +1,319 @@
+# No shebang line. This file is meant to be imported
+"""
+Streaming versions of the Curve Filterer smoothing algorithms, for live sample feeds.
+
+Each smoother keeps the last few samples it received in a ring buffer and smooths every new
+batch of samples together with them. A smoothed value is only handed out once enough samples
+after it have been received, so the values returned match running core.smooth_values() on the
+whole curve, at the cost of a fixed latency.
+"""
+
+# standard imports
+import logging
+
+# third-party imports
+import numpy
+
+# internal imports
+import core
+
+# logger
+_log = logging.getLogger(__name__)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log.addHandler(_log_handler)
+_log.setLevel("INFO")
+
+# constants
+
+# preserve_edges only blends the second value of curves with more than 4 values.
+_PRESERVE_EDGES_MIN_SAMPLES = 5
+
+# Number of values after which the running sum of a sliding window is summed again from scratch.
+_WINDOW_SUM_RESYNC = 1024
+
+
+class RingBuffer(object):
+    """
+    Fixed-size buffer of floats that keeps the most recent values appended to it.
+    """
+
+    def __init__(self, capacity):
+        self._values = numpy.zeros(max(int(capacity), 1))
+        self._start = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def capacity(self):
+        return len(self._values)
+
+    def extend(self, values):
+        """Append the given values, dropping the oldest ones if the buffer is full.
+
+        :param values: Values to append.
+        :type values: numpy.ndarray
+        """
+
+        values = values[-self.capacity :]
+        capacity = self.capacity
+
+        # Write position of the first value, then copy in at most two slices when wrapping.
+        end = (self._start + self._count) % capacity
+        first_count = min(len(values), capacity - end)
+        self._values[end : end + first_count] = values[:first_count]
+        self._values[: len(values) - first_count] = values[first_count:]
+
+        overflow = max(self._count + len(values) - capacity, 0)
+        self._start = (self._start + overflow) % capacity
+        self._count = min(self._count + len(values), capacity)
+
+    def values(self):
+        """Return a copy of the values in the buffer, oldest first.
+
+        :rtype: numpy.ndarray
+        """
+
+        end = self._start + self._count
+        if end <= self.capacity:
+            return self._values[self._start : end].copy()
+        return numpy.concatenate(
+            (self._values[self._start :], self._values[: end - self.capacity])
+        )
+
+    def clear(self):
+        """Remove all the values from the buffer."""
+
+        self._start = 0
+        self._count = 0
+
+
+class StreamingSmoother(object):
+    """
+    Streaming version of one of the registered smoothing algorithms, see core.register_filter().
+    The ring buffer holds as many samples as the filter reads around a value, as declared by
+    the filter.
+
+    The first values of the curve and the ones held back when it is flushed are smoothed with the
+    batch filter. In between, each new value only costs a dot product with the kernel for linear
+    filters, or a running sum for the filters averaging a sliding window, which match the batch
+    results to rounding. Other filters smooth the ring buffer on every push.
+
+    :example:
+        >>> # Smooth a live feed of samples
+        ... import streaming
+        ...
+        ... smoother = streaming.create_streaming_smoother("Gaussian", strength=0.4)
+        ... for samples in live_feed():
+        ...     smoothed_samples = smoother.push(samples)
+        ... smoothed_samples = smoother.flush()
+    """
+
+    def __init__(self, smooth_type="Savitzky-Golay", strength=0.2, preserve_edges=False):
+        self.smooth_type = smooth_type
+        self.strength = strength
+        self.preserve_edges = preserve_edges
+
+        smooth_filter = core.get_filter(smooth_type)
+        parameters = smooth_filter.parameters(strength)
+        before, after = smooth_filter.reach(**parameters)
+
+        # Values away from the curve start are computed from their window alone, with a kernel
+        # or a running sum when the filter allows it.
+        self._kernel = None
+        self._mean_window = None
+        if smooth_filter.linear:
+            self._kernel = smooth_filter.kernel(**parameters)[::-1]
+            self._kernel_offset = -before
+        elif smooth_filter.mean_window is not None:
+            self._mean_window = smooth_filter.mean_window(**parameters)
+        self._window_sum = None
+        self._window_sum_count = 0
+
+        if preserve_edges:
+            # preserve_edges changes the first and last two values of whatever we smooth, they
+            # must never be the ones we hand out unless they are the curve ones.
+            before = max(before, 2)
+            after = max(after, 2)
+        self._before = before
+        self._after = after
+
+        # Samples needed before the oldest value not handed out yet, that value and the ones
+        # after it, and enough samples to start the curve the way smooth_values() does.
+        self._history = RingBuffer(before + after + _PRESERVE_EDGES_MIN_SAMPLES)
+        self._count = 0
+        self._done = 0
+
+    @property
+    def latency(self):
+        """Number of samples a value is held back for, once the smoother is warmed up.
+
+        :rtype: int
+        """
+
+        return self._after
+
+    def push(self, samples):
+        """Add new samples to the stream and return the values that can be smoothed so far.
+
+        :param samples: New samples, in order.
+        :type samples: list or numpy.ndarray
+        :return: Smoothed values, they follow the ones returned by the previous calls.
+        :rtype: numpy.ndarray
+        """
+
+        samples = numpy.atleast_1d(numpy.asarray(samples, dtype=float))
+        values = numpy.concatenate((self._history.values(), samples))
+
+        # Index in the curve of the first value of the array.
+        first_index = self._count - len(self._history)
+        self._count += len(samples)
+        ready_end = self._count - self._after
+
+        filtered_values = numpy.empty(0)
+        if ready_end > self._done and (
+            not self.preserve_edges or self._count >= _PRESERVE_EDGES_MIN_SAMPLES
+        ):
+            filtered_values = self._smooth_ready(values, first_index, ready_end)
+            self._done = ready_end
+
+        self._history.extend(samples)
+
+        return filtered_values
+
+    def flush(self):
+        """Return the values held back, treating the last sample pushed as the end of the curve.
+        The smoother is reset afterwards.
+
+        :return: Smoothed values.
+        :rtype: numpy.ndarray
+        """
+
+        filtered_values = numpy.empty(0)
+        pending = self._count - self._done
+        if pending:
+            filtered_values = core._smooth_array(
+                self._history.values(),
+                self.strength,
+                self.smooth_type,
+                self.preserve_edges,
+            )[-pending:]
+
+        self.reset()
+        return filtered_values
+
+    def reset(self):
+        """Forget every sample received so far and start a new curve."""
+
+        self._history.clear()
+        self._count = 0
+        self._done = 0
+        self._window_sum = None
+        self._window_sum_count = 0
+
+    def _smooth_ready(self, values, first_index, ready_end):
+        """Smooth the values from the first one not handed out yet up to the given end.
+
+        :param values: Samples of the ring buffer followed by the new ones.
+        :type values: numpy.ndarray
+        :param first_index: Index in the curve of the first value of the array.
+        :type first_index: int
+        :param ready_end: Index in the curve after the last value to smooth.
+        :type ready_end: int
+        :rtype: numpy.ndarray
+        """
+
+        if self._kernel is None and self._mean_window is None:
+            return core._smooth_array(
+                values, self.strength, self.smooth_type, self.preserve_edges
+            )[self._done - first_index : ready_end - first_index]
+
+        # The values whose window reaches the curve start go through the batch filter, the
+        # array still starts with the first sample of the curve then.
+        chunks = []
+        window_start = min(max(self._before, self._done), ready_end)
+        if self._done < window_start:
+            chunks.append(
+                core._smooth_array(
+                    values, self.strength, self.smooth_type, self.preserve_edges
+                )[self._done : window_start]
+            )
+
+        if window_start < ready_end:
+            start = window_start - first_index
+            stop = ready_end - first_index
+            if self._kernel is not None:
+                chunks.append(self._convolve(values, start, stop))
+            else:
+                chunks.append(self._running_mean(values, start, stop))
+
+        return numpy.concatenate(chunks)
+
+    def _convolve(self, values, start, stop):
+        """Smooth values[start:stop] with a dot product of each window with the kernel."""
+
+        first = start + self._kernel_offset
+        windows = numpy.lib.stride_tricks.sliding_window_view(
+            values[first : stop + self._kernel_offset + len(self._kernel) - 1],
+            len(self._kernel),
+        )
+        return windows @ self._kernel
+
+    def _running_mean(self, values, start, stop):
+        """Smooth values[start:stop] with the mean of a sliding window, updating a running sum
+        of the window by the sample entering it and the one leaving it for each value.
+        """
+
+        offset, size = self._mean_window
+        filtered_values = numpy.empty(stop - start)
+
+        for block_start in range(start, stop, _WINDOW_SUM_RESYNC):
+            block_stop = min(block_start + _WINDOW_SUM_RESYNC, stop)
+            first = block_start + offset
+
+            # The running sum picks up rounding errors, sum the window again every so often.
+            if self._window_sum is None or self._window_sum_count >= _WINDOW_SUM_RESYNC:
+                window_sum = values[first : first + size].sum()
+                self._window_sum_count = 0
+            else:
+                window_sum = self._window_sum + (
+                    values[first + size - 1] - values[first - 1]
+                )
+
+            entering = values[first + size : block_stop + offset + size - 1]
+            leaving = values[first : block_stop + offset - 1]
+            sums = numpy.empty(block_stop - block_start)
+            sums[0] = window_sum
+            numpy.cumsum(entering - leaving, out=sums[1:])
+            sums[1:] += window_sum
+
+            filtered_values[block_start - start : block_stop - start] = sums / size
+            self._window_sum = sums[-1]
+            self._window_sum_count += len(sums)
+
+        return filtered_values
+
+
+def create_streaming_smoother(
+    smooth_type="Savitzky-Golay", strength=0.2, preserve_edges=False
+):
+    """Create the streaming smoother for the given algorithm.
+
+    :param smooth_type: Type of algorithm to use, see core.smooth_values(), defaults to "Savitzky-Golay"
+    :type smooth_type: str, optional
+    :param strength: Intensity of the smoothing, defaults to 0.2
+    :type strength: float, optional
+    :param preserve_edges: If True, keep the first and last values as is, defaults to False
+    :type preserve_edges: bool, optional
+    :raises ValueError: The algorithm is not registered
+    :return: Streaming smoother
+    :rtype: StreamingSmoother
+    """
+
+    return StreamingSmoother(
+        smooth_type=smooth_type, strength=strength, preserve_edges=preserve_edges
+    )
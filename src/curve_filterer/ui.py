@@ -6,16 +6,33 @@ Interface around a basic curve filtering function.
 # standard imports
 import sys
 import os
+import time
 import logging
 import random
+import argparse
+import collections
+
+# Start of the slower imports below, reported by --profile-startup.
+_IMPORTS_START = time.perf_counter()
 
 # third-party imports
+import numpy
 from PySide2 import QtWidgets, QtGui, QtCore
 
 # internal imports
 import core
+import cache
 import theme
 
+# The images compiled into a Qt resource module by build_resources.py, they are read from the
+# icons directory when it hasn't been built.
+try:
+    import icons_rc
+except ImportError:
+    icons_rc = None
+
+_IMPORTS_DURATION = time.perf_counter() - _IMPORTS_START
+
 # logger
 _log = logging.getLogger(__name__)
 _log_handler = logging.StreamHandler()
@@ -27,21 +44,29 @@ _log.setLevel("INFO")
 
 # constants
 
-# We use this to populate both the QComboBox that determine which filter to use but also the QPlainTextEdit with a
-# description of the currently selected filter.
-_FILTERS = {
-    "Savitzky-Golay": "The Savitzky-Golay is a type of low-pass filter, particularly suited for smoothing noisy data.",
-    "Mean Average": "Sum of the key values divided by the number of keys.",
-    "Gaussian": "One-dimensional Gaussian filter. This is a very agressive filter that can remove a lot of noise.",
-    "Moving Average": "Average each key value based on it's surrounding values.",
-}
-
 # Height of the CurveFiltererWin QMainWindow with both the options layout collapsed or expanded.
 _WIN_HEIGHT_HIDE_OPTIONS = 250
 _WIN_HEIGHT_SHOW_OPTIONS = _WIN_HEIGHT_HIDE_OPTIONS + 300
 
-# Path to the icons relative to the current module location.
+# Path to the icons relative to the current module location, and in the Qt resources.
 _ICONS_PATH = os.path.join(os.path.dirname(__file__), "icons")
+_ICONS_RESOURCE_PATH = ":/icons"
+
+# Memory the preview keeps the smoothed curves in, see cache.SmoothCache.
+_PREVIEW_CACHE_BYTES = 256 * 1024 * 1024
+
+# Bounds of the interval between two preview updates while the parameters keep changing, in
+# milliseconds. It follows the time the last updates took, so slow curves update less often.
+_PREVIEW_MIN_INTERVAL = 1000.0 / 60.0
+_PREVIEW_MAX_INTERVAL = 250.0
+
+# Longest curve whose cached previews are shown right away. Past it, building the RangeMinMax
+# of the result to draw it takes long enough to go on a worker thread like the smoothing does.
+_PREVIEW_SYNC_MAX_VALUES = 1 << 18
+
+# Number of RangeMinMax of the latest cached previews kept to show them again right away, whatever
+# the curve length. Their tables take a fraction of the curve memory, on top of the cache budget.
+_PREVIEW_RANGES_MAX_ENTRIES = 16
 
 # QSettings instance used to save and restore the interface parameters next time you open it.
 _SETTINGS = QtCore.QSettings("jkoubi", "curve_filterer")
@@ -63,11 +88,341 @@ _CURVE_SM_LINE_PEN = QtGui.QPen(
     QtGui.QColor(183, 183, 183, 255), 1, QtCore.Qt.SolidLine
 )
 
+# Size of the curve points and the smallest spacing between them, in pixels, to draw them.
+# Closer than that the points would just pile up on top of the line.
+_CURVE_PT_SIZE = 4.0
+_CURVE_PT_MIN_SPACING = 1.0
+
+# Space kept above and below the curves when fitting them to the preview height, in pixels.
+_CURVE_Y_MARGIN = 6.0
+
+# Zoom of the preview for each mouse wheel step, and smallest number of samples it can show.
+_VIEW_ZOOM_STEP = 0.8
+_VIEW_MIN_SAMPLES = 4
+
+
+def icon_path(filename):
+    """Return the path to load an image of the icons directory from, in the Qt resources when they
+    are built, see build_resources.py.
+
+    :param filename: Name of the image file.
+    :type filename: str
+    :rtype: str
+    """
+
+    if icons_rc is not None:
+        return f"{_ICONS_RESOURCE_PATH}/{filename}"
+    return os.path.join(_ICONS_PATH, filename)
+
+
+def decimate_min_max(y_values, x_spacing):
+    """Return the indices of the samples needed to draw a curve with the given spacing between
+    samples, in pixels. When several samples fall in the same pixel column, only the lowest and
+    the highest are kept, in their original order. The first and last samples are always kept.
+
+    :param y_values: Curve Y coordinates.
+    :type y_values: numpy.ndarray
+    :param x_spacing: Distance between two samples in pixels.
+    :type x_spacing: float
+    :return: Sorted indices of the samples to draw.
+    :rtype: numpy.ndarray
+    """
+
+    values_count = len(y_values)
+    if x_spacing >= 1.0 or values_count < 3:
+        return numpy.arange(values_count)
+
+    columns = (numpy.arange(values_count) * x_spacing).astype(int)
+    return numpy.unique(
+        numpy.concatenate(([0], column_min_max(y_values, columns), [values_count - 1]))
+    )
+
+
+def column_min_max(y_values, columns):
+    """Return the indices of the first lowest and first highest sample of each pixel column,
+    in their original order. Columns of NaN samples only keep their first sample.
+
+    :param y_values: Curve Y coordinates.
+    :type y_values: numpy.ndarray
+    :param columns: Pixel column of each sample, in increasing order.
+    :type columns: numpy.ndarray
+    :return: Indices of the lowest and highest sample of each column, two per column.
+    :rtype: numpy.ndarray
+    """
+
+    values_count = len(y_values)
+    positions = numpy.arange(values_count)
+    starts = numpy.flatnonzero(numpy.diff(columns, prepend=-1))
+    counts = numpy.diff(starts, append=values_count)
+
+    # Position of the first lowest and first highest sample of each column.
+    column_indices = numpy.repeat(numpy.arange(len(starts)), counts)
+    low_values = numpy.fmin.reduceat(y_values, starts)
+    high_values = numpy.fmax.reduceat(y_values, starts)
+    lows = numpy.minimum.reduceat(
+        numpy.where(y_values == low_values[column_indices], positions, values_count),
+        starts,
+    )
+    highs = numpy.minimum.reduceat(
+        numpy.where(y_values == high_values[column_indices], positions, values_count),
+        starts,
+    )
+
+    # Columns of NaN samples only match nothing, fall back to their first sample.
+    lows = numpy.where(lows == values_count, starts, lows)
+    highs = numpy.where(highs == values_count, starts, highs)
+
+    indices = numpy.stack((numpy.minimum(lows, highs), numpy.maximum(lows, highs)), axis=1)
+    return indices.ravel()
+
+
+class RangeMinMax(object):
+    """
+    Lowest and highest value of any range of a curve, used to fit the visible part of a curve
+    to the preview height and to decimate it, see decimate().
+
+    The curve is split in blocks whose lowest and highest values positions are kept in sparse
+    tables, each level holding the extremes of twice as many blocks as the previous one. A range
+    is answered from two overlapping table entries for the blocks it covers, plus the few values
+    at its ends that don't fill a block, so the time doesn't depend on the size of the range. The
+    tables only take a fraction of the curve memory. NaN values are ignored.
+
+    :param values: Curve values.
+    :type values: list or numpy.ndarray
+    :param block_size: Number of values per block, defaults to 64
+    :type block_size: int, optional
+    """
+
+    def __init__(self, values, block_size=64):
+        self.values = numpy.asarray(values, dtype=float)
+        self.block_size = block_size
+
+        full_blocks = len(self.values) // block_size
+        self._lows = []
+        self._highs = []
+        if full_blocks:
+            blocks = self.values[: full_blocks * block_size].reshape(full_blocks, block_size)
+            block_starts = numpy.arange(0, full_blocks * block_size, block_size)
+            lows = block_starts + self._block_extremes(blocks, numpy.inf)
+            highs = block_starts + self._block_extremes(blocks, -numpy.inf)
+            width = 1
+            while len(lows):
+                self._lows.append(lows)
+                self._highs.append(highs)
+                lows = self._merge(lows[:-width], lows[width:], numpy.less)
+                highs = self._merge(highs[:-width], highs[width:], numpy.greater)
+                width *= 2
+
+    def __len__(self):
+        return len(self.values)
+
+    @staticmethod
+    def _block_extremes(blocks, nan_fill):
+        """Return the position in each block of its lowest value, or of its highest value when
+        nan_fill is -inf. Blocks with NaN values only are represented by their first value.
+        """
+
+        if nan_fill > 0:
+            positions = blocks.argmin(axis=1)
+        else:
+            positions = blocks.argmax(axis=1)
+
+        # argmin() and argmax() stop at the first NaN, the few blocks with one are done again.
+        nan_blocks = numpy.flatnonzero(
+            numpy.isnan(blocks[numpy.arange(len(blocks)), positions])
+        )
+        if len(nan_blocks):
+            filled_blocks = numpy.where(
+                numpy.isnan(blocks[nan_blocks]), nan_fill, blocks[nan_blocks]
+            )
+            if nan_fill > 0:
+                positions[nan_blocks] = filled_blocks.argmin(axis=1)
+            else:
+                positions[nan_blocks] = filled_blocks.argmax(axis=1)
+
+        return positions
+
+    def _merge(self, firsts, seconds, is_better):
+        """Return the position of the best value of each pair of positions, the first one on
+        ties.
+        """
+
+        first_values = self.values[firsts]
+        second_values = self.values[seconds]
+        return numpy.where(
+            is_better(second_values, first_values) | numpy.isnan(first_values),
+            seconds,
+            firsts,
+        )
+
+    def query(self, start, stop):
+        """Return the lowest and highest values in the given range.
+
+        :param start: Index of the first value.
+        :type start: int
+        :param stop: Index after the last value.
+        :type stop: int
+        :return: Lowest and highest values, NaN if the range is empty or only has NaN values.
+        :rtype: tuple(float, float)
+        """
+
+        start = max(int(start), 0)
+        stop = min(int(stop), len(self.values))
+
+        first_block = -(-start // self.block_size)
+        last_block = stop // self.block_size
+        if first_block >= last_block:
+            ends = [self.values[start:stop]]
+            lows = highs = []
+        else:
+            ends = [
+                self.values[start : first_block * self.block_size],
+                self.values[last_block * self.block_size : stop],
+            ]
+            level = (last_block - first_block).bit_length() - 1
+            second_block = last_block - (1 << level)
+            lows = list(self.values[self._lows[level][[first_block, second_block]]])
+            highs = list(self.values[self._highs[level][[first_block, second_block]]])
+
+        for end in ends:
+            if len(end):
+                lows.append(numpy.fmin.reduce(end))
+                highs.append(numpy.fmax.reduce(end))
+
+        if not lows:
+            return numpy.nan, numpy.nan
+        return numpy.fmin.reduce(lows), numpy.fmax.reduce(highs)
+
+    def decimate(self, start, stop, x_spacing):
+        """Return the indices of the samples needed to draw the given range, like
+        decimate_min_max(). With many samples per pixel column, the extremes of each column are
+        found the way query() finds them, so the time depends on the number of columns rather
+        than on the number of samples.
+
+        :param start: Index of the first value.
+        :type start: int
+        :param stop: Index after the last value.
+        :type stop: int
+        :param x_spacing: Distance between two samples in pixels.
+        :type x_spacing: float
+        :return: Sorted indices of the samples to draw.
+        :rtype: numpy.ndarray
+        """
+
+        start = max(int(start), 0)
+        stop = min(int(stop), len(self.values))
+
+        if stop - start < 3 or x_spacing * 2 * self.block_size > 1.0 or not self._lows:
+            return start + decimate_min_max(self.values[start:stop], x_spacing)
+
+        # First sample of each column, the same columns as decimate_min_max() uses.
+        columns = numpy.arange(int((stop - 1 - start) * x_spacing) + 1)
+        column_starts = start + numpy.ceil(columns / x_spacing).astype(int)
+        column_starts[0] = start
+        column_starts[1:] -= (
+            ((column_starts[1:] - 1 - start) * x_spacing).astype(int) >= columns[1:]
+        )
+        column_starts[1:] += ((column_starts[1:] - start) * x_spacing).astype(int) < columns[1:]
+        column_stops = numpy.append(column_starts[1:], stop)
+
+        lows = self._ranges_extreme(column_starts, column_stops, self._lows, numpy.inf)
+        highs = self._ranges_extreme(column_starts, column_stops, self._highs, -numpy.inf)
+
+        indices = numpy.stack((numpy.minimum(lows, highs), numpy.maximum(lows, highs)), axis=1)
+        return numpy.unique(numpy.concatenate(([start], indices.ravel(), [stop - 1])))
+
+    def _ranges_extreme(self, starts, stops, tables, nan_fill):
+        """Return the position of the lowest value of each range, or of the highest value when
+        nan_fill is -inf, see query(). Ranges of NaN values only are represented by their first
+        value.
+        """
+
+        arg_best = numpy.argmin if nan_fill > 0 else numpy.argmax
+        first_blocks = -(-starts // self.block_size)
+        last_blocks = stops // self.block_size
+        has_blocks = last_blocks > first_blocks
+
+        # Values before the first block, or the whole range when it doesn't cover one.
+        left_offsets = numpy.arange(2 * self.block_size)
+        left_stops = numpy.where(has_blocks, first_blocks * self.block_size, stops)
+        left_positions = starts[:, None] + left_offsets
+        left_values = self._fill(left_positions, left_positions < left_stops[:, None], nan_fill)
+        left = starts + arg_best(left_values, axis=1)
+
+        # Values after the last block.
+        has_right = has_blocks & (last_blocks * self.block_size < stops)
+        right_positions = last_blocks[:, None] * self.block_size + left_offsets[: self.block_size]
+        right_values = self._fill(
+            right_positions,
+            (right_positions < stops[:, None]) & has_right[:, None],
+            nan_fill,
+        )
+        right = last_blocks * self.block_size + arg_best(right_values, axis=1)
+
+        # Two overlapping table entries for the blocks in between.
+        block_counts = numpy.maximum(last_blocks - first_blocks, 1)
+        levels = numpy.log2(block_counts).astype(int)
+        first_entries = numpy.zeros_like(starts)
+        second_entries = numpy.zeros_like(starts)
+        for level in numpy.unique(levels):
+            at_level = numpy.flatnonzero((levels == level) & has_blocks)
+            first_entries[at_level] = tables[level][first_blocks[at_level]]
+            second_entries[at_level] = tables[level][
+                last_blocks[at_level] - (1 << int(level))
+            ]
+
+        candidates = numpy.stack((left, first_entries, second_entries, right), axis=1)
+        candidate_values = self._fill(
+            candidates,
+            numpy.stack((numpy.ones_like(has_blocks), has_blocks, has_blocks, has_right), axis=1),
+            nan_fill,
+        )
+        return candidates[numpy.arange(len(candidates)), arg_best(candidate_values, axis=1)]
+
+    def _fill(self, positions, valid, nan_fill):
+        """Return the values at the given positions, nan_fill where they aren't valid or NaN."""
+
+        values = self.values[numpy.minimum(positions, len(self.values) - 1)]
+        return numpy.where(valid & ~numpy.isnan(values), values, nan_fill)
+
 
 class CurveFiltererWin(QtWidgets.QMainWindow):
     def __init__(self, *args):
         super(CurveFiltererWin, self).__init__(*args)
 
+        # Smoothed curves already computed for the preview. Going back to parameters we already
+        # used, or to a strength using the same filter window, doesn't smooth the curve again.
+        self._smooth_cache = cache.SmoothCache(_PREVIEW_CACHE_BYTES)
+        self._raw_values_hash = None
+        # RangeMinMax of the latest cached previews by cache key, least recently used first.
+        self._preview_ranges = collections.OrderedDict()
+
+        # Threads precomputing the preview at every intensity, see start_strength_sweep(). We keep
+        # the cancelled ones around until they are done with the curve they are smoothing.
+        self._sweep_thread = None
+        self._sweep_threads = set()
+
+        # Thread reading the curve file being opened, and the cancelled ones still finishing.
+        self._load_thread = None
+        self._load_threads = set()
+
+        # Threads saving the smoothed curve, see save_curve().
+        self._save_threads = set()
+
+        # The preview is smoothed on a separate thread so the interface never waits for it. Each
+        # request gets a new generation number and only the results of the latest one are shown.
+        self._preview_pool = QtCore.QThreadPool(self)
+        self._preview_generation = 0
+        self._preview_requested_at = 0.0
+        self._preview_key = None
+
+        # Dragging the slider or restoring the settings changes the parameters many times in a
+        # row, the schedulers gather those changes into a single update.
+        self._preview_scheduler = UpdateScheduler(
+            self.update_preview, _PREVIEW_MIN_INTERVAL, _PREVIEW_MAX_INTERVAL, self
+        )
+        self._sweep_scheduler = UpdateScheduler(self.start_strength_sweep, parent=self)
+
         # Define the variable that will hold the values before they get filtered. We
         # start with a random sampling of 25 values between 25.0 and 155.0 for demo
         # purpose.
@@ -93,14 +448,52 @@ class CurveFiltererWin(QtWidgets.QMainWindow):
         self.create_intensity_layout(main_lay)
         self.create_preview_layout(main_lay)
         self.create_options_layout(main_lay)
+        self.create_status_bar()
 
-        # Connect the main widgets to the preview updating functions.
-        self.intensity_slider.valueChanged.connect(self.update_preview)
-        self.filter_type_cb.currentIndexChanged[int].connect(self.update_preview)
+        # Connect the main widgets to the preview updating functions. The final intensity is
+        # always shown as soon as the slider is released.
+        self.intensity_slider.valueChanged.connect(self._preview_scheduler.schedule)
+        self.intensity_slider.sliderReleased.connect(self._preview_scheduler.flush)
+        self.filter_type_cb.currentIndexChanged[int].connect(
+            self._preview_scheduler.schedule
+        )
         self.filter_type_cb.currentIndexChanged[int].connect(
             self.update_filter_description
         )
-        self.preserve_edges_chkb.stateChanged.connect(self.update_preview)
+        self.preserve_edges_chkb.stateChanged.connect(self._preview_scheduler.schedule)
+
+        # Precompute the preview at every intensity for the new filter so the slider only has to
+        # look it up.
+        self.filter_type_cb.currentIndexChanged[int].connect(
+            self._sweep_scheduler.schedule
+        )
+        self.preserve_edges_chkb.stateChanged.connect(self._sweep_scheduler.schedule)
+
+    @property
+    def raw_values(self):
+        """Values of the curve before they get filtered."""
+
+        return self._raw_values
+
+    @raw_values.setter
+    def raw_values(self, values):
+        self.set_raw_values(values)
+
+    def set_raw_values(self, values, values_hash=None):
+        """Set the values of the curve to filter.
+
+        :param values: Values of the curve before they get filtered.
+        :type values: list or numpy.ndarray
+        :param values_hash: Hash of the values if already known, see cache.hash_values(), defaults to None
+        :type values_hash: str, optional
+        """
+
+        # The results cached for the previous curve won't be used again.
+        if self._raw_values_hash is not None:
+            self._smooth_cache.invalidate(self._raw_values_hash)
+
+        self._raw_values = values
+        self._raw_values_hash = values_hash or cache.hash_values(values)
 
     def closeEvent(self, event):
         """Save the UI state when closing it."""
@@ -116,6 +509,20 @@ class CurveFiltererWin(QtWidgets.QMainWindow):
         # Save the settings we just set on disk.
         _SETTINGS.sync()
 
+        # Stop loading and precomputing the preview, the threads can't outlive the window.
+        self._preview_scheduler.cancel()
+        self._sweep_scheduler.cancel()
+        self.cancel_curve_load()
+        self.cancel_strength_sweep()
+        # Let the saves finish, the user expects those files to be written.
+        for thread in (
+            list(self._load_threads) + list(self._sweep_threads) + list(self._save_threads)
+        ):
+            thread.wait()
+        self._preview_generation += 1
+        self._preview_pool.clear()
+        self._preview_pool.waitForDone()
+
         # Accept the event and execute it's default behaviour next.
         event.accept()
 
@@ -136,7 +543,8 @@ class CurveFiltererWin(QtWidgets.QMainWindow):
 
         # Update the filter description and the filter preview widgets.
         self.update_filter_description()
-        self.update_preview()
+        self._preview_scheduler.flush()
+        self._sweep_scheduler.flush()
 
         # Accept the event and execute it's default behaviour next.
         event.accept()
@@ -150,21 +558,21 @@ class CurveFiltererWin(QtWidgets.QMainWindow):
         file_menu = self.menuBar().addMenu("File")
 
         # Create an open action in the file menu that can also be triggered by the Ctrl+O shortcut.
-        open_icon_path = os.path.join(_ICONS_PATH, "open.png")
+        open_icon_path = icon_path("open.png")
         open_action = QtWidgets.QAction(QtGui.QIcon(open_icon_path), "Open", file_menu)
         open_action.setStatusTip("Open a curve file.")
         open_action.setShortcut("Ctrl+O")
         file_menu.addAction(open_action)
         open_action.triggered.connect(self.open_curve_file)
 
-        save_icon_path = os.path.join(_ICONS_PATH, "save.png")
+        save_icon_path = icon_path("save.png")
         save_action = QtWidgets.QAction(QtGui.QIcon(save_icon_path), "Save", file_menu)
         save_action.setStatusTip("Save the smoothed curve.")
         save_action.setShortcut("Ctrl+S")
         file_menu.addAction(save_action)
         save_action.triggered.connect(self.save_curve)
 
-        close_icon_path = os.path.join(_ICONS_PATH, "close.png")
+        close_icon_path = icon_path("close.png")
         close_action = QtWidgets.QAction(
             QtGui.QIcon(close_icon_path), "Close", file_menu
         )
@@ -173,6 +581,37 @@ class CurveFiltererWin(QtWidgets.QMainWindow):
         file_menu.addAction(close_action)
         close_action.triggered.connect(self.close)
 
+    def create_status_bar(self):
+        """Create the status bar with the progress of the file loading and of the preview
+        precomputation."""
+
+        self.load_progress_bar = QtWidgets.QProgressBar()
+        self.load_progress_bar.setFormat("Loading %p%")
+        self.load_progress_bar.setFixedWidth(200)
+        self.statusBar().addPermanentWidget(self.load_progress_bar)
+
+        self.load_cancel_button = QtWidgets.QPushButton("Cancel")
+        self.load_cancel_button.setToolTip(
+            "Stop loading the curve file and keep the current curve."
+        )
+        self.statusBar().addPermanentWidget(self.load_cancel_button)
+        self.load_cancel_button.clicked.connect(self.cancel_curve_load)
+
+        # Only show them while a file is being loaded.
+        self.load_progress_bar.hide()
+        self.load_cancel_button.hide()
+
+        self.sweep_progress_bar = QtWidgets.QProgressBar()
+        self.sweep_progress_bar.setFormat("Precomputing preview %p%")
+        self.sweep_progress_bar.setToolTip(
+            "Smoothing the curve at every intensity so the slider responds instantly."
+        )
+        self.sweep_progress_bar.setFixedWidth(200)
+        self.statusBar().addPermanentWidget(self.sweep_progress_bar)
+
+        # Only show the progress bar while there is something in progress.
+        self.sweep_progress_bar.hide()
+
     def create_intensity_layout(self, parent_layout):
         """Create the intensity layout.
 
@@ -358,7 +797,9 @@ class CurveFiltererWin(QtWidgets.QMainWindow):
         self.filter_type_cb = QtWidgets.QComboBox()
         smooth_type_lay.addWidget(self.filter_type_cb)
 
-        self.filter_type_cb.addItems(_FILTERS.keys())
+        # The filters and their descriptions come from the core registry so any filter registered
+        # there shows up here too.
+        self.filter_type_cb.addItems(core.filter_names())
 
         smooth_type_right_spacer = QtWidgets.QSpacerItem(
             0, 0, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed
@@ -418,71 +859,702 @@ class CurveFiltererWin(QtWidgets.QMainWindow):
         self.filter_description_pte.setPlainText("")
 
         smooth_type = str(self.filter_type_cb.currentText())
-        if smooth_type in _FILTERS:
-            description_text = _FILTERS[smooth_type]
+        if smooth_type in core.filter_names():
+            description_text = core.get_filter(smooth_type).description
             self.filter_description_pte.setPlainText(description_text)
 
     def update_preview(self):
         """Update the curve preview by setting the raw data (the pre-filtered curve Y values), then
-        running the filtering algorithm by calling smooth_curve() which return a list of
-        filtered Y values.
+        smoothing them with the interface parameters.
 
-        :note: This can become slow if the input data is large, it's meant only as a preview,
-               if you work with a large data set it's better to have a pre-made set of Y values
-               to show the end-user a visual representation of the intensity and how each algorithm
-               treat the curve data as an alternative.
+        Results already in the preview cache are shown right away for short curves, and for any
+        curve whose RangeMinMax of the result was kept, see _PREVIEW_RANGES_MAX_ENTRIES. The others
+        are smoothed on a worker thread and shown by show_preview_result() once done. The preview
+        keeps showing the last result until then, and results of parameters changed in the
+        meantime are dropped.
         """
 
+        self._preview_generation += 1
         self.spline_preview_wid.set_raw_values(self.raw_values)
-        self.spline_preview_wid.set_filtered_values(self.smooth_curve())
-
-    def smooth_curve(self):
-        """Run the actual smoothing of the raw curve data based on the interface parameters.
 
-        :return: List of smoothed Y values.
-        :rtype: list
-        """
+        if not len(self.raw_values):
+            self.spline_preview_wid.set_filtered_values([])
+            return
 
         strength = self.intensity_slider.value() / 100.0
         smooth_type = self.filter_type_cb.currentText()
         preserve_edges = self.preserve_edges_chkb.isChecked()
 
-        if self.raw_values:
-            filtered_values = core.smooth_values(
-                self.raw_values,
-                strength=strength,
-                smooth_type=smooth_type,
-                preserve_edges=preserve_edges,
+        key = self._smooth_cache.key(
+            self._raw_values_hash,
+            len(self.raw_values),
+            strength,
+            smooth_type,
+            preserve_edges,
+        )
+        self._preview_key = key
+        filtered_ranges = self._preview_ranges.get(key)
+        is_short = len(self.raw_values) <= _PREVIEW_SYNC_MAX_VALUES
+        if key in self._smooth_cache and (is_short or filtered_ranges is not None):
+            filtered_values = self._smooth_cache.get(key)
+            # It could have been evicted by another thread in the meantime. The ranges are only
+            # valid for the values they were built from.
+            if filtered_ranges is not None and filtered_ranges.values is not filtered_values:
+                filtered_ranges = None
+            if filtered_values is not None and (is_short or filtered_ranges is not None):
+                self.spline_preview_wid.set_filtered_values(filtered_values, filtered_ranges)
+                self._preview_scheduler.record_cost(0.0)
+                self.keep_preview_ranges(key, filtered_ranges)
+                return
+
+        task = SmoothPreviewTask(
+            self._smooth_cache,
+            self.raw_values,
+            self._raw_values_hash,
+            strength,
+            smooth_type,
+            preserve_edges,
+            self._preview_generation,
+            self.is_current_preview,
+        )
+        task.signals.finished.connect(self.show_preview_result)
+        task.signals.failed.connect(self.show_preview_error)
+        self._preview_requested_at = time.perf_counter()
+        self._preview_pool.start(task)
+
+    def is_current_preview(self, generation):
+        """Return True if the given preview generation is the latest one requested. Safe to call
+        from any thread.
+
+        :rtype: bool
+        """
+
+        return generation == self._preview_generation
+
+    def show_preview_result(self, generation, filtered_values, filtered_ranges):
+        """Show the result of a preview smoothed on a worker thread, unless it's outdated.
+
+        :param generation: Generation of the preview request.
+        :type generation: int
+        :param filtered_values: Smoothed Y values.
+        :type filtered_values: numpy.ndarray
+        :param filtered_ranges: Extremes of the smoothed values, see RangeMinMax.
+        :type filtered_ranges: RangeMinMax
+        """
+
+        if self.is_current_preview(generation):
+            self.spline_preview_wid.set_filtered_values(filtered_values, filtered_ranges)
+            self._preview_scheduler.record_cost(
+                time.perf_counter() - self._preview_requested_at
             )
+            self.keep_preview_ranges(self._preview_key, filtered_ranges)
+
+    def keep_preview_ranges(self, key, filtered_ranges):
+        """Keep the RangeMinMax of a cached preview, so update_preview() shows it again right away.
+        The ranges of the results the cache evicted are dropped, they keep their values alive.
+
+        :param key: Cache key of the preview, see cache.SmoothCache.key().
+        :type key: tuple
+        :param filtered_ranges: Extremes of the smoothed values, see RangeMinMax. Nothing is kept
+                                when None.
+        :type filtered_ranges: RangeMinMax or None
+        """
+
+        for cached_key in list(self._preview_ranges):
+            if cached_key not in self._smooth_cache:
+                del self._preview_ranges[cached_key]
+
+        if filtered_ranges is None or key not in self._smooth_cache:
+            return
+
+        self._preview_ranges[key] = filtered_ranges
+        self._preview_ranges.move_to_end(key)
+        while len(self._preview_ranges) > _PREVIEW_RANGES_MAX_ENTRIES:
+            self._preview_ranges.popitem(last=False)
+
+    def show_preview_error(self, generation, message):
+        """Report a preview that failed to smooth, the last result stays on screen."""
+
+        if self.is_current_preview(generation):
+            self.statusBar().showMessage(f"Preview failed: {message}", 5000)
+
+    def start_strength_sweep(self):
+        """Smooth the raw curve at every intensity of the slider on a separate thread, with the
+        current filter parameters. smooth_values() only gives about 10 different results for the
+        whole intensity range so they all end up in the preview cache and dragging the slider only
+        looks them up. For long curves, only the results closest to the current intensity that fit
+        in the cache are done. The sweep in progress, if any, is cancelled.
+        """
+
+        self.cancel_strength_sweep()
+
+        if not len(self.raw_values):
+            return
+
+        # Start with the intensities closest to the current one, they are the next to be asked for.
+        current_value = self.intensity_slider.value()
+        slider_values = sorted(
+            range(self.intensity_slider.minimum(), self.intensity_slider.maximum() + 1),
+            key=lambda value: abs(value - current_value),
+        )
+
+        thread = StrengthSweepThread(
+            self._smooth_cache,
+            self.raw_values,
+            self._raw_values_hash,
+            [value / 100.0 for value in slider_values],
+            self.filter_type_cb.currentText(),
+            self.preserve_edges_chkb.isChecked(),
+            self,
+        )
+        thread.progress.connect(self.update_sweep_progress)
+        thread.finished.connect(lambda: self.finish_strength_sweep(thread))
+
+        self._sweep_thread = thread
+        self._sweep_threads.add(thread)
+        thread.start(QtCore.QThread.LowPriority)
 
-            return filtered_values
+    def cancel_strength_sweep(self):
+        """Cancel the preview precomputation in progress, the results already done are kept."""
 
-        return []
+        if self._sweep_thread is not None:
+            self._sweep_thread.requestInterruption()
+            self._sweep_thread = None
+
+        self.sweep_progress_bar.hide()
+
+    def update_sweep_progress(self, done, total):
+        """Show the progress of the current preview precomputation.
+
+        :param done: Number of results done.
+        :type done: int
+        :param total: Total number of results to compute.
+        :type total: int
+        """
+
+        if self.sender() is not self._sweep_thread:
+            return
+
+        self.sweep_progress_bar.setMaximum(total)
+        self.sweep_progress_bar.setValue(done)
+        self.sweep_progress_bar.setVisible(done < total)
+
+    def finish_strength_sweep(self, thread):
+        """Forget about a preview precomputation thread once it's done."""
+
+        self._sweep_threads.discard(thread)
+        if thread is self._sweep_thread:
+            self._sweep_thread = None
+            self.sweep_progress_bar.hide()
+        thread.deleteLater()
 
     def open_curve_file(self):
-        """Open a curve file and set it as the raw values to smooth."""
+        """Open a curve file and set it as the raw values to smooth.
+
+        The file is read on a separate thread, see CurveLoadThread, with its progress and a button
+        to cancel it in the status bar. The current curve stays until the new one is read, and is
+        kept if reading it fails or is cancelled.
+        """
 
         # We use QFileDialog to select the file to open. We filter out for the .crv
         # extension.
         default_path = os.path.join(os.path.dirname(__file__), "test_data")
         filepath = QtWidgets.QFileDialog.getOpenFileName(
             self, "Open", default_path, "Curve files (*.crv)"
-        )
+        )[0]
+        if not filepath:
+            return
+
+        self.load_curve_file(filepath)
+
+    def load_curve_file(self, filepath):
+        """Start reading a curve file on a separate thread, cancelling the one being read if any
+        and the preview precomputation of the current curve.
+
+        :param filepath: Path to the curve file.
+        :type filepath: str
+        """
+
+        self.cancel_curve_load()
+        # The current curve is about to be replaced, its precomputation would only fill the cache
+        # and use the CPU needed to read the file. A new one starts once the file is loaded.
+        self._sweep_scheduler.cancel()
+        self.cancel_strength_sweep()
+
+        thread = CurveLoadThread(filepath, self)
+        thread.progress.connect(self.update_load_progress)
+        thread.loaded.connect(self.finish_curve_load)
+        thread.failed.connect(self.fail_curve_load)
+        thread.finished.connect(lambda: self.forget_curve_load(thread))
+
+        self._load_thread = thread
+        self._load_threads.add(thread)
+
+        self.load_progress_bar.setRange(0, 0)
+        self.load_progress_bar.show()
+        self.load_cancel_button.show()
+        self.statusBar().showMessage(f"Loading {filepath}")
+
+        thread.start()
 
-        self.raw_values = core.read_curve_file(filepath[0])
-        self.update_preview()
+    def cancel_curve_load(self):
+        """Cancel the file being read if any, the current curve is kept."""
+
+        if self._load_thread is not None:
+            self._load_thread.requestInterruption()
+            self._load_thread = None
+            self.statusBar().showMessage("Loading cancelled", 5000)
+
+        self.load_progress_bar.hide()
+        self.load_cancel_button.hide()
+
+    def update_load_progress(self, bytes_read, file_size):
+        """Show the progress of the file being read.
+
+        :param bytes_read: Number of bytes read so far.
+        :type bytes_read: int
+        :param file_size: Size of the file in bytes.
+        :type file_size: int
+        """
+
+        if self.sender() is not self._load_thread:
+            return
+
+        # The progress bar range is an int, work in thousandths instead of bytes.
+        self.load_progress_bar.setRange(0, 1000)
+        self.load_progress_bar.setValue(int(1000 * bytes_read / max(file_size, 1)))
+
+    def finish_curve_load(self, filepath, values, values_hash):
+        """Set the values read from a file as the new curve and update the preview.
+
+        :param filepath: Path to the curve file.
+        :type filepath: str
+        :param values: Values read from the file.
+        :type values: numpy.ndarray
+        :param values_hash: Hash of the values, see cache.hash_values().
+        :type values_hash: str
+        """
+
+        if self.sender() is not self._load_thread:
+            return
+
+        self._load_thread = None
+        self.load_progress_bar.hide()
+        self.load_cancel_button.hide()
+        self.statusBar().showMessage(f"Loaded {len(values)} values from {filepath}", 5000)
+
+        self.set_raw_values(values, values_hash)
+        self._preview_scheduler.flush()
+        self._sweep_scheduler.flush()
+
+    def fail_curve_load(self, filepath, message):
+        """Report a file that couldn't be read, the current curve is kept."""
+
+        if self.sender() is not self._load_thread:
+            return
+
+        self._load_thread = None
+        self.load_progress_bar.hide()
+        self.load_cancel_button.hide()
+        self.statusBar().showMessage(f"Failed to load {filepath}: {message}")
+
+    def forget_curve_load(self, thread):
+        """Forget about a file loading thread once it's done."""
+
+        self._load_threads.discard(thread)
+        thread.deleteLater()
 
     def save_curve(self):
-        """Save the result of the smoothing operations to a curve file."""
+        """Save the result of the smoothing operations to a curve file.
 
-        filtered_values = self.smooth_curve()
+        The file is written on a separate thread, see CurveSaveThread, and the status bar reports
+        when it's done. The smoothed curve shown in the preview is reused from the preview cache.
+        """
 
         default_path = os.path.join(os.path.dirname(__file__), "test_data")
         filepath = QtWidgets.QFileDialog.getSaveFileName(
             self, "Save", default_path, "Curve files (*.crv)"
+        )[0]
+        if not filepath:
+            return
+
+        thread = CurveSaveThread(
+            filepath,
+            self._smooth_cache,
+            self.raw_values,
+            self._raw_values_hash,
+            self.intensity_slider.value() / 100.0,
+            self.filter_type_cb.currentText(),
+            self.preserve_edges_chkb.isChecked(),
+            self,
         )
+        thread.saved.connect(self.finish_curve_save)
+        thread.failed.connect(self.fail_curve_save)
+        thread.finished.connect(lambda: self.forget_curve_save(thread))
+
+        self._save_threads.add(thread)
+        self.statusBar().showMessage(f"Saving {filepath}")
+        thread.start()
 
-        core.save_curve_file(filepath[0], filtered_values)
+    def finish_curve_save(self, filepath):
+        """Report a smoothed curve saved."""
+
+        self.statusBar().showMessage(f"Saved {filepath}", 5000)
+
+    def fail_curve_save(self, filepath, message):
+        """Report a smoothed curve that couldn't be saved, the file on disk is left as it was."""
+
+        self.statusBar().showMessage(f"Failed to save {filepath}: {message}")
+
+    def forget_curve_save(self, thread):
+        """Forget about a saving thread once it's done."""
+
+        self._save_threads.discard(thread)
+        thread.deleteLater()
+
+
+class UpdateScheduler(QtCore.QObject):
+    """
+    Gather requests to run a function into a single call, at most once per interval.
+
+    The first request after a quiet period runs on the next event loop iteration, so a burst of
+    signals emitted together only runs the function once. Requests coming in while the function
+    ran less than an interval ago wait for the end of the interval. The interval follows the time
+    the function takes, as reported by record_cost(), within the given bounds.
+
+    :param callback: Function to run.
+    :type callback: callable
+    :param min_interval: Shortest interval between two calls in milliseconds, defaults to 0.0
+    :type min_interval: float, optional
+    :param max_interval: Longest interval between two calls in milliseconds, defaults to 0.0
+    :type max_interval: float, optional
+    """
+
+    # Weight of the last cost reported in the average used for the interval.
+    _COST_SMOOTHING = 0.3
+
+    def __init__(self, callback, min_interval=0.0, max_interval=0.0, parent=None):
+        super(UpdateScheduler, self).__init__(parent)
+
+        self.callback = callback
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+
+        self._cost = 0.0
+        self._last_run = 0.0
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run)
+
+    @property
+    def interval(self):
+        """Current interval between two calls, in milliseconds.
+
+        :rtype: float
+        """
+
+        return min(max(self._cost, self.min_interval), self.max_interval)
+
+    def schedule(self, *args):
+        """Request a call, unless one is already pending. Any signal arguments are ignored."""
+
+        if self._timer.isActive():
+            return
+
+        elapsed = (time.perf_counter() - self._last_run) * 1000.0
+        self._timer.start(max(int(self.interval - elapsed), 0))
+
+    def flush(self):
+        """Run the function now, replacing the pending call if there is one."""
+
+        self._timer.stop()
+        self._run()
+
+    def cancel(self):
+        """Drop the pending call if there is one."""
+
+        self._timer.stop()
+
+    def record_cost(self, seconds):
+        """Report the time a call took, including any work it started on other threads.
+
+        :param seconds: Duration of the call.
+        :type seconds: float
+        """
+
+        self._cost += (seconds * 1000.0 - self._cost) * self._COST_SMOOTHING
+
+    def _run(self):
+        self._last_run = time.perf_counter()
+        self.callback()
+
+
+class SmoothPreviewSignals(QtCore.QObject):
+    """
+    Signals of a SmoothPreviewTask, QRunnable not being a QObject it can't have its own.
+    """
+
+    # Generation of the preview request, smoothed values and their RangeMinMax.
+    finished = QtCore.Signal(int, object, object)
+
+    # Generation of the preview request and error message.
+    failed = QtCore.Signal(int, str)
+
+
+class SmoothPreviewTask(QtCore.QRunnable):
+    """
+    Smooth a curve preview on a QThreadPool worker, through the preview cache. The RangeMinMax
+    used to draw the result is built on the worker too.
+
+    The request is skipped if a newer one was made while it was waiting in the pool queue.
+    """
+
+    def __init__(
+        self,
+        smooth_cache,
+        values,
+        values_hash,
+        strength,
+        smooth_type,
+        preserve_edges,
+        generation,
+        is_current,
+    ):
+        super(SmoothPreviewTask, self).__init__()
+
+        self.signals = SmoothPreviewSignals()
+        self.smooth_cache = smooth_cache
+        self.values = values
+        self.values_hash = values_hash
+        self.strength = strength
+        self.smooth_type = smooth_type
+        self.preserve_edges = preserve_edges
+        self.generation = generation
+        self.is_current = is_current
+
+    def run(self):
+        """Smooth the curve and emit the result, or the error if it failed."""
+
+        if not self.is_current(self.generation):
+            return
+
+        try:
+            filtered_values = self.smooth_cache.smooth(
+                self.values,
+                strength=self.strength,
+                smooth_type=self.smooth_type,
+                preserve_edges=self.preserve_edges,
+                values_hash=self.values_hash,
+            )
+            filtered_ranges = RangeMinMax(filtered_values)
+        except Exception as e:
+            _log.exception(f"Failed to smooth the {self.smooth_type} preview")
+            self.signals.failed.emit(self.generation, f"{type(e).__name__}: {e}")
+            return
+
+        self.signals.finished.emit(self.generation, filtered_values, filtered_ranges)
+
+
+class CurveLoadThread(QtCore.QThread):
+    """
+    Thread reading a curve file a chunk at a time, see core.iter_curve_chunks(), and hashing its
+    values for the preview cache. Call requestInterruption() to cancel it, nothing is emitted then.
+    """
+
+    # Number of values read from the file at a time, the thread checks for cancellation in between.
+    _CHUNK_SIZE = 1 << 18
+
+    # Number of bytes read and size of the file. Sent as objects, files can be bigger than an int.
+    progress = QtCore.Signal(object, object)
+
+    # Path to the file, values read and their hash.
+    loaded = QtCore.Signal(str, object, str)
+
+    # Path to the file and error message.
+    failed = QtCore.Signal(str, str)
+
+    def __init__(self, filepath, parent=None):
+        super(CurveLoadThread, self).__init__(parent)
+
+        self.filepath = filepath
+
+    def run(self):
+        """Read the file and emit its values, or the error if it failed."""
+
+        try:
+            chunks = []
+            for chunk in core.iter_curve_chunks(
+                self.filepath, self._CHUNK_SIZE, progress=self.progress.emit
+            ):
+                if self.isInterruptionRequested():
+                    return
+                chunks.append(chunk)
+
+            values = numpy.concatenate(chunks) if chunks else numpy.empty(0)
+            values_hash = cache.hash_values(values)
+        except Exception as e:
+            _log.error(f"Failed to load {self.filepath}: {e}")
+            if not self.isInterruptionRequested():
+                self.failed.emit(self.filepath, f"{type(e).__name__}: {e}")
+            return
+
+        if not self.isInterruptionRequested():
+            self.loaded.emit(self.filepath, values, values_hash)
+
+
+class CurveSaveThread(QtCore.QThread):
+    """
+    Thread smoothing a curve through the preview cache, so the result shown in the preview is
+    reused, and saving it. The file is replaced atomically, see core.save_curve_file().
+    """
+
+    # Path to the file.
+    saved = QtCore.Signal(str)
+
+    # Path to the file and error message.
+    failed = QtCore.Signal(str, str)
+
+    def __init__(
+        self,
+        filepath,
+        smooth_cache,
+        values,
+        values_hash,
+        strength,
+        smooth_type,
+        preserve_edges,
+        parent=None,
+    ):
+        super(CurveSaveThread, self).__init__(parent)
+
+        self.filepath = filepath
+        self.smooth_cache = smooth_cache
+        self.values = values
+        self.values_hash = values_hash
+        self.strength = strength
+        self.smooth_type = smooth_type
+        self.preserve_edges = preserve_edges
+
+    def run(self):
+        """Smooth the curve, or get it from the cache, and save it."""
+
+        try:
+            filtered_values = []
+            if len(self.values):
+                filtered_values = self.smooth_cache.smooth(
+                    self.values,
+                    strength=self.strength,
+                    smooth_type=self.smooth_type,
+                    preserve_edges=self.preserve_edges,
+                    values_hash=self.values_hash,
+                )
+            core.save_curve_file(self.filepath, filtered_values, atomic=True)
+        except Exception as e:
+            _log.error(f"Failed to save {self.filepath}: {e}")
+            self.failed.emit(self.filepath, f"{type(e).__name__}: {e}")
+            return
+
+        self.saved.emit(self.filepath)
+
+
+class StrengthSweepThread(QtCore.QThread):
+    """
+    Thread filling a preview cache with the results of a curve smoothed at many strengths,
+    see cache.SmoothCache.precompute(). Call requestInterruption() to cancel it.
+    """
+
+    # Number of results done and total number of results.
+    progress = QtCore.Signal(int, int)
+
+    def __init__(
+        self,
+        smooth_cache,
+        values,
+        values_hash,
+        strengths,
+        smooth_type,
+        preserve_edges,
+        parent=None,
+    ):
+        super(StrengthSweepThread, self).__init__(parent)
+
+        self.smooth_cache = smooth_cache
+        self.values = values
+        self.values_hash = values_hash
+        self.strengths = strengths
+        self.smooth_type = smooth_type
+        self.preserve_edges = preserve_edges
+
+    def run(self):
+        """Smooth the curve at every strength not cached yet."""
+
+        try:
+            self.smooth_cache.precompute(
+                self.values,
+                self.strengths,
+                smooth_type=self.smooth_type,
+                preserve_edges=self.preserve_edges,
+                values_hash=self.values_hash,
+                progress=self.progress.emit,
+                is_cancelled=self.isInterruptionRequested,
+            )
+        except Exception:
+            _log.exception(f"Failed to precompute the {self.smooth_type} preview")
+
+
+class StartupProfiler(QtCore.QObject):
+    """
+    Time the startup steps of the interface and print them once a widget is painted for the
+    first time, see the --profile-startup command-line option.
+
+    :param imports_duration: Time spent importing the modules in seconds, defaults to 0.0
+    :type imports_duration: float, optional
+    """
+
+    def __init__(self, imports_duration=0.0, parent=None):
+        super(StartupProfiler, self).__init__(parent)
+
+        self.steps = [("imports", imports_duration)]
+        self._step_start = time.perf_counter()
+
+    def start(self):
+        """Start timing a step."""
+
+        self._step_start = time.perf_counter()
+
+    def stop(self, name):
+        """Stop timing the current step and record it under the given name."""
+
+        self.steps.append((name, time.perf_counter() - self._step_start))
+
+    def watch_first_paint(self, widget):
+        """Time the first paint of the given widget, from now on, and print the report after it.
+
+        :param widget: Widget to watch.
+        :type widget: QWidget
+        """
+
+        self.start()
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QtCore.QEvent.Paint:
+            watched.removeEventFilter(self)
+            # The event filter runs before the widget paints itself, wait until it's done.
+            QtCore.QTimer.singleShot(0, self.report)
+        return False
+
+    def report(self):
+        """Record the first paint and print every step."""
+
+        self.stop("first paint")
+
+        print("Startup profile:")
+        for name, seconds in self.steps:
+            print(f"  {name:<22} {seconds * 1000.0:>10.1f} ms")
+        total = sum(seconds for _, seconds in self.steps)
+        print(f"  {'total':<22} {total * 1000.0:>10.1f} ms")
 
 
 class QCurveIntensitySlider(QtWidgets.QSlider):
@@ -547,6 +1619,11 @@ class QCurvvePreviewer(QtWidgets.QWidget):
     """
     Widget that paint two curve. One that represent the raw pre-filtered data
     and the second that represent the curve after being filtered.
+
+    The mouse wheel zooms in and out around the cursor, dragging pans the view and double-clicking
+    shows the whole curve again. The view is fit to the height of the widget using the lowest and
+    highest raw values visible, and each curve is decimated to the width of the widget using its
+    own RangeMinMax, so redrawing doesn't depend on the number of samples.
     """
 
     def __init__(self, values=None, filtered_values=None, parent=None):
@@ -555,33 +1632,281 @@ class QCurvvePreviewer(QtWidgets.QWidget):
         self._values = values
         self._filtered_values = filtered_values
 
-    def set_raw_values(self, values):
-        """Set the raw curve values (pre-filtered) and then update the widget to re-draw it."""
+        # Line and points of each curve type, with the width they were built for. They are
+        # built once per data change or resize instead of on every paint, see curve_shapes().
+        self._shapes = {}
+
+        # The raw curve only changes when a new curve is loaded, it's drawn once in a pixmap
+        # that is copied on each paint, see raw_layer().
+        self._raw_pixmap = None
 
+        # Range of samples shown, None to show the whole curve, and the raw values extremes to
+        # fit that range to the widget height.
+        self._view = None
+        self._raw_ranges = None if values is None else RangeMinMax(values)
+        self._filtered_ranges = (
+            None if filtered_values is None else RangeMinMax(filtered_values)
+        )
+        self._pan_origin = None
+
+    def set_raw_values(self, values):
+        """Set the raw curve values (pre-filtered) and then update the widget to re-draw it. A new
+        curve is shown as a whole."""
+
+        if values is not self._values:
+            # The filtered curve is fit to the raw values, it moves along.
+            self._shapes.clear()
+            self._raw_pixmap = None
+            self._view = None
+            self._raw_ranges = None if values is None else RangeMinMax(values)
         self._values = values
         self.update()
 
-    def set_filtered_values(self, filtered_values):
-        """Set the filtered curve values and then update the widget to re-draw it."""
+    def view(self):
+        """Return the range of samples shown.
+
+        :return: Index of the first sample shown and the index after the last one, as floats.
+        :rtype: tuple(float, float)
+        """
+
+        if self._view is None:
+            return 0.0, float(len(self._values) if self._values is not None else 0)
+        return self._view
+
+    def set_view(self, start, stop):
+        """Show the given range of samples, limited to the curve and to a few samples at least.
+
+        :param start: Index of the first sample to show.
+        :type start: float
+        :param stop: Index after the last sample to show.
+        :type stop: float
+        """
+
+        values_count = len(self._values) if self._values is not None else 0
+        span = min(max(stop - start, _VIEW_MIN_SAMPLES), values_count)
+        start = min(max(start, 0.0), values_count - span)
+
+        view = (start, start + span)
+        if view == (0.0, float(values_count)):
+            view = None
+        if view == self._view:
+            return
+
+        self._view = view
+        self._shapes.clear()
+        self._raw_pixmap = None
+        self.update()
+
+    def reset_view(self):
+        """Show the whole curve."""
+
+        self.set_view(0.0, float(len(self._values) if self._values is not None else 0))
+
+    def view_transform(self, values_count):
+        """Return how a curve of the given size maps to the widget in the current view.
+
+        :return: First and last indices to draw, the index at the left edge, the distance between two
+                 samples in pixels, the raw value at the top margin and the pixels per value unit.
+        :rtype: tuple(int, int, float, float, float, float)
+        """
+
+        start, stop = self.view()
+        if self._values is not None and values_count != len(self._values):
+            start, stop = 0.0, float(values_count)
+
+        # Calculate the spacing based on the width of the QCurvvePreviewer parent widget.
+        # This ensure that even if parent widget change size we still draw the whole curve
+        # albeit with a lower or higher spacing between points.
+        x_spacing = self.parent().width() / float(stop - start + 1)
+
+        # Draw one more sample on each side so the line goes all the way to the edges.
+        first = max(int(start) - 1, 0)
+        last = min(int(numpy.ceil(stop)) + 1, values_count)
+
+        low, high = numpy.nan, numpy.nan
+        if self._raw_ranges is not None:
+            low, high = self._raw_ranges.query(first, last)
+        if numpy.isnan(low):
+            low, high = 0.0, 0.0
+
+        # Higher values are drawn lower in the widget, like before the preview was fit to its height.
+        height = max(self.height() - 2.0 * _CURVE_Y_MARGIN, 1.0)
+        if high > low:
+            y_scale = height / (high - low)
+            y_origin = low - _CURVE_Y_MARGIN / y_scale
+        else:
+            y_scale = 1.0
+            y_origin = low - self.height() / 2.0
+
+        return first, last, start, x_spacing, y_origin, y_scale
+
+    def wheelEvent(self, event):
+        """Zoom in or out around the mouse cursor."""
+
+        if self._values is None or len(self._values) < 3:
+            return
+
+        start, stop = self.view()
+        x_spacing = self.parent().width() / float(stop - start + 1)
+        anchor = start + (event.pos().x() - 2.0) / x_spacing
+        zoom = _VIEW_ZOOM_STEP ** (event.angleDelta().y() / 120.0)
+
+        self.set_view(anchor - (anchor - start) * zoom, anchor + (stop - anchor) * zoom)
+        event.accept()
+
+    def mousePressEvent(self, event):
+        """Start panning the view."""
+
+        if event.button() == QtCore.Qt.LeftButton:
+            self._pan_origin = (event.pos().x(), self.view())
+        super(QCurvvePreviewer, self).mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """Pan the view along with the mouse cursor."""
+
+        if self._pan_origin is not None:
+            origin_x, (start, stop) = self._pan_origin
+            x_spacing = self.parent().width() / float(stop - start + 1)
+            offset = (event.pos().x() - origin_x) / x_spacing
+            self.set_view(start - offset, stop - offset)
+        super(QCurvvePreviewer, self).mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """Stop panning the view."""
+
+        self._pan_origin = None
+        super(QCurvvePreviewer, self).mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        """Show the whole curve again."""
 
+        self.reset_view()
+        super(QCurvvePreviewer, self).mouseDoubleClickEvent(event)
+
+    def set_filtered_values(self, filtered_values, filtered_ranges=None):
+        """Set the filtered curve values and then update the widget to re-draw it. The previous
+        ones stay on screen until this is called, so the preview keeps showing the last result while
+        the next one is being smoothed.
+
+        :param filtered_values: Smoothed Y values.
+        :type filtered_values: numpy.ndarray
+        :param filtered_ranges: Extremes of the smoothed values, built here when not given,
+                                see RangeMinMax, defaults to None
+        :type filtered_ranges: RangeMinMax, optional
+        """
+
+        if filtered_values is not self._filtered_values:
+            self._shapes.pop("filtered", None)
+            if filtered_ranges is None and filtered_values is not None:
+                filtered_ranges = RangeMinMax(filtered_values)
+            self._filtered_ranges = filtered_ranges
         self._filtered_values = filtered_values
         self.update()
 
+    def resizeEvent(self, event):
+        """Build the curves again for the new width next time they are drawn."""
+
+        self._shapes.clear()
+        self._raw_pixmap = None
+        super(QCurvvePreviewer, self).resizeEvent(event)
+
+    def raw_layer(self):
+        """Return a pixmap of the widget size with the raw curve drawn on a transparent background.
+        It's only drawn again after the raw values change or the widget is resized, and matches
+        the device pixel ratio of the screen so it stays sharp on high DPI screens.
+
+        :rtype: QPixmap
+        """
+
+        pixel_ratio = self.devicePixelRatioF()
+        if (
+            self._raw_pixmap is not None
+            and self._raw_pixmap.devicePixelRatio() == pixel_ratio
+        ):
+            return self._raw_pixmap
+
+        self._raw_pixmap = QtGui.QPixmap(
+            max(int(self.width() * pixel_ratio), 1),
+            max(int(self.height() * pixel_ratio), 1),
+        )
+        self._raw_pixmap.setDevicePixelRatio(pixel_ratio)
+        self._raw_pixmap.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter()
+        painter.begin(self._raw_pixmap)
+        painter.setRenderHints(QtGui.QPainter.Antialiasing, True)
+        self.draw_curve(painter, self._values)
+        painter.end()
+
+        return self._raw_pixmap
+
     def paintEvent(self, event):
         """
-        call the draw_curve() function twice. The first time with the raw Y coordinates, and second
-        time as a filtered one with the filtered values.
+        Copy the raw curve from its pixmap, see raw_layer(), then call the draw_curve() function
+        with the filtered values.
         """
 
         painter = QtGui.QPainter()
         painter.begin(self)
         painter.setRenderHints(QtGui.QPainter.Antialiasing, True)
-        self.draw_curve(painter, self._values)
-        self.draw_curve(painter, self._filtered_values, "filtered")
+        # Either can still be missing while the first preview is being smoothed.
+        if self._values is not None:
+            painter.drawPixmap(0, 0, self.raw_layer())
+        if self._filtered_values is not None:
+            self.draw_curve(painter, self._filtered_values, "filtered")
         painter.end()
 
+    def curve_shapes(self, y_values, crv_type="raw"):
+        """Return the line and the points of the visible part of a curve in widget coordinates,
+        see view_transform(), decimated down to the lowest and highest sample of each pixel column,
+        see RangeMinMax.decimate(). They are only built again when the values, the view or the size
+        of the widget change.
+
+        :param y_values: List of the curve Y coordinates.
+        :type y_values: list of floats
+        :param crv_type: Type of curve (raw or filtered), defaults to "raw"
+        :type crv_type: str, optional
+        :return: The curve line and the path of its points, None if they are too close to be drawn.
+        :rtype: tuple(QPolygonF, QPainterPath)
+        """
+
+        width = self.parent().width()
+
+        shapes = self._shapes.get(crv_type)
+        if shapes is not None and shapes[0] == width:
+            return shapes[1], shapes[2]
+
+        y_array = numpy.asarray(y_values, dtype=float)
+        first, last, start, x_spacing, y_origin, y_scale = self.view_transform(
+            len(y_array)
+        )
+
+        # With more samples than pixel columns only the lowest and highest sample of each
+        # column show up, the line through them looks the same as the line through all of them.
+        ranges = self._raw_ranges if crv_type == "raw" else self._filtered_ranges
+        if ranges is not None and ranges.values is y_array:
+            indices = ranges.decimate(first, last, x_spacing)
+        else:
+            indices = first + decimate_min_max(y_array[first:last], x_spacing)
+        x_array = 2.0 + (indices - start) * x_spacing
+        y_array = (y_array[indices] - y_origin) * y_scale
+        points = list(zip(x_array.tolist(), y_array.tolist()))
+
+        line = QtGui.QPolygonF([QtCore.QPointF(x, y) for x, y in points])
+
+        markers = None
+        if x_spacing >= _CURVE_PT_MIN_SPACING:
+            markers = QtGui.QPainterPath()
+            radius = _CURVE_PT_SIZE / 2.0
+            for x, y in points:
+                markers.addEllipse(x - radius, y - radius, _CURVE_PT_SIZE, _CURVE_PT_SIZE)
+
+        self._shapes[crv_type] = (width, line, markers)
+        return line, markers
+
     def draw_curve(self, painter, y_values, crv_type="raw"):
-        """Draw a curve based on the given values.
+        """Draw a curve based on the given values, as a single line and a single path for all
+        its points, see curve_shapes().
 
         :param painter: QPainter instance to use.
         :type painter: QPainter
@@ -603,42 +1928,37 @@ class QCurvvePreviewer(QtWidgets.QWidget):
                 point_brush = _CURVE_SM_PT_BRUSH
                 line_pen = _CURVE_SM_LINE_PEN
 
-            # Calculate the spacing based on the width of the QCurvvePreviewer parent widget.
-            # This ensure that even if parent widget change size we still draw the whole curve
-            # albeit with a lower or higher spacing between points.
-            # In our case the values we pass on to this draw_curve() functions are only on the Y
-            # axis since. You can however extend it to work with both axis if needed. The spacing
-            # below replace the X coordinate.
-            x_spacing = self.parent().width() / float(len(y_values) + 1)
-
-            # Draw the first point
-            prev_y = y_values[0]
-            prev_x = 2
+            line, markers = self.curve_shapes(y_values, crv_type)
 
-            painter.setPen(point_pen)
-            painter.setBrush(point_brush)
-            painter.drawEllipse(prev_x - 2, prev_y - 2, 4, 4)
-
-            # Draw the remaining points
-            for y in y_values[1:]:
-                x = prev_x + x_spacing
-                painter.setPen(line_pen)
-                painter.drawLine(prev_x, prev_y, x, y)
+            painter.setPen(line_pen)
+            painter.setBrush(QtCore.Qt.NoBrush)
+            painter.drawPolyline(line)
 
+            if markers is not None:
                 painter.setPen(point_pen)
-                painter.drawEllipse(x - 2, y - 2, 4, 4)
-
-                prev_y = y
-                prev_x = x
+                painter.setBrush(point_brush)
+                painter.drawPath(markers)
 
 
 if __name__ == "__main__":
 
-    app = QtWidgets.QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Curve Filterer interface.")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print the time spent importing the modules, applying the theme, building the window "
+        "and painting it for the first time.",
+    )
+    # Everything else goes to Qt.
+    args, qt_args = parser.parse_known_args()
+
+    profiler = StartupProfiler(_IMPORTS_DURATION) if args.profile_startup else None
+
+    app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
 
     # Create a pixmap with our splash-screen iamge.
     pixmap = QtGui.QPixmap()
-    pixmap.load(os.path.join(_ICONS_PATH, "splash.png"))
+    pixmap.load(icon_path("splash.png"))
 
     # Create a slpash screen and brign it on top of other windows.
     splash = QtWidgets.QSplashScreen(pixmap)
@@ -660,10 +1980,19 @@ if __name__ == "__main__":
     app.processEvents()
 
     # Apply our theme to the whole application.
+    if profiler:
+        profiler.start()
     theme.apply_theme(app)
+    if profiler:
+        profiler.stop("theme.apply_theme")
 
     # Initialize and show the QMainWindow.
+    if profiler:
+        profiler.start()
     window = CurveFiltererWin()
+    if profiler:
+        profiler.stop("window construction")
+        profiler.watch_first_paint(window.spline_preview_wid)
     window.show()
 
     # Close the splash-screen once the QMainWindow show event is done.